@@ -0,0 +1,205 @@
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+import argparse
+
+from custom_questions import normalize_question
+
+
+def context_hash(context):
+    """Short hash of the candidate context the AI answered from"""
+    return hashlib.sha1((context or '').encode('utf-8')).hexdigest()[:16]
+
+
+def option_texts(options):
+    """Normalized option texts; choice options come as (index, text) tuples"""
+    texts = []
+    for option in options or []:
+        text = option[1] if isinstance(option, (tuple, list)) else option
+        texts.append(normalize_question(text))
+    return texts
+
+
+def answer_key(question_text, response_type, options=None, context=''):
+    """Cache key of one question: normalized text, response type, option set and context hash"""
+    parts = [normalize_question(question_text), response_type, '\x1f'.join(option_texts(options)),
+             context_hash(context)]
+    return hashlib.sha1('\x1e'.join(parts).encode('utf-8')).hexdigest()
+
+
+class AnswerCache:
+    """SQLite cache of AI answers to form questions, shared by bot processes.
+
+    An answer is reused for the same normalized question, response type and
+    option set asked with the same candidate context, so editing the resume
+    or the config's answers naturally misses the old entries. Entries expire
+    after ``ttl_days`` and the least recently used ones are evicted beyond
+    ``max_entries``; pinned entries are never expired or evicted. The
+    database runs in WAL mode and every write is a single statement or
+    transaction, so several bots can share one file; within a process a lock
+    lets the AI worker threads share the connection. ``hits``, ``misses`` and
+    the API time the hits saved are counted for the run summary.
+    """
+
+    def __init__(self, path, ttl_days=30, max_entries=5000):
+        self.path = path
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.seconds_saved = 0.0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            " key TEXT PRIMARY KEY,"
+            " question TEXT NOT NULL,"
+            " response_type TEXT NOT NULL,"
+            " options TEXT NOT NULL,"
+            " context_hash TEXT NOT NULL,"
+            " answer TEXT NOT NULL,"
+            " latency REAL NOT NULL DEFAULT 0,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " uses INTEGER NOT NULL DEFAULT 0,"
+            " pinned INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS answers_last_used ON answers (pinned, last_used)")
+        self._conn.commit()
+
+    def _fresh(self, created_at, pinned, now):
+        return pinned or now - created_at < self.ttl_seconds
+
+    def get(self, question_text, response_type, options=None, context='', now=None):
+        """The cached answer, or None if unknown or expired"""
+        now = now or time.time()
+        key = answer_key(question_text, response_type, options, context)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT answer, latency, created_at, pinned FROM answers WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or not self._fresh(row[2], row[3], now):
+                self.misses += 1
+                return None
+            with self._conn:
+                self._conn.execute("UPDATE answers SET last_used = ?, uses = uses + 1 WHERE key = ?", (now, key))
+            self.hits += 1
+            self.seconds_saved += row[1]
+        return json.loads(row[0])
+
+    def put(self, question_text, response_type, answer, options=None, context='', latency=0.0, now=None):
+        """Store an answer the API took ``latency`` seconds to produce; pinned entries keep their answer"""
+        if answer is None:
+            return
+        now = now or time.time()
+        key = answer_key(question_text, response_type, options, context)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO answers (key, question, response_type, options, context_hash, answer, latency,"
+                " created_at, last_used) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+                " ON CONFLICT(key) DO UPDATE SET answer = excluded.answer, latency = excluded.latency,"
+                " created_at = excluded.created_at, last_used = excluded.last_used WHERE pinned = 0",
+                (key, normalize_question(question_text), response_type, json.dumps(option_texts(options)),
+                 context_hash(context), json.dumps(answer), latency, now, now)
+            )
+            self._evict()
+
+    def _evict(self):
+        self._conn.execute(
+            "DELETE FROM answers WHERE pinned = 0 AND key IN ("
+            " SELECT key FROM answers WHERE pinned = 0 ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+
+    def purge(self, now=None):
+        """Delete expired entries; returns how many were removed"""
+        with self._conn:
+            return self._conn.execute(
+                "DELETE FROM answers WHERE pinned = 0 AND created_at < ?",
+                ((now or time.time()) - self.ttl_seconds,)
+            ).rowcount
+
+    def entries(self, search=None, limit=50):
+        """(key, question, response_type, answer, uses, pinned) rows, most recently used first"""
+        query = "SELECT key, question, response_type, answer, uses, pinned FROM answers"
+        params = []
+        if search:
+            query += " WHERE question LIKE ?"
+            params.append(f"%{normalize_question(search)}%")
+        query += " ORDER BY last_used DESC LIMIT ?"
+        params.append(limit)
+        return [(key, question, response_type, json.loads(answer), uses, bool(pinned))
+                for key, question, response_type, answer, uses, pinned in self._conn.execute(query, params)]
+
+    def _resolve(self, key_prefix):
+        keys = [row[0] for row in self._conn.execute(
+            "SELECT key FROM answers WHERE key LIKE ? LIMIT 2", (key_prefix + '%',))]
+        if len(keys) != 1:
+            raise KeyError(f"{'No' if not keys else 'More than one'} entry matches key {key_prefix!r}")
+        return keys[0]
+
+    def pin(self, key_prefix, answer=None, pinned=True):
+        """Pin (or unpin) the entry whose key starts with ``key_prefix``, optionally replacing its answer"""
+        key = self._resolve(key_prefix)
+        with self._conn:
+            if answer is not None:
+                self._conn.execute("UPDATE answers SET answer = ? WHERE key = ?", (json.dumps(answer), key))
+            self._conn.execute("UPDATE answers SET pinned = ? WHERE key = ?", (int(pinned), key))
+        return key
+
+    def delete(self, key_prefix):
+        key = self._resolve(key_prefix)
+        with self._conn:
+            self._conn.execute("DELETE FROM answers WHERE key = ?", (key,))
+        return key
+
+    def stats(self):
+        count, pinned = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(pinned), 0) FROM answers"
+        ).fetchone()
+        return count, pinned
+
+    def summary(self):
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0.0
+        return (f"AI answer cache: {self.hits} hits, {self.misses} misses, {rate:.0f}% hit rate, "
+                f"{self.seconds_saved:.1f}s of API calls saved")
+
+    def close(self):
+        self._conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Inspect, pin or purge the shared AI answer cache")
+    parser.add_argument('cache', nargs='?', default='ai_answers.db')
+    parser.add_argument('--ttl-days', type=float, default=30)
+    parser.add_argument('--list', nargs='?', const='', metavar='TEXT', help='List entries, optionally matching TEXT')
+    parser.add_argument('--pin', metavar='KEY', help='Pin the entry whose key starts with KEY')
+    parser.add_argument('--unpin', metavar='KEY', help='Unpin the entry whose key starts with KEY')
+    parser.add_argument('--answer', help='With --pin: replace the answer (JSON, e.g. 3 or "\\"Yes\\"")')
+    parser.add_argument('--delete', metavar='KEY', help='Delete the entry whose key starts with KEY')
+    parser.add_argument('--purge', action='store_true', help='Delete expired entries')
+    args = parser.parse_args()
+
+    cache = AnswerCache(args.cache, ttl_days=args.ttl_days)
+    try:
+        if args.pin:
+            answer = json.loads(args.answer) if args.answer is not None else None
+            print(f"Pinned {cache.pin(args.pin, answer)}")
+        if args.unpin:
+            print(f"Unpinned {cache.pin(args.unpin, pinned=False)}")
+        if args.delete:
+            print(f"Deleted {cache.delete(args.delete)}")
+    except KeyError as e:
+        print(e.args[0])
+    if args.purge:
+        print(f"Removed {cache.purge()} expired entries")
+    if args.list is not None:
+        for key, question, response_type, answer, uses, pinned in cache.entries(args.list or None):
+            print(f"{key[:10]} {'*' if pinned else ' '} [{response_type}] {question[:60]!r} -> {answer!r} ({uses} uses)")
+    count, pinned = cache.stats()
+    print(f"{count} answers cached, {pinned} pinned")
+    cache.close()
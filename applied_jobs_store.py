@@ -0,0 +1,215 @@
+import os
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from job_ids import clean_job_link, extract_job_id
+from persistence import atomic_write_json
+
+
+def load_legacy_applied_jobs(path):
+    """Read an applied jobs JSON file in any of the historical formats.
+
+    Supported layouts:
+    - ["https://.../jobs/view/1/", ...]                (oldest, no dates)
+    - [{"url": "...", "applied_date": "..."}, ...]     (current)
+    - {"https://.../jobs/view/1/": "...", ...}         (plain mapping)
+
+    Returns a dict mapping the cleaned job URL to its ISO applied date.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        applied_data = json.load(f)
+
+    if not applied_data:
+        return {}
+    if isinstance(applied_data, dict):
+        return {clean_job_link(url): applied_date for url, applied_date in applied_data.items() if url}
+    if isinstance(applied_data[0], str):
+        # Old format had no dates, treat every entry as applied now
+        current_time = datetime.now().isoformat()
+        return {clean_job_link(url): current_time for url in applied_data if url}
+    return {
+        clean_job_link(item['url']): item['applied_date']
+        for item in applied_data if isinstance(item, dict) and item.get('url')
+    }
+
+
+class AppliedJobsStore(ABC):
+    """Interface for applied job records keyed by cleaned job URL.
+
+    Lookups also resolve by the numeric LinkedIn job ID, so the same posting
+    reached through a differently shaped URL is still recognised.
+    """
+
+    @abstractmethod
+    def get(self, job_link):
+        """Return the ISO applied date for a job link, or None"""
+
+    @abstractmethod
+    def add(self, job_link, applied_date):
+        """Record an application to ``job_link`` made at ``applied_date``"""
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.flush()
+
+    def __contains__(self, job_link):
+        return self.get(job_link) is not None
+
+    @abstractmethod
+    def __len__(self):
+        pass
+
+
+class MemoryAppliedJobsStore(AppliedJobsStore):
+    """Records held in memory only; used when the configured store cannot be opened"""
+
+    def __init__(self, records=None):
+        self._by_url = {}
+        self._by_job_id = {}
+        for url, applied_date in (records or {}).items():
+            self._remember(url, applied_date)
+
+    def _remember(self, job_link, applied_date):
+        clean_link = clean_job_link(job_link)
+        self._by_url[clean_link] = applied_date
+        job_id = extract_job_id(clean_link)
+        if job_id is not None:
+            self._by_job_id[job_id] = clean_link
+
+    def get(self, job_link):
+        clean_link = clean_job_link(job_link)
+        if clean_link in self._by_url:
+            return self._by_url[clean_link]
+        job_id = extract_job_id(job_link)
+        if job_id is not None and job_id in self._by_job_id:
+            return self._by_url[self._by_job_id[job_id]]
+        return None
+
+    def add(self, job_link, applied_date):
+        self._remember(job_link, applied_date)
+
+    def __len__(self):
+        return len(self._by_url)
+
+
+class JsonAppliedJobsStore(MemoryAppliedJobsStore):
+    """Legacy backend that keeps every record in one JSON file.
+
+    Records are held in memory and the whole file is rewritten on flush, so
+    inserts stay O(1) but persisting grows with the number of records. The file
+    is replaced atomically to avoid corruption if the bot dies mid-write, and
+    with a ``WriteBehindWriter`` the rewrite happens off the calling thread.
+    """
+
+    def __init__(self, path, writer=None):
+        self.path = path
+        self.writer = writer
+        super().__init__(load_legacy_applied_jobs(path))
+
+    def add(self, job_link, applied_date):
+        super().add(job_link, applied_date)
+        self.flush()
+
+    def flush(self):
+        applied_list = [
+            {"url": url, "applied_date": applied_date}
+            for url, applied_date in self._by_url.items()
+        ]
+        if self.writer:
+            self.writer.write_json(self.path, applied_list)
+        else:
+            atomic_write_json(self.path, applied_list)
+
+
+class SqliteAppliedJobsStore(AppliedJobsStore):
+    """SQLite backend in WAL mode with indexed lookups by URL and job ID.
+
+    Each insert is a single-row upsert, so the cost of recording an application
+    no longer depends on how many applications are already stored. A legacy
+    JSON file, if present, is imported on open and re-imported whenever it
+    changes so the two never silently diverge.
+    """
+
+    def __init__(self, path, legacy_json_path=None):
+        self.path = path
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS applied_jobs ("
+            " url TEXT PRIMARY KEY,"
+            " job_id INTEGER,"
+            " applied_date TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS applied_jobs_job_id ON applied_jobs (job_id)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+        if legacy_json_path:
+            self._migrate_legacy_json(legacy_json_path)
+
+    def _migrate_legacy_json(self, legacy_json_path):
+        if not os.path.exists(legacy_json_path):
+            return
+        legacy_mtime = str(os.path.getmtime(legacy_json_path))
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'legacy_json_mtime'").fetchone()
+        if row and row[0] == legacy_mtime:
+            return
+
+        legacy_records = load_legacy_applied_jobs(legacy_json_path)
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO applied_jobs (url, job_id, applied_date) VALUES (?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET applied_date = max(applied_date, excluded.applied_date)",
+                ((url, extract_job_id(url), applied_date) for url, applied_date in legacy_records.items())
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_json_mtime', ?)", (legacy_mtime,)
+            )
+        print(f"Imported {len(legacy_records)} applied job records from {legacy_json_path}")
+
+    def get(self, job_link):
+        clean_link = clean_job_link(job_link)
+        row = self._conn.execute(
+            "SELECT applied_date FROM applied_jobs WHERE url = ?", (clean_link,)
+        ).fetchone()
+        if row:
+            return row[0]
+        job_id = extract_job_id(job_link)
+        if job_id is None:
+            return None
+        row = self._conn.execute(
+            "SELECT applied_date FROM applied_jobs WHERE job_id = ? ORDER BY applied_date DESC LIMIT 1", (job_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def add(self, job_link, applied_date):
+        clean_link = clean_job_link(job_link)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO applied_jobs (url, job_id, applied_date) VALUES (?, ?, ?)",
+                (clean_link, extract_job_id(clean_link), applied_date)
+            )
+
+    def close(self):
+        self._conn.close()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM applied_jobs").fetchone()[0]
+
+
+def open_applied_jobs_store(applied_jobs_file, backend='sqlite', writer=None):
+    """Open the applied jobs store configured for ``appliedJobsFile``.
+
+    The sqlite backend lives next to the JSON file (``applied_jobs.db`` for
+    ``applied_jobs.json``) and migrates the JSON records into itself.
+    """
+    if backend == 'json':
+        return JsonAppliedJobsStore(applied_jobs_file, writer=writer)
+    db_path = os.path.splitext(applied_jobs_file)[0] + '.db'
+    return SqliteAppliedJobsStore(db_path, legacy_json_path=applied_jobs_file)
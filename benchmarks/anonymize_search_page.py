@@ -0,0 +1,147 @@
+"""Turn a saved LinkedIn job search results page into an anonymized benchmark fixture.
+
+Usage: python benchmarks/anonymize_search_page.py SAVED.html [--out benchmarks/fixtures/search_results_saved.html]
+
+Save a results page from a logged-in browser ("Save page as", HTML only),
+after scrolling the list so every tile is rendered. The output keeps the
+page's element structure, class names and job IDs, which is what
+bench_job_tiles.py measures against, and drops everything that identifies the
+account or the postings:
+- <script>, <style>, <noscript>, <svg>, <iframe> and <link> elements
+- tracking and personalization attributes (data-* other than the job ID
+  attributes, srcset, src, aria-label, title, alt) and URL query strings
+- all visible text, replaced by numbered placeholders, except the UI labels
+  the bot's selectors look for ('is hiring for this', 'Easy Apply', ...)
+
+The <ul> holding the job tiles gets the ``fixture-results-ul`` class the
+benchmark looks for.
+"""
+import os
+import re
+import sys
+import argparse
+from html import escape
+from html.parser import HTMLParser
+
+DEFAULT_OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'search_results_saved.html')
+LIST_CLASS = 'fixture-results-ul'
+DROPPED_ELEMENTS = {'script', 'style', 'noscript', 'svg', 'iframe', 'link', 'template'}
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'meta', 'param', 'source', 'track', 'wbr'}
+KEPT_DATA_ATTRIBUTES = {'data-occludable-job-id', 'data-job-id'}
+DROPPED_ATTRIBUTES = {'srcset', 'src', 'aria-label', 'title', 'alt', 'style', 'nonce'}
+# Text the bot's selectors or filters match on; everything else is replaced
+KEPT_LABELS = ('is hiring for this', 'easy apply', 'applied', 'promoted', 'viewed', 'actively recruiting',
+               'reposted', 'ago', 'applicants', 'on-site', 'remote', 'hybrid')
+
+
+class _Anonymizer(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.out = []
+        self.skip_depth = 0
+        self.placeholders = {}
+        self.tiles = 0
+        self._open_uls = []  # output index of each open <ul> start tag
+
+    def _placeholder(self, text):
+        if text not in self.placeholders:
+            self.placeholders[text] = f"Text {len(self.placeholders) + 1}"
+        return self.placeholders[text]
+
+    def _attributes(self, tag, attrs):
+        kept = []
+        for name, value in attrs:
+            if name in DROPPED_ATTRIBUTES or (name.startswith('data-') and name not in KEPT_DATA_ATTRIBUTES):
+                continue
+            if name == 'href' and value:
+                value = value.split('?')[0]
+            if name == 'id' and value and re.search(r'\d', value):
+                continue
+            kept.append((name, value))
+        return kept
+
+    def handle_starttag(self, tag, attrs):
+        if self.skip_depth or tag in DROPPED_ELEMENTS:
+            if tag not in VOID_ELEMENTS:
+                self.skip_depth += 1
+            return
+        if tag == 'li' and any(name == 'data-occludable-job-id' for name, _ in attrs) and self._open_uls:
+            self.tiles += 1
+            index = self._open_uls[-1]
+            if LIST_CLASS not in self.out[index]:
+                if 'class=' in self.out[index]:
+                    self.out[index] = self.out[index].replace('class="', f'class="{LIST_CLASS} ', 1)
+                else:
+                    self.out[index] = self.out[index].replace('<ul', f'<ul class="{LIST_CLASS}"', 1)
+        rendered = ''.join(
+            f' {name}' if value is None else f' {name}="{escape(value, quote=True)}"'
+            for name, value in self._attributes(tag, attrs)
+        )
+        self.out.append(f'<{tag}{rendered}>')
+        if tag == 'ul':
+            self._open_uls.append(len(self.out) - 1)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS and not self.skip_depth and tag not in DROPPED_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if self.skip_depth:
+            if tag not in VOID_ELEMENTS:
+                self.skip_depth -= 1
+            return
+        if tag in VOID_ELEMENTS:
+            return
+        if tag == 'ul' and self._open_uls:
+            self._open_uls.pop()
+        self.out.append(f'</{tag}>')
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        text = data.strip()
+        if not text:
+            self.out.append(data)
+            return
+        lowered = text.lower()
+        kept = next((label for label in KEPT_LABELS if label in lowered), None)
+        if kept == 'is hiring for this':
+            replacement = f"{self._placeholder(text.split(' is hiring')[0])} is hiring for this"
+        elif kept and len(text) <= 40:
+            replacement = text
+        else:
+            replacement = self._placeholder(text)
+        self.out.append(escape(replacement, quote=False))
+
+    def handle_decl(self, decl):
+        self.out.append(f'<!{decl}>')
+
+
+def anonymize(html):
+    """(anonymized html, number of job tiles found)"""
+    parser = _Anonymizer()
+    parser.feed(html)
+    parser.close()
+    return ''.join(parser.out), parser.tiles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('saved_page')
+    parser.add_argument('--out', default=DEFAULT_OUT)
+    args = parser.parse_args()
+
+    with open(args.saved_page, 'r', encoding='utf-8') as f:
+        html, tiles = anonymize(f.read())
+    if not tiles:
+        sys.exit("No <li data-occludable-job-id> tiles found; scroll the results list before saving the page")
+    header = ("<!-- Saved LinkedIn job search results page, anonymized by "
+              "benchmarks/anonymize_search_page.py -->\n")
+    with open(args.out, 'w', encoding='utf-8') as f:
+        f.write(header + html)
+    print(f"Wrote {args.out} ({len(html) // 1024} KB, {tiles} tiles)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""Compare applied-jobs persistence costs: legacy full JSON rewrite vs. the stores.
+
+Usage: python benchmarks/bench_applied_jobs_store.py [--sizes 10000 100000] [--inserts 20]
+
+For each size the store is pre-filled with that many records, then the cost
+of recording one more application (insert + persist) and of looking a job up
+is measured.
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from applied_jobs_store import JsonAppliedJobsStore, SqliteAppliedJobsStore  # noqa: E402
+
+
+def job_url(job_id):
+    return f"https://www.linkedin.com/jobs/view/{job_id}/"
+
+
+def legacy_save(path, applied_jobs):
+    # Mirrors the original LinkedinEasyApply.save_applied_jobs
+    applied_list = [{"url": url, "applied_date": date} for url, date in applied_jobs.items()]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(applied_list, f, ensure_ascii=False, indent=2)
+
+
+def write_seed_json(path, size, now):
+    legacy_save(path, {job_url(3000000000 + i): now for i in range(size)})
+
+
+def bench_legacy(workdir, size, inserts, lookups, now):
+    path = os.path.join(workdir, 'legacy.json')
+    applied_jobs = {job_url(3000000000 + i): now for i in range(size)}
+
+    start = time.perf_counter()
+    for i in range(inserts):
+        applied_jobs[job_url(4000000000 + i)] = now
+        legacy_save(path, applied_jobs)
+    insert_time = (time.perf_counter() - start) / inserts
+
+    start = time.perf_counter()
+    for job_id in lookups:
+        job_url(job_id).split('?')[0] in applied_jobs
+    lookup_time = (time.perf_counter() - start) / len(lookups)
+    return insert_time, lookup_time
+
+
+def bench_store(store, inserts, lookups, now):
+    start = time.perf_counter()
+    for i in range(inserts):
+        store.add(job_url(4000000000 + i) + "?refId=abc", now)
+    insert_time = (time.perf_counter() - start) / inserts
+
+    start = time.perf_counter()
+    for job_id in lookups:
+        store.get(job_url(job_id))
+    lookup_time = (time.perf_counter() - start) / len(lookups)
+    return insert_time, lookup_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--inserts', type=int, default=20)
+    parser.add_argument('--lookups', type=int, default=5000)
+    args = parser.parse_args()
+
+    now = "2026-01-01T00:00:00"
+    print(f"{'size':>8} {'backend':<10} {'insert+persist (ms)':>20} {'lookup (us)':>12}")
+    for size in args.sizes:
+        lookups = [3000000000 + random.randrange(size) for _ in range(args.lookups)]
+        with tempfile.TemporaryDirectory() as workdir:
+            results = {'legacy': bench_legacy(workdir, size, args.inserts, lookups, now)}
+
+            seed = os.path.join(workdir, 'seed.json')
+            write_seed_json(seed, size, now)
+            json_store = JsonAppliedJobsStore(seed)
+            results['json'] = bench_store(json_store, args.inserts, lookups, now)
+
+            write_seed_json(seed, size, now)
+            sqlite_store = SqliteAppliedJobsStore(os.path.join(workdir, 'applied.db'), legacy_json_path=seed)
+            results['sqlite'] = bench_store(sqlite_store, args.inserts, lookups, now)
+            sqlite_store.close()
+
+        for backend, (insert_time, lookup_time) in results.items():
+            print(f"{size:>8} {backend:<10} {insert_time * 1000:>20.3f} {lookup_time * 1e6:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
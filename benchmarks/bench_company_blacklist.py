@@ -0,0 +1,77 @@
+"""Microbenchmark company blacklist checks: legacy list/dict scans vs. CompanyBlacklistIndex.
+
+Usage: python benchmarks/bench_company_blacklist.py [--sizes 1000 10000 100000]
+
+Each size fills the dated blacklist with that many companies (plus a static
+list of 100 names) and times lookups for a mix of listed and unlisted names,
+then times a page of 25 additions including the file write.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from company_blacklist import CompanyBlacklistIndex  # noqa: E402
+
+
+def legacy_is_blacklisted(company_name, static_blacklist, with_dates, blacklist_days):
+    # Mirrors the original LinkedinEasyApply.is_company_blacklisted (without the file rewrite)
+    company_lower = company_name.lower().strip()
+    if company_lower in [word.lower() for word in static_blacklist]:
+        return True
+    if company_lower not in {k.lower() for k in with_dates.keys()}:
+        return False
+    for company, date_str in with_dates.items():
+        if company.lower() == company_lower:
+            days_passed = (datetime.now() - datetime.fromisoformat(date_str)).days
+            return days_passed < blacklist_days
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--lookups', type=int, default=200)
+    args = parser.parse_args()
+
+    static_blacklist = [f"Static Company {i}" for i in range(100)]
+    recent = (datetime.now() - timedelta(days=1)).isoformat()
+
+    print(f"{'size':>8} {'legacy lookup (us)':>20} {'index lookup (us)':>18} {'index page flush (ms)':>22}")
+    for size in args.sizes:
+        with_dates = {f"Company {i}": recent for i in range(size)}
+        names = [f"company {random.randrange(size * 2)}" for _ in range(args.lookups)]
+
+        start = time.perf_counter()
+        for name in names:
+            legacy_is_blacklisted(name, static_blacklist, with_dates, 30)
+        legacy_time = (time.perf_counter() - start) / len(names)
+
+        with tempfile.TemporaryDirectory() as workdir:
+            index = CompanyBlacklistIndex(os.path.join(workdir, 'blacklist.json'), 30, static_blacklist)
+            for company in with_dates:
+                index.add(company, now=datetime.now() - timedelta(days=1))
+            index.flush()
+
+            start = time.perf_counter()
+            for _ in range(100):
+                for name in names:
+                    index.is_blacklisted(name)
+            index_time = (time.perf_counter() - start) / (len(names) * 100)
+
+            start = time.perf_counter()
+            for i in range(25):
+                index.add(f"New Company {i}")
+            index.flush()
+            flush_time = time.perf_counter() - start
+
+        print(f"{size:>8} {legacy_time * 1e6:>20.2f} {index_time * 1e6:>18.3f} {flush_time * 1000:>22.2f}")
+
+
+if __name__ == '__main__':
+    main()
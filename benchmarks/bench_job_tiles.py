@@ -0,0 +1,120 @@
+"""Count WebDriver round trips for reading a results page: per-tile lookups vs. one snapshot script.
+
+Usage: python benchmarks/bench_job_tiles.py [--fixture benchmarks/fixtures/search_results_saved.html]
+                                            [--implicit-wait 1] [--survivors 0.3] [--headed]
+
+Loads a saved search results page in Chrome and processes it twice. Use a
+real page: save one from a logged-in browser and anonymize it with
+benchmarks/anonymize_search_page.py, which writes
+benchmarks/fixtures/search_results_saved.html (the default when present).
+The committed search_results.html is synthetic markup and only a fallback.
+
+Each page is processed by:
+- legacy: the original apply_jobs loop, which re-queries the whole list for
+  every tile and then looks up each field (plus a document-wide XPath)
+- snapshot: snapshot_job_tiles + TileHandles, clicking only the tiles that
+  survive the filters (``--survivors`` of them)
+
+Every command sent to chromedriver goes through ``WebDriver.execute``, which
+is wrapped to count round trips.
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import pathlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium import webdriver  # noqa: E402
+from selenium.webdriver.common.by import By  # noqa: E402
+from selenium.webdriver.chrome.options import Options  # noqa: E402
+
+from job_tiles import snapshot_job_tiles, TileHandles  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+SAVED_FIXTURE = os.path.join(FIXTURES, 'search_results_saved.html')
+SYNTHETIC_FIXTURE = os.path.join(FIXTURES, 'search_results.html')
+DEFAULT_FIXTURE = SAVED_FIXTURE if os.path.exists(SAVED_FIXTURE) else SYNTHETIC_FIXTURE
+LIST_CLASS = 'fixture-results-ul'
+
+
+def count_round_trips(driver):
+    counter = {'commands': 0}
+    execute = driver.execute
+
+    def counting_execute(driver_command, params=None):
+        counter['commands'] += 1
+        return execute(driver_command, params)
+
+    driver.execute = counting_execute
+    return counter
+
+
+def legacy_page(driver, survivors):
+    # Mirrors the original per-tile extraction in LinkedinEasyApply.apply_jobs
+    job_list = driver.find_elements(By.CLASS_NAME, LIST_CLASS)[0].find_elements(By.CLASS_NAME, 'scaffold-layout__list-item')
+    for i in range(len(job_list)):
+        job_tile = driver.find_elements(By.CLASS_NAME, LIST_CLASS)[0].find_elements(By.CLASS_NAME, 'scaffold-layout__list-item')[i]
+        for lookup in (
+            lambda: job_tile.find_element(By.TAG_NAME, 'a').find_element(By.TAG_NAME, 'strong').text,
+            lambda: job_tile.find_element(By.TAG_NAME, 'a').get_attribute('href'),
+            lambda: job_tile.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text,
+            lambda: job_tile.find_element(By.XPATH, '//span[contains(.,\' is hiring for this\')]').text,
+            lambda: job_tile.find_element(By.CLASS_NAME, 'job-card-container__metadata-item').text,
+            lambda: job_tile.find_element(By.CLASS_NAME, 'job-card-container__apply-method').text,
+        ):
+            try:
+                lookup()
+            except Exception:
+                pass
+        if i in survivors:
+            job_tile.find_element(By.TAG_NAME, 'a').click()
+
+
+def snapshot_page(driver, survivors):
+    list_element = driver.find_elements(By.CLASS_NAME, LIST_CLASS)[0]
+    tiles = snapshot_job_tiles(driver, list_element)
+    handles = TileHandles(driver, tiles, list_element)
+    for tile in tiles:
+        if tile.index in survivors:
+            handles.call(tile, lambda element: element.find_element(By.TAG_NAME, 'a').click())
+    return len(tiles)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--fixture', default=DEFAULT_FIXTURE)
+    parser.add_argument('--implicit-wait', type=float, default=1.0, help='Same as main.py uses by default')
+    parser.add_argument('--survivors', type=float, default=0.3, help='Fraction of tiles that pass the filters')
+    parser.add_argument('--headed', action='store_true')
+    args = parser.parse_args()
+
+    options = Options()
+    if not args.headed:
+        options.add_argument('--headless=new')
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.implicitly_wait(args.implicit_wait)
+        driver.get(pathlib.Path(args.fixture).resolve().as_uri())
+        tile_count = len(driver.find_elements(By.CSS_SELECTOR, 'li.scaffold-layout__list-item'))
+        survivors = set(random.Random(0).sample(range(tile_count), int(tile_count * args.survivors)))
+        counter = count_round_trips(driver)
+
+        if os.path.abspath(args.fixture) == SYNTHETIC_FIXTURE:
+            print("Note: measuring the synthetic fixture; see anonymize_search_page.py for a real page")
+        print(f"{tile_count} tiles, {len(survivors)} survive the filters, implicit wait {args.implicit_wait}s")
+        print(f"{'approach':<10} {'round trips':>12} {'per tile':>9} {'wall (s)':>9}")
+        for name, process in (('legacy', legacy_page), ('snapshot', snapshot_page)):
+            counter['commands'] = 0
+            start = time.perf_counter()
+            process(driver, survivors)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<10} {counter['commands']:>12} {counter['commands'] / tile_count:>9.1f} {elapsed:>9.2f}")
+    finally:
+        driver.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,218 @@
+"""Questions classified per second: the old if/elif keyword chains vs. the compiled rule table.
+
+Usage: python benchmarks/bench_question_rules.py [--corpus benchmarks/fixtures/questions.tsv] [--rounds 2000]
+
+The corpus holds real Easy Apply question strings with their control type,
+lowercased as form_schema returns them. Each question is classified by:
+- legacy: the keyword conditions of the radio, text and dropdown chains as
+  they were in LinkedinEasyApply, in order, returning the branch taken
+- rules (cold): QuestionRuleEngine.match with its question memo cleared each
+  round, i.e. one keyword scan per question
+- rules (warm): QuestionRuleEngine.match as the bot uses it, where questions
+  already seen on earlier forms skip the scan
+
+Both must agree on every question (except for the chain's two dead
+upper-case keywords, 'Aboriginal' and 'CTC', which never matched the
+lowercased text); disagreements are printed and fail the run.
+"""
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_rules import QuestionRuleEngine  # noqa: E402
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'questions.tsv')
+EEO = {'gender': 'Male', 'race': 'Asian', 'veteran': 'I am not a protected veteran', 'disability': 'No'}
+OPTIONS = ['Select an option', 'Yes', 'No']
+
+
+def legacy_radio(radio_text, eeo):
+    if 'driver\'s licence' in radio_text or 'driver\'s license' in radio_text:
+        return 'drivers_licence'
+    elif any(keyword in radio_text.lower() for keyword in
+             [
+                 'Aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
+                 'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
+                 'aborigine', 'ancestral', 'native peoples', 'original people',
+                 'first people', 'gender', 'race', 'disability', 'latino', 'torres',
+                 'do you identify'
+             ]):
+        return 'eeo'
+    elif 'assessment' in radio_text:
+        return 'assessment'
+    elif 'clearance' in radio_text:
+        return 'clearance'
+    elif 'north korea' in radio_text:
+        return 'north_korea'
+    elif 'previously employ' in radio_text or 'previous employ' in radio_text:
+        return 'previously_employed'
+    elif 'authorized' in radio_text or 'authorised' in radio_text or 'legally' in radio_text:
+        return 'authorized'
+    elif any(keyword in radio_text.lower() for keyword in
+             ['certified', 'certificate', 'cpa', 'chartered accountant', 'qualification']):
+        return 'certified'
+    elif 'urgent' in radio_text:
+        return 'urgent'
+    elif 'commut' in radio_text or 'on-site' in radio_text or 'hybrid' in radio_text or 'onsite' in radio_text:
+        return 'commute'
+    elif 'remote' in radio_text:
+        return 'remote'
+    elif 'background check' in radio_text:
+        return 'background_check'
+    elif 'drug test' in radio_text:
+        return 'drug_test'
+    elif 'currently living' in radio_text or 'currently reside' in radio_text or 'right to live' in radio_text:
+        return 'residency'
+    elif 'level of education' in radio_text:
+        return 'education'
+    elif 'experience' in radio_text:
+        return 'experience'
+    elif 'data retention' in radio_text:
+        return 'data_retention'
+    elif 'sponsor' in radio_text:
+        return 'sponsor'
+    elif 'veteran' in radio_text.lower() and 'veteran' in eeo:
+        return 'veteran'
+    return None
+
+
+def legacy_text(question_text):
+    if ('experience' in question_text and 'salary' not in question_text) or 'how many years in' in question_text:
+        return 'experience_years' if 'experience' in question_text and 'salary' not in question_text else 'years_in'
+    elif 'grade point average' in question_text:
+        return 'gpa'
+    elif 'first name' in question_text:
+        return 'first_name'
+    elif 'last name' in question_text:
+        return 'last_name'
+    elif 'name' in question_text:
+        return 'full_name'
+    elif 'pronouns' in question_text:
+        return 'pronouns'
+    elif 'phone' in question_text:
+        return 'phone'
+    elif '联系电话' in question_text:
+        return 'phone'
+    elif 'linkedin' in question_text:
+        return 'linkedin'
+    elif 'message to hiring' in question_text or 'cover letter' in question_text:
+        return 'message'
+    elif 'website' in question_text or 'github' in question_text or 'portfolio' in question_text:
+        return 'website'
+    elif 'notice' in question_text or 'weeks' in question_text:
+        return 'notice'
+    elif 'salary' in question_text or 'expectation' in question_text or 'compensation' in question_text or 'CTC' in question_text:
+        return 'salary'
+    return None
+
+
+def legacy_dropdown(question_text, options):
+    if 'proficiency' in question_text:
+        return 'language'
+    elif 'clearance' in question_text:
+        return 'clearance'
+    elif 'assessment' in question_text:
+        return 'assessment'
+    elif 'commut' in question_text or 'on-site' in question_text or 'hybrid' in question_text or 'onsite' in question_text:
+        return 'commute'
+    elif 'country code' in question_text:
+        return 'country_code'
+    elif 'north korea' in question_text:
+        return 'north_korea'
+    elif 'previously employed' in question_text or 'previous employment' in question_text:
+        return 'previously_employed'
+    elif 'sponsor' in question_text:
+        return 'sponsor'
+    elif 'above 18' in question_text.lower():
+        return 'above_18'
+    elif 'currently living' in question_text or 'currently reside' in question_text:
+        return 'residency'
+    elif 'authorized' in question_text or 'authorised' in question_text:
+        return 'authorized'
+    elif any(keyword in question_text.lower() for keyword in
+             [
+                 'aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
+                 'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
+                 'aborigine', 'ancestral', 'native peoples', 'original people',
+                 'first people', 'gender', 'race', 'disability', 'latino', 'veteran'
+             ]):
+        return 'eeo'
+    elif 'citizenship' in question_text:
+        return 'citizenship'
+    elif 'notifications' in question_text and options:
+        return 'notifications'
+    elif 'email' in question_text:
+        return 'email'
+    elif 'experience' in question_text or 'understanding' in question_text or 'familiar' in question_text or 'comfortable' in question_text or 'able to' in question_text:
+        return 'experience'
+    return None
+
+
+def legacy_classify(control, question_text):
+    if control == 'radio':
+        return legacy_radio(question_text, EEO)
+    if control in ('text', 'numeric'):
+        return legacy_text(question_text)
+    return legacy_dropdown(question_text, OPTIONS)
+
+
+def load_corpus(path):
+    corpus = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.strip() and not line.startswith('#'):
+                control, question_text = line.rstrip('\n').split('\t', 1)
+                corpus.append((control, question_text))
+    return corpus
+
+
+def rate(classify, corpus, rounds, before_round=None):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if before_round:
+            before_round()
+        for control, question_text in corpus:
+            classify(control, question_text)
+    return rounds * len(corpus) / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--corpus', default=DEFAULT_CORPUS)
+    parser.add_argument('--rounds', type=int, default=2000)
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus)
+    build_start = time.perf_counter()
+    engine = QuestionRuleEngine()
+    build_ms = (time.perf_counter() - build_start) * 1000
+
+    def rules_classify(control, question_text):
+        rule = engine.match(question_text, control, eeo=EEO, options=OPTIONS)
+        return rule.name if rule else None
+
+    mismatches = 0
+    for control, question_text in corpus:
+        legacy, rules = legacy_classify(control, question_text), rules_classify(control, question_text)
+        if legacy != rules and not ('aboriginal' in question_text or 'ctc' in question_text):
+            mismatches += 1
+            print(f"MISMATCH [{control}] {question_text!r}: legacy={legacy} rules={rules}")
+    matched = sum(1 for control, question_text in corpus if rules_classify(control, question_text))
+    print(f"{len(corpus)} questions, {matched} matched a rule, {mismatches} disagreements with the legacy chains")
+    print(f"Rule engine built in {build_ms:.1f} ms "
+          f"({engine.keyword_count} keywords in {len(engine.rules)} matchers)")
+
+    legacy_rate = rate(legacy_classify, corpus, args.rounds)
+    cold_rate = rate(rules_classify, corpus, args.rounds, before_round=engine._memo.clear)
+    warm_rate = rate(rules_classify, corpus, args.rounds)
+    print(f"legacy chains:       {legacy_rate:>12,.0f} questions/s")
+    print(f"rule engine (cold):  {cold_rate:>12,.0f} questions/s ({cold_rate / legacy_rate:.2f}x)")
+    print(f"rule engine (warm):  {warm_rate:>12,.0f} questions/s ({warm_rate / legacy_rate:.2f}x)")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+from collections import Counter
+
+from job_ids import clean_job_link
+
+
+def candidate_key(tile):
+    """Job ID of a tile, or its cleaned link when the tile carries no ID"""
+    return tile.job_id if tile.job_id is not None else clean_job_link(tile.link)
+
+
+class CandidateRegistry:
+    """Run-wide record of which search surfaced and evaluated each job posting, keyed by job ID.
+
+    Overlapping searches ("United States" and a metro inside it, or similar
+    positions) list the same postings under different query strings. Every
+    tile the bot decides on is marked evaluated before it is opened, so
+    JobPrefilter skips the posting under every later search whatever the
+    outcome was (applied, failed, not Easy Apply); SeenJobs only holds the
+    postings skipped for good. The search each posting belongs to also lets
+    the run summary say which searches overlap and how many detail loads the
+    skip saved. Each results page is registered straight from its tile
+    snapshot. ``click_seconds`` is the estimated cost of one detail load,
+    used to report the time saved.
+    """
+
+    def __init__(self, click_seconds=4.0):
+        self.click_seconds = click_seconds
+        self._first_search = {}  # candidate key -> search that surfaced it first
+        self._evaluated = {}  # candidate key -> search it was evaluated under
+        self.surfaced = 0
+        self.duplicates = 0  # tiles of postings another search had already surfaced
+        self.loads_avoided = 0
+        self.overlaps = Counter()  # (first search, later search) -> shared postings
+        self._search = None  # search whose pages are being registered
+        self._avoided_here = set()  # candidate keys already counted as avoided under that search
+
+    def register_page(self, tiles, search):
+        if search != self._search:
+            self._search = search
+            self._avoided_here = set()
+        for tile in tiles:
+            key = candidate_key(tile)
+            if not key:
+                continue
+            self.surfaced += 1
+            first = self._first_search.setdefault(key, search)
+            if first != search:
+                self.duplicates += 1
+                self.overlaps[(first, search)] += 1
+
+    def evaluated_under(self, tile):
+        """The search a posting was already evaluated under in this run, or None"""
+        return self._evaluated.get(candidate_key(tile))
+
+    def mark_evaluated(self, tile, search):
+        key = candidate_key(tile)
+        if key:
+            self._evaluated.setdefault(key, search)
+
+    def record_avoided(self, tile):
+        """Count a detail load avoided for a tile skipped only because another search evaluated it.
+
+        Postings evaluated under the current search, or already counted for
+        it, are repeats within the search rather than loads the overlap saved.
+        """
+        key = candidate_key(tile)
+        earlier = self._evaluated.get(key)
+        if earlier is None or earlier == self._search or key in self._avoided_here:
+            return False
+        self._avoided_here.add(key)
+        self.loads_avoided += 1
+        return True
+
+    def summary(self, top=3):
+        lines = [f"{len(self._first_search)} distinct postings from {self.surfaced} tiles; "
+                 f"{self.duplicates} surfaced by more than one search; {self.loads_avoided} duplicate detail loads "
+                 f"avoided (~{self.loads_avoided * self.click_seconds:.0f}s)"]
+        for (first, later), count in self.overlaps.most_common(top):
+            lines.append(f"  {count} postings of '{later}' were already listed by '{first}'")
+        return "\n".join(lines)
@@ -0,0 +1,138 @@
+import os
+import json
+import heapq
+from datetime import datetime, timedelta
+
+from persistence import atomic_write_json
+
+
+def normalize_company(name):
+    """Case-fold and trim a company name for blacklist lookups"""
+    return name.strip().casefold() if name else ""
+
+
+class CompanyBlacklistIndex:
+    """Company blacklist with O(1) case-insensitive lookups and timed expiry.
+
+    Two kinds of entries are held:
+    - static entries from the ``companyBlacklist`` config, which never expire
+    - dated entries added after a successful application, which expire after
+      ``blacklist_days`` and are persisted to ``path``
+
+    Dated entries are indexed by their normalized name, and their expiry times
+    are kept in a min-heap so that expired entries are evicted in bulk instead
+    of being checked one by one. Changes only mark the index dirty; ``flush``
+    writes the file once, which the bot does at the end of each results page.
+    """
+
+    def __init__(self, path, blacklist_days, static_companies=None, writer=None):
+        self.path = path
+        self.writer = writer
+        self.blacklist_days = blacklist_days
+        self._static = {normalize_company(name) for name in (static_companies or []) if normalize_company(name)}
+        self._entries = {}  # normalized name -> (display name, ISO date string, expiry timestamp)
+        self._expiry_heap = []  # (expiry timestamp, normalized name), may hold stale items
+        self._dirty = False
+
+    def _expiry_for(self, date_str):
+        blacklisted_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        return (blacklisted_date + timedelta(days=self.blacklist_days)).timestamp()
+
+    def _set_entry(self, display_name, date_str):
+        key = normalize_company(display_name)
+        expires_at = self._expiry_for(date_str)
+        self._entries[key] = (display_name, date_str, expires_at)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+    def load(self):
+        """Load dated entries from ``path``, converting the old list-of-names format"""
+        self._entries = {}
+        self._expiry_heap = []
+        if not os.path.exists(self.path):
+            print("Company blacklist file not found, creating new record")
+            return
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            blacklist_data = json.load(f)
+
+        if blacklist_data and isinstance(blacklist_data, list):
+            if isinstance(blacklist_data[0], str):
+                # Old format - convert to new format
+                current_time = datetime.now().isoformat()
+                for company in blacklist_data:
+                    if normalize_company(company):
+                        self._set_entry(company.strip(), current_time)
+                self._dirty = True
+            else:
+                for item in blacklist_data:
+                    if not isinstance(item, dict) or not normalize_company(item.get('company')):
+                        continue
+                    try:
+                        self._set_entry(item['company'], item['blacklisted_date'])
+                    except (KeyError, TypeError, ValueError) as e:
+                        print(f"Ignoring invalid company blacklist entry {item}: {e}")
+        print(f"Successfully loaded {len(self._entries)} blacklisted company records")
+
+    def evict_expired(self, now=None):
+        """Drop every dated entry whose blacklist period has elapsed"""
+        now = (now or datetime.now()).timestamp()
+        evicted = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(key)
+            # Skip heap items left behind when an entry was re-added with a later expiry
+            if entry is None or entry[2] != expires_at:
+                continue
+            del self._entries[key]
+            evicted.append(entry[0])
+        if evicted:
+            self._dirty = True
+            print(f"Company blacklist period ({self.blacklist_days} days) has expired for {len(evicted)} companies, "
+                  f"removed from blacklist: {', '.join(evicted[:10])}{'...' if len(evicted) > 10 else ''}")
+        return evicted
+
+    def is_static(self, company_name):
+        return normalize_company(company_name) in self._static
+
+    def is_blacklisted(self, company_name, now=None):
+        """Check the static list and the unexpired dated entries"""
+        key = normalize_company(company_name)
+        if not key:
+            return False
+        if key in self._static:
+            return True
+        if self._expiry_heap and self._expiry_heap[0][0] <= (now or datetime.now()).timestamp():
+            self.evict_expired(now)
+        return key in self._entries
+
+    def add(self, company_name, now=None):
+        """Add or refresh a dated entry; returns True if the company was already listed"""
+        company_clean = company_name.strip()
+        key = normalize_company(company_clean)
+        existing = self._entries.get(key)
+        display_name = existing[0] if existing else company_clean
+        self._set_entry(display_name, (now or datetime.now()).isoformat())
+        self._dirty = True
+        return existing is not None
+
+    def get_display_name(self, company_name):
+        entry = self._entries.get(normalize_company(company_name))
+        return entry[0] if entry else None
+
+    def flush(self):
+        """Persist dated entries if anything changed since the last flush"""
+        if not self._dirty:
+            return False
+        blacklist_list = [
+            {"company": display_name, "blacklisted_date": date_str}
+            for display_name, date_str, _ in self._entries.values()
+        ]
+        if self.writer:
+            self.writer.write_json(self.path, blacklist_list, indent=2)
+        else:
+            atomic_write_json(self.path, blacklist_list, indent=2)
+        self._dirty = False
+        return True
+
+    def __len__(self):
+        return len(self._entries)
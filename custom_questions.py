@@ -0,0 +1,123 @@
+import os
+import json
+import time
+
+import yaml
+
+from keyword_matcher import KeywordMatcher
+
+
+def _unquote(value):
+    """The GUI saves entries containing quotes or colons as JSON strings; read them back as plain text"""
+    if isinstance(value, str) and len(value) > 1 and value.startswith('"') and value.endswith('"'):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def normalize_question(text):
+    """Casefolded text with runs of whitespace collapsed, as questions and custom entries are compared"""
+    return ' '.join(str(text).casefold().split())
+
+
+class CustomQuestionMatcher:
+    """Answers form questions from the ``customQuestions`` config.
+
+    The entries are normalized and compiled into one KeywordMatcher when
+    loaded, so a question is checked against every entry in a single scan.
+    When several entries occur in a question the longest one wins, and
+    between entries of the same length the one listed first in the config
+    wins, so the answer no longer depends on which entry the loop reached
+    first. With ``config_path`` set, the config file's mtime is checked at
+    most every ``check_seconds`` and the entries are reloaded when it changes,
+    so questions added in the GUI apply without restarting the bot.
+    """
+
+    def __init__(self, questions=None, config_path=None, check_seconds=5):
+        self.config_path = config_path
+        self.check_seconds = check_seconds
+        self._mtime = self._config_mtime()
+        self._checked_at = time.time()
+        self.reloads = 0
+        self._load(questions or {})
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _load(self, questions):
+        self.questions = {}
+        self._entries = {}  # normalized question -> (order, question, answer)
+        for question, answer in questions.items():
+            question, answer = _unquote(question), _unquote(answer)
+            key = normalize_question(question)
+            if not key or answer is None or key in self._entries:
+                continue
+            self.questions[question] = answer
+            self._entries[key] = (len(self._entries), question, str(answer))
+        self._matcher = KeywordMatcher(self._entries)
+        self._memo = {}
+
+    def _config_mtime(self):
+        if not self.config_path:
+            return None
+        try:
+            return os.path.getmtime(self.config_path)
+        except OSError:
+            return None
+
+    def reload_if_changed(self):
+        """Reload the entries when the config file changed on disk; True when they were reloaded"""
+        if not self.config_path or time.time() - self._checked_at < self.check_seconds:
+            return False
+        self._checked_at = time.time()
+        mtime = self._config_mtime()
+        if mtime is None or mtime == self._mtime:
+            return False
+        try:
+            with open(self.config_path, 'r', encoding='utf-8') as stream:
+                config = yaml.safe_load(stream) or {}
+        except (OSError, yaml.YAMLError) as e:
+            print(f"Could not reload custom questions from {self.config_path}: {e}")
+            return False
+        self._mtime = mtime
+        self._load(config.get('customQuestions') or {})
+        self.reloads += 1
+        print(f"Reloaded {len(self)} custom questions from {self.config_path}")
+        return True
+
+    def lookup(self, question_text):
+        """The (custom question, answer) entry that best matches ``question_text``, or None"""
+        if not self._entries or not question_text:
+            return None
+        text = normalize_question(question_text)
+        if text in self._memo:
+            return self._memo[text]
+        found = self._matcher.find(text)
+        match = None
+        if found:
+            key = min(found, key=lambda key: (-len(key), self._entries[key][0]))
+            _, question, answer = self._entries[key]
+            match = (question, answer)
+        if len(self._memo) >= 4096:
+            self._memo.clear()
+        self._memo[text] = match
+        return match
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show which customQuestions entry answers a question")
+    parser.add_argument('question', nargs='+', help="Question text as shown on the form")
+    parser.add_argument('--config', default='config.yaml')
+    args = parser.parse_args()
+
+    with open(args.config, 'r', encoding='utf-8') as stream:
+        matcher = CustomQuestionMatcher((yaml.safe_load(stream) or {}).get('customQuestions') or {})
+    match = matcher.lookup(' '.join(args.question))
+    if match is None:
+        print(f"No match among {len(matcher)} custom questions")
+    else:
+        print(f"'{match[0]}' -> '{match[1]}'")
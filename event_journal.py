@@ -0,0 +1,155 @@
+import os
+import glob
+import json
+import time
+import argparse
+from datetime import datetime
+from contextlib import contextmanager
+
+
+class PhaseTimer:
+    """Accumulates wall time per named phase of processing one job"""
+
+    def __init__(self):
+        self.phases = {}
+        self.steps = {}  # phase name -> list of individual durations, for repeated phases
+
+    def add(self, name, seconds, repeated=False):
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+        if repeated:
+            self.steps.setdefault(name, []).append(round(seconds, 3))
+
+    @contextmanager
+    def phase(self, name, repeated=False):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, repeated)
+
+    def as_dict(self):
+        timings = {name: round(seconds, 3) for name, seconds in self.phases.items()}
+        for name, durations in self.steps.items():
+            timings[name + '_steps'] = durations
+        return timings
+
+
+class EventJournal:
+    """Buffered JSONL journal with one event per job tile.
+
+    Events are buffered in memory and handed to the ``WriteBehindWriter`` (or
+    appended directly) every ``buffer_size`` events and on ``flush``. When the
+    file grows past ``max_bytes`` it is rotated to ``.1`` … ``.<backups>``.
+    """
+
+    def __init__(self, path, writer=None, max_bytes=10 * 1024 * 1024, backups=5, buffer_size=25):
+        self.path = path
+        self.writer = writer
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.buffer_size = buffer_size
+        self._buffer = []
+        self._size = os.path.getsize(path) if os.path.exists(path) else 0
+
+    def record(self, event):
+        event = dict(event)
+        event.setdefault('ts', datetime.now().isoformat(timespec='milliseconds'))
+        self._buffer.append(json.dumps(event, ensure_ascii=False, default=str) + '\n')
+        if len(self._buffer) >= self.buffer_size:
+            self.flush()
+
+    def _rotate(self):
+        if self.writer:
+            self.writer.flush()
+        for index in range(self.backups - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if os.path.exists(self.path):
+            os.replace(self.path, f"{self.path}.1")
+        self._size = 0
+
+    def flush(self):
+        if not self._buffer:
+            return
+        text = ''.join(self._buffer)
+        self._buffer = []
+        if self._size >= self.max_bytes:
+            self._rotate()
+        self._size += len(text.encode('utf-8'))
+        if self.writer:
+            self.writer.append_text(self.path, text)
+        else:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(text)
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def load_events(path):
+    """Read a journal and its rotated backups, oldest first"""
+    backups = [p for p in glob.glob(glob.escape(path) + '.*') if p.rsplit('.', 1)[1].isdigit()]
+    backups.sort(key=lambda p: int(p.rsplit('.', 1)[1]), reverse=True)
+    paths = backups + [path]
+    events = []
+    for journal_path in paths:
+        if not os.path.exists(journal_path):
+            continue
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        pass
+    return events
+
+
+def analyze(events):
+    """Print throughput, decisions, skip reasons and per-phase latency percentiles"""
+    if not events:
+        print("No events recorded.")
+        return
+    timestamps = sorted(datetime.fromisoformat(event['ts']) for event in events if event.get('ts'))
+    hours = max((timestamps[-1] - timestamps[0]).total_seconds() / 3600, 1e-9) if len(timestamps) > 1 else None
+    decisions = {}
+    skip_reasons = {}
+    phases = {}
+    for event in events:
+        decisions[event.get('decision', 'unknown')] = decisions.get(event.get('decision', 'unknown'), 0) + 1
+        for reason in event.get('skip_reasons') or []:
+            skip_reasons[reason] = skip_reasons.get(reason, 0) + 1
+        for name, value in (event.get('timings') or {}).items():
+            if isinstance(value, (int, float)):
+                phases.setdefault(name, []).append(value)
+            elif isinstance(value, list):
+                # Per-step durations of a repeated phase, e.g. each fill_up step
+                phases.setdefault(name, []).extend(v for v in value if isinstance(v, (int, float)))
+
+    applied = decisions.get('applied', 0)
+    print(f"Events: {len(events)} from {timestamps[0]} to {timestamps[-1]}")
+    if hours:
+        print(f"Throughput: {len(events) / hours:.1f} jobs/hour, {applied / hours:.1f} applies/hour")
+    print("Decisions: " + ", ".join(f"{name}={count}" for name, count in sorted(decisions.items(), key=lambda x: -x[1])))
+    if skip_reasons:
+        print("Skip reasons:")
+        for reason, count in sorted(skip_reasons.items(), key=lambda x: -x[1]):
+            print(f"  {count:>6}  {reason}")
+    print(f"{'phase':<20} {'count':>6} {'p50 (s)':>8} {'p90 (s)':>8} {'p99 (s)':>8} {'total (s)':>10}")
+    for name, values in sorted(phases.items()):
+        values.sort()
+        print(f"{name:<20} {len(values):>6} {_percentile(values, 0.5):>8.2f} {_percentile(values, 0.9):>8.2f} "
+              f"{_percentile(values, 0.99):>8.2f} {sum(values):>10.1f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Summarize a job event journal")
+    parser.add_argument('journal', nargs='?', default='events.jsonl', help='Journal file (rotated backups are included)')
+    args = parser.parse_args()
+    analyze(load_events(args.journal))
@@ -0,0 +1,169 @@
+from selenium.webdriver.common.by import By
+
+QID_ATTRIBUTE = 'data-eab-qid'
+
+# Classifies every question of the current Easy Apply step in one call, so
+# answering never has to probe for controls that are not there (each failed
+# find_element costs the full implicit wait). The question text joins, in
+# order: the nearest preceding group title, the radio legend, the question's
+# own label, the fb-dash-form-element__label span and the nearest preceding
+# group subtitle, lowercased. Each question element gets a data-eab-qid
+# attribute to find it again.
+FORM_SCHEMA_JS = """
+const form = arguments[0];
+const step = String(Date.now() % 100000);
+const text = el => el ? (el.innerText || el.textContent || '').trim() : '';
+const precedingSpan = (element, className) => {
+    let match = null;
+    for (const span of document.querySelectorAll('span.' + className)) {
+        if (span.compareDocumentPosition(element) & Node.DOCUMENT_POSITION_FOLLOWING) {
+            match = span;
+        } else {
+            break;
+        }
+    }
+    return match;
+};
+return Array.from(form.querySelectorAll('.fb-dash-form-element')).map((question, index) => {
+    let qid = question.getAttribute('data-eab-qid');
+    if (!qid) {
+        qid = 'eab-' + step + '-' + index;
+        question.setAttribute('data-eab-qid', qid);
+    }
+    const fieldset = question.querySelector('fieldset');
+    const select = question.querySelector('select');
+    const datePicker = question.querySelector('.artdeco-datepicker__input');
+    // Only the control types the text handler can fill; hidden, email or tel inputs next to a select are not the question
+    const textControl = question.querySelector(
+        'input[type=text]:not(.artdeco-datepicker__input), input:not([type]):not(.artdeco-datepicker__input), textarea');
+    const checkboxes = question.querySelectorAll('input[type=checkbox]');
+    const labels = Array.from((fieldset || question).querySelectorAll('label'));
+
+    // Every control the question has (radio, date, select, text, checkbox); the first is the question's
+    // type and the others are tried in order if its handler fails. A select goes before text, since an
+    // input next to a dropdown is a search box or helper field rather than the question
+    const candidates = [];
+    let defaultText = '';
+    const checkboxGroup = fieldset && checkboxes.length && !fieldset.querySelector('input[type=radio]');
+    if (fieldset && !checkboxGroup && labels.length) {
+        const legendSpan = fieldset.querySelector('.fb-dash-form-element__label span');
+        defaultText = text(legendSpan);
+        const checked = fieldset.querySelector('input[type=radio]:checked');
+        const checkedLabel = checked ? fieldset.querySelector('label[for="' + CSS.escape(checked.id) + '"]') : null;
+        candidates.push({
+            type: 'radio',
+            control: fieldset.querySelector('input[type=radio]'),
+            options: labels.map(label => text(label).toLowerCase()),
+            value: checkedLabel ? text(checkedLabel) : null,
+        });
+    }
+    if (datePicker) {
+        candidates.push({type: 'date', control: datePicker, options: [], value: datePicker.value});
+    }
+    if (select) {
+        candidates.push({
+            type: 'select',
+            control: select,
+            options: Array.from(select.options).map(option => text(option)),
+            value: select.selectedIndex >= 0 ? text(select.options[select.selectedIndex]) : null,
+        });
+    }
+    if (textControl) {
+        const numeric = (textControl.id || '').toLowerCase().includes('numeric');
+        candidates.push({type: numeric ? 'numeric' : 'text', control: textControl, options: [], value: textControl.value});
+    }
+    if (checkboxes.length || (labels.length && !candidates.length)) {
+        candidates.push({
+            type: 'checkbox',
+            control: checkboxes[0] || null,
+            options: labels.map(label => text(label)),
+            value: Array.from(checkboxes).some(checkbox => checkbox.checked),
+        });
+    }
+    const main = candidates[0] || {type: 'unknown', control: null, options: [], value: null};
+    const control = main.control;
+
+    const pieces = [];
+    if (defaultText) pieces.push(defaultText);
+    const ownLabel = question.querySelector('label');
+    if (text(ownLabel)) pieces.push(text(ownLabel));
+    const labelSpan = question.querySelector('[class*="fb-dash-form-element__label"] span');
+    if (text(labelSpan)) pieces.push(text(labelSpan));
+    const title = precedingSpan(question, 'jobs-easy-apply-form-section__group-title');
+    if (text(title)) pieces.unshift(text(title));
+    const subtitle = precedingSpan(question, 'jobs-easy-apply-form-section__group-subtitle');
+    if (text(subtitle)) pieces.push(text(subtitle));
+
+    return {
+        qid: qid,
+        type: main.type,
+        text: pieces.join(' ').trim().toLowerCase(),
+        options: main.options,
+        required: !!(control && (control.required || control.getAttribute('aria-required') === 'true')),
+        value: main.value,
+        element_id: control ? control.id : '',
+        fallbacks: candidates.slice(1).map(candidate => ({
+            type: candidate.type,
+            options: candidate.options,
+            value: candidate.value,
+            element_id: candidate.control ? candidate.control.id : '',
+        })),
+    };
+});
+"""
+
+
+class FormQuestion:
+    """One classified question of an Easy Apply form step.
+
+    ``type`` is one of radio, text, numeric, date, select, checkbox or
+    unknown; ``options`` holds the radio labels (lowercased) or select options.
+    ``fallbacks`` are the same question read as each other control it
+    contains, for when the handler for ``type`` fails.
+    """
+
+    def __init__(self, qid, type, text="", options=None, required=False, value=None, element_id="", fallbacks=None):
+        self.qid = qid
+        self.type = type
+        self.text = text
+        self.options = options or []
+        self.required = required
+        self.value = value
+        self.element_id = element_id
+        self.fallbacks = fallbacks or []
+
+    @classmethod
+    def from_schema(cls, data):
+        return cls(
+            qid=data['qid'],
+            type=data.get('type') or 'unknown',
+            text=data.get('text') or "",
+            options=data.get('options') or [],
+            required=bool(data.get('required')),
+            value=data.get('value'),
+            element_id=data.get('element_id') or "",
+            fallbacks=[
+                cls(
+                    qid=data['qid'],
+                    type=fallback.get('type') or 'unknown',
+                    text=data.get('text') or "",
+                    options=fallback.get('options') or [],
+                    required=bool(data.get('required')),
+                    value=fallback.get('value'),
+                    element_id=fallback.get('element_id') or "",
+                )
+                for fallback in data.get('fallbacks') or []
+            ],
+        )
+
+    def __repr__(self):
+        return f"FormQuestion({self.qid!r}, {self.type!r}, {self.text[:40]!r})"
+
+
+def extract_form_schema(browser, form):
+    """Return a FormQuestion for every question in ``form`` using a single script call"""
+    return [FormQuestion.from_schema(row) for row in browser.execute_script(FORM_SCHEMA_JS, form) or []]
+
+
+def find_question_element(form, question):
+    return form.find_element(By.CSS_SELECTOR, f'[{QID_ATTRIBUTE}="{question.qid}"]')
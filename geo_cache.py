@@ -0,0 +1,101 @@
+import re
+import time
+import sqlite3
+import argparse
+from datetime import datetime
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def normalize_location(location):
+    """Case-fold and collapse whitespace so 'New York,  NY' and 'new york, ny' share an entry"""
+    return _WHITESPACE_RE.sub(' ', location or '').strip().casefold()
+
+
+class GeoIdCache:
+    """Persistent location -> LinkedIn geoId cache with a TTL.
+
+    Resolving a geoId through the search box takes several seconds of browser
+    navigation, and the answer rarely changes, so it is stored in a small
+    SQLite database (WAL mode, safe to share between users and concurrent
+    runs). Entries older than ``ttl_days`` are treated as missing and get
+    resolved again.
+    """
+
+    def __init__(self, path, ttl_days=30):
+        self.path = path
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.hits = 0
+        self.misses = 0
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS geo_ids ("
+            " location_key TEXT PRIMARY KEY,"
+            " location TEXT NOT NULL,"
+            " geo_id TEXT NOT NULL,"
+            " resolved_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, location, now=None):
+        """Return the cached geoId for ``location``, or None if unknown or expired"""
+        row = self._conn.execute(
+            "SELECT geo_id, resolved_at FROM geo_ids WHERE location_key = ?", (normalize_location(location),)
+        ).fetchone()
+        if row and (now or time.time()) - row[1] < self.ttl_seconds:
+            self.hits += 1
+            return row[0]
+        self.misses += 1
+        return None
+
+    def put(self, location, geo_id, now=None):
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO geo_ids (location_key, location, geo_id, resolved_at) VALUES (?, ?, ?, ?)",
+                (normalize_location(location), location.strip(), str(geo_id), now or time.time())
+            )
+
+    def forget(self, location):
+        with self._conn:
+            return self._conn.execute(
+                "DELETE FROM geo_ids WHERE location_key = ?", (normalize_location(location),)
+            ).rowcount
+
+    def missing(self, locations, now=None):
+        """Locations (deduplicated, in order) that have no fresh cache entry"""
+        now = now or time.time()
+        fresh = {
+            key for key, resolved_at in self._conn.execute("SELECT location_key, resolved_at FROM geo_ids")
+            if now - resolved_at < self.ttl_seconds
+        }
+        result, seen = [], set()
+        for location in locations:
+            key = normalize_location(location)
+            if key and key not in fresh and key not in seen:
+                seen.add(key)
+                result.append(location)
+        return result
+
+    def entries(self):
+        return self._conn.execute(
+            "SELECT location, geo_id, resolved_at FROM geo_ids ORDER BY location_key"
+        ).fetchall()
+
+    def close(self):
+        self._conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Inspect the shared location -> geoId cache")
+    parser.add_argument('cache', nargs='?', default='geo_ids.db')
+    parser.add_argument('--forget', metavar='LOCATION', help='Drop one location so it is resolved again')
+    args = parser.parse_args()
+
+    cache = GeoIdCache(args.cache)
+    if args.forget:
+        print(f"Removed {cache.forget(args.forget)} entries for '{args.forget}'")
+    else:
+        for location, geo_id, resolved_at in cache.entries():
+            print(f"{geo_id:>12}  {datetime.fromtimestamp(resolved_at):%Y-%m-%d}  {location}")
+    cache.close()
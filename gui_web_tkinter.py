@@ -181,9 +181,30 @@ DEFAULT_CONFIG = {
     'avoidDuplicateApplications': True,  # 防重复申请功能
     'reapplyDays': 30,  # 多少天后可以重新投递
     'appliedJobsFile': 'applied_jobs.json',  # 已申请职位记录文件，将根据用户ID自动调整
+    'appliedJobsStore': 'sqlite',  # 已申请职位存储后端: sqlite/json
     'autoBlacklistAppliedCompanies': False,  # 是否自动将投递成功的公司加入黑名单
     'companyBlacklistDays': 30,  # 公司黑名单天数，默认30天
     'companyBlacklistFile': 'company_blacklist.json',  # 公司黑名单文件
+    'persistSeenJobs': False,  # 是否跨运行记住已评估过的职位
+    'eventJournal': True,  # 是否记录每个职位的决策与耗时 (events.jsonl)
+    'listScrollPacing': 'auto',  # 职位列表滚动节奏: auto(加载完成即停) / human(模拟人工速度)
+    'geoIdCacheDays': 30,  # 地点geoId缓存有效天数（所有用户共享）
+    'preResolveGeoIds': False,  # 启动时预先解析所有地点的geoId
+    'searchPlanner': True,  # 按历史收益排序搜索组合并限制每个搜索的翻页数
+    'searchExplorationFraction': 0.2,  # 每次运行随机探索的搜索比例（优先尝试冷门组合）
+    'searchMaxPages': 0,  # 每个搜索最多翻页数，0表示不限制
+    'maxZeroYieldPages': 2,  # 连续多少页没有新职位后停止该搜索，0表示不限制
+    'incrementalSearch': False,  # 增量搜索：只搜索上次完成以来发布的职位（按最新排序）
+    'incrementalOverlapMinutes': 60,  # 增量搜索时间窗口的重叠分钟数，避免遗漏
+    'pipelinedApply': False,  # 流水线模式：申请当前职位时在第二个窗口预加载下一个职位
+    'jobDetailCache': True,  # 缓存职位描述与申请人数（所有用户共享），筛选时无需点击
+    'jobDetailCacheHours': 24,  # 职位详情缓存有效小时数
+    'aiAnswerCache': True,  # 缓存AI生成的表单回答（多个进程共享），相同问题不再重复调用API
+    'aiAnswerCacheDays': 30,  # AI回答缓存有效天数
+    'aiAnswerCacheSize': 5000,  # AI回答缓存最多条目数，超出时淘汰最久未使用的
+    'batchAiAnswers': False,  # 表单每一步中需要AI回答的问题合并为一次请求（需云端部署批量接口）
+    'aiConcurrency': 3,  # 同时进行的AI请求数，填写其他字段时在后台请求；0表示不并发
+    'aiAnswerTimeout': 75,  # 每次AI请求从开始执行起最多等待的秒数（不少于云端API的60秒超时），超时使用后备答案
 }
 
 STANDARD_DEGREES = ["High School Diploma", "Associate's Degree", "Bachelor's Degree", "Master's Degree", "Master of Business Administration", "Doctor of Philosophy", "Doctor of Medicine", "Doctor of Law"]
@@ -0,0 +1,75 @@
+import os
+import json
+import math
+import time
+import argparse
+from datetime import datetime
+
+from persistence import atomic_write_json
+from search_planner import search_key
+
+
+class SearchCheckpoints:
+    """Last successful completion time of each search, per user.
+
+    In incremental mode a search only asks LinkedIn for jobs posted since it
+    last completed (``f_TPR=r<seconds>``), widened by ``overlap_seconds`` so
+    postings indexed late are not missed, and never wider than the configured
+    date window. A search without a checkpoint uses the configured window.
+    Checkpoints store the time a search *started*, so jobs posted while it was
+    walking are covered by the next run, and only a walk that reached the end
+    of the results (pagination.COMPLETE_REASONS) advances one; a search cut
+    short by its page budget or zero-yield pages keeps its old window.
+    """
+
+    def __init__(self, path, filters='', overlap_seconds=3600, writer=None):
+        self.path = path
+        self.filters = filters
+        self.overlap_seconds = overlap_seconds
+        self.writer = writer
+        self._completed = {}  # search key -> {'position', 'location', 'completed_at'}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._completed = json.load(f)
+        except Exception as e:
+            print(f"Failed to load search checkpoints {self.path}: {e}")
+
+    def last_completed(self, position, location):
+        entry = self._completed.get(search_key(position, location, self.filters))
+        return entry['completed_at'] if entry else None
+
+    def window_seconds(self, position, location, max_window=None, now=None):
+        """Seconds of postings to request, or ``max_window`` (None = all time) without a checkpoint"""
+        last = self.last_completed(position, location)
+        if last is None:
+            return max_window
+        seconds = math.ceil((now or time.time()) - last + self.overlap_seconds)
+        return min(seconds, max_window) if max_window else seconds
+
+    def complete(self, position, location, started_at):
+        self._completed[search_key(position, location, self.filters)] = {
+            'position': position,
+            'location': location,
+            'completed_at': started_at,
+        }
+        if self.writer:
+            self.writer.write_json(self.path, dict(self._completed), indent=2)
+        else:
+            atomic_write_json(self.path, self._completed, indent=2)
+
+    def entries(self):
+        return sorted(self._completed.values(), key=lambda entry: entry['completed_at'])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Show when each search last completed in incremental mode")
+    parser.add_argument('checkpoints', nargs='?', default='search_checkpoints.json')
+    args = parser.parse_args()
+
+    for entry in SearchCheckpoints(args.checkpoints).entries():
+        print(f"{datetime.fromtimestamp(entry['completed_at']):%Y-%m-%d %H:%M}  {entry['position']} @ {entry['location']}")
@@ -0,0 +1,161 @@
+import time
+import zlib
+import sqlite3
+import argparse
+
+from job_prefetch import parse_applicants_count
+
+# Reads what the filters need from the job details pane in one call
+JOB_DETAILS_JS = """
+const text = selector => {
+    const el = document.querySelector(selector);
+    return el ? (el.innerText || el.textContent || '').trim() : '';
+};
+return {
+    description: text('#job-details') || text('.jobs-description__content'),
+    applicants_text: text('.job-details-jobs-unified-top-card__tertiary-description-container'),
+    primary_text: text('.job-details-jobs-unified-top-card__primary-description-container'),
+    company: text('.job-details-jobs-unified-top-card__company-name'),
+};
+"""
+
+_POSTED_MARKERS = ('ago', 'posted', '前', '发布')
+
+
+def parse_posted(text):
+    """The '2 weeks ago' part of the top card's '·'-separated description line"""
+    for part in (text or '').split('·'):
+        part = part.strip()
+        if any(marker in part.lower() for marker in _POSTED_MARKERS):
+            return part
+    return ''
+
+
+class JobDetails:
+    """Description and top card facts of one job posting"""
+
+    def __init__(self, job_id, description='', applicants_text='', posted='', company='', fetched_at=None):
+        self.job_id = job_id
+        self.description = description
+        self.applicants_text = applicants_text
+        self.posted = posted
+        self.company = company
+        self.fetched_at = fetched_at
+
+    @property
+    def applicants_count(self):
+        return parse_applicants_count(self.applicants_text)
+
+
+class JobDetailCache:
+    """SQLite cache of job details keyed by job ID, shared by users and runs.
+
+    Descriptions are stored zlib-compressed. Entries older than ``ttl_hours``
+    count as missing, since applicant counts keep growing; the filters then
+    read the job again. ``hits``, ``misses`` and ``expired`` are counted for
+    the run summary.
+    """
+
+    def __init__(self, path, ttl_hours=24):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.raw_bytes = 0
+        self.stored_bytes = 0
+        self._conn = sqlite3.connect(path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS job_details ("
+            " job_id INTEGER PRIMARY KEY,"
+            " company TEXT NOT NULL,"
+            " applicants_text TEXT NOT NULL,"
+            " posted TEXT NOT NULL,"
+            " description BLOB NOT NULL,"
+            " fetched_at REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _fresh(self, fetched_at, now=None):
+        return (now or time.time()) - fetched_at < self.ttl_seconds
+
+    def has(self, job_id, now=None):
+        """Whether a fresh entry exists, without counting a hit or miss"""
+        if job_id is None:
+            return False
+        row = self._conn.execute("SELECT fetched_at FROM job_details WHERE job_id = ?", (job_id,)).fetchone()
+        return bool(row) and self._fresh(row[0], now)
+
+    def get(self, job_id, now=None):
+        """Cached JobDetails for ``job_id``, or None if unknown or expired"""
+        if job_id is None:
+            return None
+        row = self._conn.execute(
+            "SELECT company, applicants_text, posted, description, fetched_at FROM job_details WHERE job_id = ?",
+            (job_id,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        if not self._fresh(row[4], now):
+            self.expired += 1
+            self.misses += 1
+            return None
+        self.hits += 1
+        company, applicants_text, posted, description, fetched_at = row
+        return JobDetails(job_id, zlib.decompress(description).decode('utf-8'), applicants_text, posted, company,
+                          fetched_at)
+
+    def put(self, details, now=None):
+        if details.job_id is None:
+            return
+        raw = (details.description or '').encode('utf-8')
+        compressed = zlib.compress(raw, 6)
+        self.raw_bytes += len(raw)
+        self.stored_bytes += len(compressed)
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO job_details (job_id, company, applicants_text, posted, description, fetched_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (details.job_id, details.company or '', details.applicants_text or '', details.posted or '',
+                 compressed, now or time.time())
+            )
+
+    def purge(self, now=None):
+        """Delete expired entries; returns how many were removed"""
+        with self._conn:
+            return self._conn.execute(
+                "DELETE FROM job_details WHERE fetched_at < ?", ((now or time.time()) - self.ttl_seconds,)
+            ).rowcount
+
+    def stats(self):
+        count, size = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(description)), 0) FROM job_details"
+        ).fetchone()
+        return count, size
+
+    def summary(self):
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups else 0.0
+        ratio = f", descriptions compressed to {self.stored_bytes / self.raw_bytes:.0%}" if self.raw_bytes else ""
+        return (f"Job detail cache: {self.hits} hits, {self.misses} misses ({self.expired} expired), "
+                f"{rate:.0f}% hit rate{ratio}")
+
+    def close(self):
+        self._conn.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Inspect or purge the shared job detail cache")
+    parser.add_argument('cache', nargs='?', default='job_details.db')
+    parser.add_argument('--ttl-hours', type=float, default=24)
+    parser.add_argument('--purge', action='store_true', help='Delete expired entries')
+    args = parser.parse_args()
+
+    cache = JobDetailCache(args.cache, ttl_hours=args.ttl_hours)
+    if args.purge:
+        print(f"Removed {cache.purge()} expired entries")
+    count, size = cache.stats()
+    print(f"{count} jobs cached, {size / 1024:.0f} KB of compressed descriptions")
+    cache.close()
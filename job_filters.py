@@ -0,0 +1,132 @@
+import re
+
+from company_blacklist import normalize_company
+from job_ids import clean_job_link
+
+
+def compile_keyword_pattern(keywords):
+    """One case-insensitive alternation for a list of substrings, or None if the list is empty"""
+    words = sorted({word.strip() for word in keywords or [] if word and word.strip()}, key=len, reverse=True)
+    if not words:
+        return None
+    return re.compile('|'.join(re.escape(word) for word in words), re.IGNORECASE)
+
+
+class FilterStats:
+    """How many jobs each filter stage dropped, and the click/wait time that saved"""
+
+    def __init__(self):
+        self.dropped = {}  # stage -> count
+        self.reasons = {}  # reason -> count
+        self.passed = 0
+        self.seconds_avoided = 0.0
+
+    def drop(self, stage, reason, seconds_avoided=0.0):
+        self.dropped[stage] = self.dropped.get(stage, 0) + 1
+        self.reasons[reason] = self.reasons.get(reason, 0) + 1
+        self.seconds_avoided += seconds_avoided
+
+    def merge(self, other):
+        for stage, count in other.dropped.items():
+            self.dropped[stage] = self.dropped.get(stage, 0) + count
+        for reason, count in other.reasons.items():
+            self.reasons[reason] = self.reasons.get(reason, 0) + count
+        self.passed += other.passed
+        self.seconds_avoided += other.seconds_avoided
+
+    def summary(self):
+        stages = ", ".join(f"{stage}: {count}" for stage, count in self.dropped.items()) or "none"
+        return f"Filtered out - {stages}; {self.passed} passed; ~{self.seconds_avoided:.0f}s of clicking and waiting avoided"
+
+
+class JobPrefilter:
+    """Staged skip rules for the job tiles of a results page.
+
+    Stage ``tile`` only needs data from the tile snapshot (title, company,
+    poster, link) and runs over the whole page before anything is clicked:
+    the title blacklist is one compiled regex and company/poster names are
+    looked up in normalized sets. Click-dependent stages (``applicants``,
+    ``job_fit``) report their drops through ``drop`` so every stage is
+    counted in ``stats``.
+
+    ``click_seconds`` is the expected cost of clicking a tile and waiting for
+    its description, used to estimate the time each tile-stage drop saved.
+    ``candidates`` is the run-wide CandidateRegistry: a posting the bot already
+    opened or skipped under any search in this run is skipped by job ID,
+    whether it was applied to, failed or was not Easy Apply.
+    """
+
+    TILE_STAGE = 'tile'
+    EVALUATED_REASON = "already evaluated earlier in this run"
+
+    def __init__(self, title_blacklist, poster_blacklist, is_company_blacklisted, is_static_company,
+                 seen_jobs, is_already_applied, click_seconds=4.0, candidates=None):
+        self.title_pattern = compile_keyword_pattern(title_blacklist)
+        self.poster_blacklist = {normalize_company(poster) for poster in poster_blacklist or []} - {""}
+        self.is_company_blacklisted = is_company_blacklisted
+        self.is_static_company = is_static_company
+        self.seen_jobs = seen_jobs
+        self.is_already_applied = is_already_applied
+        self.click_seconds = click_seconds
+        self.candidates = candidates
+        self.stats = FilterStats()
+
+    def tile_skip_reasons(self, tile):
+        """All tile-stage reasons to skip a job, empty if it should be opened"""
+        reasons = []
+        if self.is_company_blacklisted(tile.company):
+            reasons.append("company blacklisted (auto-blacklisted)")
+        elif self.is_static_company(tile.company):
+            reasons.append("company blacklisted (static)")
+        if normalize_company(tile.poster) in self.poster_blacklist:
+            reasons.append("poster blacklisted")
+        if self.title_pattern is not None and self.title_pattern.search(tile.title):
+            reasons.append("title contains blacklisted keywords")
+        if self.candidates is not None and self.candidates.evaluated_under(tile):
+            reasons.append(self.EVALUATED_REASON)
+        elif self.seen_jobs.seen_this_session(tile.link):
+            reasons.append("already seen in this session")
+        elif self.seen_jobs.seen_in_previous_run(tile.link):
+            reasons.append("already evaluated in a previous run")
+        if self.is_already_applied(tile.link):
+            reasons.append("already applied previously")
+        return reasons
+
+    def filter_page(self, tiles):
+        """Run the tile stage over a page; returns {tile index: [reasons]} for tiles to skip.
+
+        A job listed twice on the same page is only opened once.
+        """
+        skipped = {}
+        page_keys = set()
+        for tile in tiles:
+            reasons = self.tile_skip_reasons(tile)
+            key = tile.job_id if tile.job_id is not None else clean_job_link(tile.link)
+            if not reasons and key in page_keys:
+                reasons.append("already seen in this session")
+            page_keys.add(key)
+            if reasons == [self.EVALUATED_REASON]:
+                # Opened otherwise, so the skip saved a detail load if another search evaluated it
+                self.candidates.record_avoided(tile)
+            if reasons:
+                skipped[tile.index] = reasons
+                self.drop(self.TILE_STAGE, reasons[0], self.click_seconds)
+            else:
+                self.stats.passed += 1
+        return skipped
+
+    def recheck(self, tile):
+        """Tile rules whose answer can change while the page is processed (auto-blacklisted companies)"""
+        if self.is_company_blacklisted(tile.company):
+            self.stats.passed -= 1
+            self.drop(self.TILE_STAGE, "company blacklisted (auto-blacklisted)", self.click_seconds)
+            return ["company blacklisted (auto-blacklisted)"]
+        return []
+
+    def drop(self, stage, reason, seconds_avoided=0.0):
+        self.stats.drop(stage, reason, seconds_avoided)
+
+    def take_stats(self):
+        """Return the stats gathered since the last call and start new ones"""
+        stats, self.stats = self.stats, FilterStats()
+        return stats
@@ -0,0 +1,23 @@
+import re
+
+# LinkedIn exposes the numeric posting ID in a few URL shapes:
+#   https://www.linkedin.com/jobs/view/3912345678/?refId=...
+#   https://www.linkedin.com/jobs/view/senior-engineer-at-acme-3912345678
+#   https://www.linkedin.com/jobs/search/?currentJobId=3912345678&...
+_VIEW_ID_RE = re.compile(r'/jobs/view/(?:[^/?#]*?-)?(\d{6,})')
+_CURRENT_JOB_ID_RE = re.compile(r'[?&]currentJobId=(\d+)')
+
+
+def clean_job_link(link):
+    """Strip the query string from a job link, keeping only the base URL"""
+    return link.split('?')[0] if link else ""
+
+
+def extract_job_id(link):
+    """Return the numeric LinkedIn job ID found in a job URL, or None"""
+    if not link:
+        return None
+    match = _VIEW_ID_RE.search(link) or _CURRENT_JOB_ID_RE.search(link)
+    if match:
+        return int(match.group(1))
+    return None
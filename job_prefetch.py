@@ -0,0 +1,200 @@
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+PREFETCH_WINDOW = 'eab_prefetch'
+
+# Applicant counts as shown in the job top card, in English and Chinese
+APPLICANT_PATTERNS = [
+    r'(\d+)\s+applicants?',  # 英文: "2 applicants"
+    r'(\d+)\s*位申请者',      # 中文: "2 位申请者"
+    r'超过\s*(\d+)\s*位申请者',  # 中文: "超过 100 位申请者"
+    r'over\s*(\d+)\s*applicants',  # 英文: "over 100 applicants"
+    r'超过\s*(\d+)\s*位会员点击过"?申请"?',  # 中文: "超过 100 位会员点击过"申请""
+    r'over\s*(\d+)\s*people clicked apply'  # 英文: "Over 100 people clicked apply"
+]
+
+
+def parse_applicants_count(text):
+    """Applicant count from top card text, or None if it shows none"""
+    for pattern in APPLICANT_PATTERNS:
+        match = re.search(pattern, text or '')
+        if match:
+            return int(match.group(1))
+    return None
+
+
+# Opens (or reuses) the named prefetch window from the main tab. It is a popup
+# window rather than a tab so the search results tab stays visible and keeps
+# rendering; the handle is kept on the main tab's window object.
+OPEN_PREFETCH_JS = """
+const [url, name] = arguments;
+window.__eabPrefetch = window.open(url, name, 'popup,width=900,height=700');
+return !!window.__eabPrefetch;
+"""
+
+# Reads the prefetched job page from the main tab (both are on linkedin.com, so
+# the popup's DOM is reachable without switching the WebDriver context).
+# arguments[0] is the job ID.
+EXTRACT_PREFETCH_JS = """
+const jobId = arguments[0];
+const w = window.__eabPrefetch;
+if (!w || w.closed) return {state: 'missing'};
+let doc;
+try {
+    if (!w.location.href.includes(jobId)) return {state: 'loading'};
+    doc = w.document;
+} catch (error) {
+    return {state: 'loading'};
+}
+const text = selector => {
+    const el = doc.querySelector(selector);
+    return el ? (el.innerText || el.textContent || '').trim() : '';
+};
+const description = text('#job-details') || text('.jobs-description__content');
+if (!description) return {state: doc.readyState === 'complete' ? 'empty' : 'loading'};
+return {
+    state: 'ready',
+    description: description,
+    applicants_text: text('.job-details-jobs-unified-top-card__tertiary-description-container') ||
+                     text('.job-details-jobs-unified-top-card__primary-description-container'),
+};
+"""
+
+CLOSE_PREFETCH_JS = """
+const w = window.__eabPrefetch || window.open('', arguments[0]);
+if (w && !w.closed) w.close();
+"""
+
+
+class PrefetchedJob:
+    """Details of the next candidate job, read from the prefetch window"""
+
+    def __init__(self, job_id, title):
+        self.job_id = job_id
+        self.title = title
+        self.description = None
+        self.applicants_text = ''
+        self.fit_future = None
+        self.started = time.monotonic()
+        self.ready_after = None  # seconds from prefetch start until the details were read
+
+    @property
+    def applicants_count(self):
+        return parse_applicants_count(self.applicants_text)
+
+    def fit(self, timeout=30):
+        """Result of the fit evaluation started in the background, or None if it is unavailable"""
+        if self.fit_future is None:
+            return None
+        try:
+            return self.fit_future.result(timeout=timeout)
+        except Exception as e:
+            print(f"Background job fit evaluation failed: {e}")
+            return None
+
+
+class JobPrefetcher:
+    """Loads the next candidate's job page in a second window while the current job is applied to.
+
+    WebDriver runs one command at a time per session, so nothing here runs in
+    parallel with the main tab's commands: ``prefetch`` is a single
+    ``window.open`` from the main tab, after which the browser loads the page
+    on its own. ``poll`` reads the popup's DOM through the main tab (no window
+    switch) and is called cooperatively between the waiter's readiness
+    polls; once the description is in, the fit evaluation (an HTTP call that
+    never touches the driver) starts on a worker thread. ``take`` hands the
+    result over when the loop reaches that job.
+    """
+
+    def __init__(self, browser, evaluate_fit=None, poll_interval=0.5, take_timeout=3.0):
+        self.browser = browser
+        self.evaluate_fit = evaluate_fit
+        self.poll_interval = poll_interval
+        self.take_timeout = take_timeout
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='job-fit') if evaluate_fit else None
+        self.pending = None
+        self._last_poll = 0.0
+        self.started = 0
+        self.hits = 0
+        self.misses = 0
+        self.fit_overlapped = 0
+        self.seconds_ready_early = 0.0
+
+    def prefetch(self, tile):
+        if tile is None or tile.job_id is None:
+            return
+        if self.pending is not None and self.pending.job_id == tile.job_id:
+            return
+        try:
+            main_window = self.browser.current_window_handle
+            self.browser.execute_script(
+                OPEN_PREFETCH_JS, f"https://www.linkedin.com/jobs/view/{tile.job_id}/", PREFETCH_WINDOW
+            )
+            self.browser.switch_to.window(main_window)
+        except Exception as e:
+            print(f"Could not prefetch job {tile.job_id}: {e}")
+            self.pending = None
+            return
+        self.pending = PrefetchedJob(tile.job_id, tile.title)
+        self.started += 1
+
+    def _read(self, pending):
+        try:
+            result = self.browser.execute_script(EXTRACT_PREFETCH_JS, str(pending.job_id)) or {}
+            if result.get('state') != 'ready':
+                return
+            pending.description = result.get('description') or ''
+            pending.applicants_text = result.get('applicants_text') or ''
+            pending.ready_after = time.monotonic() - pending.started
+            if self.executor is not None:
+                # Raises RuntimeError once the executor is shut down; the fit is then evaluated inline
+                pending.fit_future = self.executor.submit(self.evaluate_fit, pending.title, pending.description)
+        except Exception:
+            return
+
+    def poll(self):
+        """Read the pending job if its page has loaded; cheap enough to call between waits"""
+        pending = self.pending
+        if pending is None or pending.description is not None:
+            return
+        now = time.monotonic()
+        if now - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = now
+        self._read(pending)
+
+    def take(self, tile):
+        """The prefetched details for ``tile``, or None if they were not prefetched or did not load in time"""
+        pending = self.pending
+        if pending is None or tile.job_id != pending.job_id:
+            return None
+        self.pending = None
+        deadline = time.monotonic() + self.take_timeout
+        while pending.description is None:
+            self._read(pending)
+            if pending.description is not None or time.monotonic() >= deadline:
+                break
+            time.sleep(0.2)
+        if pending.description is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.seconds_ready_early += max(0.0, time.monotonic() - pending.started - pending.ready_after)
+        if pending.fit_future is not None and pending.fit_future.done():
+            self.fit_overlapped += 1
+        return pending
+
+    def summary(self):
+        return (f"Prefetched {self.started} jobs: {self.hits} ready when reached, {self.misses} not loaded in time, "
+                f"{self.fit_overlapped} fit evaluations finished in the background, "
+                f"details ready ~{self.seconds_ready_early:.0f}s ahead in total")
+
+    def close(self):
+        self.pending = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+        try:
+            self.browser.execute_script(CLOSE_PREFETCH_JS, PREFETCH_WINDOW)
+        except Exception:
+            pass
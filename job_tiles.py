@@ -0,0 +1,246 @@
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import StaleElementReferenceException
+
+from job_ids import extract_job_id
+
+TILE_SELECTOR = 'li.scaffold-layout__list-item'
+
+# Reads every job tile of the results list in one round trip. arguments[0] is
+# the results <ul>; missing fields come back as empty strings instead of
+# costing an implicit wait each, and each row carries its <li> so the element
+# handle comes back in the same call.
+TILE_SNAPSHOT_JS = """
+const list = arguments[0] || document;
+const text = (root, selector) => {
+    const el = root.querySelector(selector);
+    return el ? (el.innerText || el.textContent || '').trim() : '';
+};
+return Array.from(list.querySelectorAll('li.scaffold-layout__list-item')).map((li, index) => {
+    const anchor = li.querySelector('a');
+    const strong = anchor ? anchor.querySelector('strong') : null;
+    const card = li.querySelector('[data-job-id]');
+    let poster = '';
+    for (const span of li.querySelectorAll('span')) {
+        const spanText = span.innerText || span.textContent || '';
+        const end = spanText.indexOf(' is hiring for this');
+        if (end !== -1) {
+            poster = spanText.slice(0, end).trim();
+            break;
+        }
+    }
+    return {
+        index: index,
+        element: li,
+        job_id: li.getAttribute('data-occludable-job-id') || (card ? card.getAttribute('data-job-id') : '') || '',
+        title: strong ? (strong.innerText || strong.textContent || '').trim() : '',
+        link: anchor ? anchor.href : '',
+        company: text(li, '.artdeco-entity-lockup__subtitle'),
+        location: text(li, '.job-card-container__metadata-item'),
+        poster: poster,
+        apply_method: text(li, '.job-card-container__apply-method'),
+    };
+});
+"""
+
+
+# Scrolls the results list until every tile is rendered. LinkedIn only fills
+# in the <li> elements near the viewport, so the list is stepped one screen at
+# a time; after each step a MutationObserver tells when rendering has settled
+# instead of sleeping a fixed time. Stops once every tile has content, the
+# tile count is stable and the bottom was reached, then scrolls back to top.
+MATERIALIZE_LIST_JS = """
+const [scroller, list, paceMinMs, paceMaxMs, quietMs, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const started = performance.now();
+let lastMutation = started;
+const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+observer.observe(list, {childList: true, subtree: true, characterData: true});
+const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+const tiles = () => Array.from(list.querySelectorAll('li.scaffold-layout__list-item'));
+const hydrated = li => !!li.querySelector('a[href]');
+const settle = async () => {
+    await sleep(quietMs);
+    const deadline = performance.now() + 2000;
+    while (performance.now() - lastMutation < quietMs && performance.now() < deadline) {
+        await sleep(quietMs / 3);
+    }
+    if (paceMaxMs > 0) {
+        await sleep(paceMinMs + Math.random() * (paceMaxMs - paceMinMs));
+    }
+};
+(async () => {
+    let steps = 0;
+    let previousCount = -1;
+    try {
+        while (performance.now() - started < timeoutMs) {
+            const items = tiles();
+            const pending = items.filter(li => !hydrated(li));
+            const atBottom = scroller.scrollTop + scroller.clientHeight >= scroller.scrollHeight - 2;
+            if (!pending.length && atBottom && items.length === previousCount) {
+                break;
+            }
+            previousCount = items.length;
+            if (!atBottom) {
+                scroller.scrollTop += Math.max(scroller.clientHeight, 200);
+            } else if (pending.length) {
+                pending[0].scrollIntoView({block: 'center'});
+            }
+            steps += 1;
+            await settle();
+        }
+        scroller.scrollTop = 0;
+    } finally {
+        observer.disconnect();
+    }
+    const items = tiles();
+    return {tiles: items.length, hydrated: items.filter(hydrated).length, steps: steps,
+            ms: Math.round(performance.now() - started)};
+})().then(done, error => done({error: String(error)}));
+"""
+
+
+def materialize_job_list(browser, scroller, list_element, pace=None, quiet_ms=150, timeout=15):
+    """Scroll the results list until all tiles are rendered; returns the script's report.
+
+    ``pace`` is an optional (min, max) seconds range added after every scroll
+    step for human-like scrolling. Raises if the script cannot run so callers
+    can fall back to fixed-step scrolling.
+    """
+    pace_min, pace_max = pace or (0, 0)
+    report = browser.execute_async_script(
+        MATERIALIZE_LIST_JS, scroller, list_element, pace_min * 1000, pace_max * 1000, quiet_ms, timeout * 1000
+    )
+    if not report or report.get('error'):
+        raise RuntimeError(f"List materialization failed: {report}")
+    return report
+
+
+class JobTile:
+    """Plain snapshot of one job tile on a search results page"""
+
+    def __init__(self, index, job_id=None, title="", link="", company="", location="", poster="", apply_method="",
+                 element=None):
+        self.index = index
+        self.element = element
+        self.job_id = job_id
+        self.title = title
+        self.link = link
+        self.company = company
+        self.location = location
+        self.poster = poster
+        self.apply_method = apply_method
+
+    @classmethod
+    def from_snapshot(cls, data):
+        link = data.get('link') or ""
+        job_id = data.get('job_id')
+        job_id = int(job_id) if job_id and str(job_id).isdigit() else extract_job_id(link)
+        return cls(
+            index=data.get('index', 0),
+            job_id=job_id,
+            title=data.get('title') or "",
+            link=link,
+            company=data.get('company') or "",
+            location=data.get('location') or "",
+            poster=data.get('poster') or "",
+            apply_method=data.get('apply_method') or "",
+            element=data.get('element'),
+        )
+
+    def __repr__(self):
+        return f"JobTile({self.index}, {self.job_id}, {self.title!r} at {self.company!r})"
+
+
+def _read_tile_element(index, tile_element):
+    """Old per-field extraction, only used when the snapshot script fails"""
+    fields = {'index': index}
+    lookups = [
+        ('title', lambda: tile_element.find_element(By.TAG_NAME, 'a').find_element(By.TAG_NAME, 'strong').text),
+        ('link', lambda: tile_element.find_element(By.TAG_NAME, 'a').get_attribute('href')),
+        ('company', lambda: tile_element.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text),
+        ('location', lambda: tile_element.find_element(By.CLASS_NAME, 'job-card-container__metadata-item').text),
+        ('apply_method', lambda: tile_element.find_element(By.CLASS_NAME, 'job-card-container__apply-method').text),
+        ('job_id', lambda: tile_element.get_attribute('data-occludable-job-id')),
+    ]
+    for name, lookup in lookups:
+        try:
+            fields[name] = lookup()
+        except Exception:
+            pass
+    try:
+        hiring_text = tile_element.find_element(By.XPATH, './/span[contains(.,\' is hiring for this\')]').text
+        name_terminating_index = hiring_text.find(' is hiring for this')
+        if name_terminating_index != -1:
+            fields['poster'] = hiring_text[:name_terminating_index]
+    except Exception:
+        pass
+    fields['element'] = tile_element
+    return JobTile.from_snapshot(fields)
+
+
+def snapshot_job_tiles(browser, list_element=None):
+    """Return a ``JobTile`` for every tile in the results list.
+
+    Uses a single ``execute_script`` call; if the script fails the tiles are
+    read element by element as before, scoped to each tile.
+    """
+    try:
+        rows = browser.execute_script(TILE_SNAPSHOT_JS, list_element)
+        return [JobTile.from_snapshot(row) for row in rows or []]
+    except Exception as e:
+        print(f"Tile snapshot script failed, reading tiles one by one: {e}")
+    root = list_element if list_element is not None else browser
+    return [_read_tile_element(index, element) for index, element in enumerate(root.find_elements(By.CSS_SELECTOR, TILE_SELECTOR))]
+
+
+def resolve_tile_element(browser, tile, list_element=None):
+    """Find the WebElement for a snapshot tile, by job ID when it is known"""
+    if tile.job_id is not None:
+        matches = browser.find_elements(By.CSS_SELECTOR, f'li[data-occludable-job-id="{tile.job_id}"]')
+        if matches:
+            return matches[0]
+    root = list_element if list_element is not None else browser
+    tiles = root.find_elements(By.CSS_SELECTOR, TILE_SELECTOR)
+    if tile.index < len(tiles):
+        return tiles[tile.index]
+    raise LookupError(f"Job tile {tile!r} is no longer on the page")
+
+
+class TileHandles:
+    """Element handles for the tiles of one results page, keyed by job ID.
+
+    Handles come from the snapshot call, so a tile costs no lookup until the
+    page re-renders it; only then (``StaleElementReferenceException``) is it
+    re-resolved by job ID. ``lookups`` counts those extra round trips.
+    """
+
+    def __init__(self, browser, tiles, list_element=None):
+        self.browser = browser
+        self.list_element = list_element
+        self._handles = {self._key(tile): tile.element for tile in tiles if tile.element is not None}
+        self.lookups = 0
+
+    @staticmethod
+    def _key(tile):
+        return tile.job_id if tile.job_id is not None else ('index', tile.index)
+
+    def get(self, tile):
+        handle = self._handles.get(self._key(tile))
+        return handle if handle is not None else self.refresh(tile)
+
+    def refresh(self, tile):
+        """Re-resolve a tile whose handle went stale"""
+        self.lookups += 1
+        handle = resolve_tile_element(self.browser, tile, self.list_element)
+        self._handles[self._key(tile)] = handle
+        return handle
+
+    def call(self, tile, action, max_retries=3):
+        """Run ``action(element)`` on a tile, re-resolving it by ID when it went stale"""
+        for attempt in range(max_retries):
+            element = self.get(tile) if attempt == 0 else self.refresh(tile)
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                if attempt == max_retries - 1:
+                    raise
@@ -0,0 +1,51 @@
+import re
+
+
+def _trie_pattern(words):
+    """Regex source matching any of ``words``, nested like a trie so each position branches on one character"""
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char != '']
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        return '(?:' + body + ')?' if '' in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """Finds every keyword of a fixed set that occurs in a text, in one scan.
+
+    The keywords are compiled into a single regex shaped like a trie and
+    scanned with a zero-width lookahead, so matching runs in the regex engine
+    and overlapping keywords are all found: at each position the longest
+    keyword starting there is reported, together with the shorter keywords
+    that are prefixes of it. Matching is case-insensitive (keywords and text
+    are compared casefolded).
+    """
+
+    def __init__(self, keywords):
+        self.keywords = list(dict.fromkeys(keyword.casefold() for keyword in keywords if keyword))
+        self._pattern = re.compile('(?=(' + _trie_pattern(self.keywords) + '))') if self.keywords else None
+        # Keywords that are prefixes of a longer keyword found at the same position
+        self._prefixes = {}
+        for keyword in self.keywords:
+            shorter = [other for other in self.keywords if other != keyword and keyword.startswith(other)]
+            if shorter:
+                self._prefixes[keyword] = shorter
+
+    def find(self, text):
+        """The set of keywords occurring in ``text``"""
+        if self._pattern is None or not text:
+            return set()
+        found = set(self._pattern.findall(text.casefold()))
+        for keyword in [keyword for keyword in found if keyword in self._prefixes]:
+            found.update(self._prefixes[keyword])
+        return found
@@ -4,6 +4,23 @@ import re
 import openai
 
 
+def to_result(answer, response_type, options=None):
+    """Convert the model's text answer to the value returned for ``response_type``"""
+    if response_type == "numeric":
+        # Extract first number from response
+        numbers = re.findall(r'\d+', str(answer))
+        return int(numbers[0]) if numbers else 0
+    if response_type == "choice":
+        # Extract the index number from the response; ensure index is within valid range
+        numbers = re.findall(r'\d+', str(answer))
+        if numbers and options:
+            index = int(numbers[0])
+            if 0 <= index < len(options):
+                return index
+        return None
+    return str(answer).strip()
+
+
 def lambda_handler(event, context):
     """
     Lambda function to handle AI response generation
@@ -125,28 +142,7 @@ Important rules:
 
         answer = response.choices[0].message.content.strip()
 
-        # Process different types of responses
-        if response_type == "numeric":
-            # Extract first number from response
-            numbers = re.findall(r'\d+', answer)
-            if numbers:
-                result = int(numbers[0])
-            else:
-                result = 0
-        elif response_type == "choice":
-            # Extract the index number from the response
-            numbers = re.findall(r'\d+', answer)
-            if numbers and options:
-                index = int(numbers[0])
-                # Ensure index is within valid range
-                if 0 <= index < len(options):
-                    result = index
-                else:
-                    result = None
-            else:
-                result = None
-        else:
-            result = answer
+        result = to_result(answer, response_type, options)
 
         # Return success response
         return {
@@ -169,4 +165,138 @@ Important rules:
                 'error': str(e),
                 'status': 'error'
             })
-        }
\ No newline at end of file
+        }
+
+
+BATCH_SYSTEM_PROMPT = """
+You are an intelligent AI assistant filling out a job application form for the candidate and answer like a human.
+You get several questions at once. Answer every question based on the candidate information, following its type:
+
+- "text": if the question asks for years, a duration or a numeric value, only a number; if it is a Yes/No question,
+  only "Yes" or "No"; otherwise a single-sentence or well-structured answer under 350 characters that does not
+  repeat the question.
+- "numeric": a single number, no explanation.
+- "choice": only the index number of the best option. Never select placeholder options like "Select an option",
+  only select "Yes" with explicit evidence, and when in doubt choose the most conservative valid option.
+
+Return a JSON object {"answers": [{"id": <question id>, "answer": <answer>}, ...]} with one entry per question.
+"""
+
+
+def batch_lambda_handler(event, context):
+    """
+    Lambda function answering all questions of one form step in a single request
+
+    Request format:
+    {
+        "context": "Personal information and resume content...",
+        "questions": [
+            {"id": 0, "question": "Application question", "response_type": "text/numeric/choice",
+             "options": [Optional for choice type, list of [index, text]]}
+        ],
+        "max_tokens": 3000,
+        "debug": false
+    }
+
+    Response format:
+    {
+        "results": [{"id": 0, "result": "Generated response"}],
+        "status": "success"
+    }
+
+    Questions the model leaves out of its answer get "result": null; the
+    client asks those one at a time through the single-question endpoint, so
+    this request never runs longer than one model call.
+    """
+    try:
+        if 'questions' in event:
+            body = event
+        elif 'body' in event:
+            body = json.loads(event.get('body', '{}')) if isinstance(event.get('body'), str) else event.get('body', {})
+        else:
+            return {
+                'statusCode': 400,
+                'body': json.dumps({
+                    'error': 'Could not find parameters in request',
+                    'event': event
+                })
+            }
+
+        user_api_key = body.get('openai_api_key', None)
+        candidate_context = body.get('context', '')
+        questions = body.get('questions') or []
+        max_tokens = int(body.get('max_tokens', 3000))
+
+        api_key = user_api_key or os.environ.get('OPENAI_API_KEY')
+        if not api_key:
+            return {
+                'statusCode': 400,
+                'body': json.dumps({
+                    'error': 'OpenAI API key not configured'
+                })
+            }
+
+        if not questions or any(not question.get('question') for question in questions):
+            return {
+                'statusCode': 400,
+                'body': json.dumps({
+                    'error': 'Missing questions parameter'
+                })
+            }
+
+        openai_client = openai.OpenAI(api_key=api_key)
+
+        questions_text = []
+        for question in questions:
+            line = f"[{question['id']}] ({question.get('response_type', 'text')}) {question['question']}"
+            if question.get('response_type') == 'choice' and question.get('options'):
+                line += "\n" + "\n".join(f"    {idx}: {text}" for idx, text in question['options'])
+            questions_text.append(line)
+        user_content = (f"Using this candidate's background and resume:\n{candidate_context}\n\n"
+                        f"Answer these job application questions:\n" + "\n".join(questions_text))
+
+        response = openai_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": user_content}
+            ],
+            max_tokens=max_tokens,
+            temperature=0.7,
+            response_format={"type": "json_object"}
+        )
+
+        try:
+            answers = json.loads(response.choices[0].message.content).get('answers', [])
+            answers = {str(item.get('id')): item.get('answer') for item in answers if isinstance(item, dict)}
+        except (ValueError, AttributeError):
+            answers = {}
+
+        results = []
+        for question in questions:
+            response_type = question.get('response_type', 'text')
+            options = question.get('options')
+            answer = answers.get(str(question['id']))
+            result = None if answer is None else to_result(answer, response_type, options)
+            results.append({'id': question['id'], 'result': result})
+
+        return {
+            'statusCode': 200,
+            'headers': {
+                'Content-Type': 'application/json',
+                'Access-Control-Allow-Origin': '*'
+            },
+            'body': json.dumps({
+                'results': results,
+                'status': 'success'
+            })
+        }
+
+    except Exception as e:
+        return {
+            'statusCode': 500,
+            'body': json.dumps({
+                'error': str(e),
+                'status': 'error'
+            })
+        }
@@ -1,4 +1,4 @@
-import time, random, csv, pyautogui, traceback, os, re, json, requests, logging
+import time, random, pyautogui, traceback, os, re, json, requests, logging
 import sys
 import io
 
@@ -7,11 +7,11 @@ if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', line_buffering=True)
 
 from urllib.parse import urlparse, parse_qs
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
-from selenium.common.exceptions import StaleElementReferenceException
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
@@ -19,11 +19,36 @@ from selenium.webdriver.support.ui import Select
 from datetime import date, datetime
 from itertools import product
 
+from applied_jobs_store import AppliedJobsStore, MemoryAppliedJobsStore, open_applied_jobs_store
+from company_blacklist import CompanyBlacklistIndex
+from seen_jobs import SeenJobs
+from persistence import WriteBehindWriter
+from job_ids import clean_job_link
+from question_catalog import UnpreparedQuestionCatalog
+from event_journal import EventJournal, PhaseTimer
+from job_tiles import snapshot_job_tiles, TileHandles, materialize_job_list
+from job_filters import JobPrefilter, FilterStats
+from page_probes import PageProbe, PageState
+from form_schema import extract_form_schema, find_question_element
+from geo_cache import GeoIdCache
+from search_planner import SearchPlanner, filters_signature
+from pagination import PaginationController, stop_reason_for, POSITION_TARGET
+from incremental_search import SearchCheckpoints
+from candidate_registry import CandidateRegistry
+from job_prefetch import JobPrefetcher, parse_applicants_count
+from job_detail_cache import JobDetailCache, JobDetails, JOB_DETAILS_JS, parse_posted
+from question_rules import QuestionRuleEngine
+from custom_questions import CustomQuestionMatcher
+from answer_cache import AnswerCache, answer_key
+from wait_engine import AdaptiveWaiter, JOB_DETAILS_READY, MODAL_OPEN, MODAL_STEP_CHANGED, UPLOAD_FINISHED, \
+    POST_APPLY_READY, CONFIRM_DIALOG_OPEN, MODAL_CLOSED, TYPEAHEAD_READY, URL_HAS_GEO_ID
+
 # 添加CloudAIResponseGenerator类
 class CloudAIResponseGenerator:
     """基于AWS Lambda的AI响应生成器，将请求发送到AWS API Gateway处理"""
     
-    def __init__(self, api_key=None, personal_info=None, experience=None, languages=None, resume_path=None, text_resume_path=None,customQuestions={}, debug=False, job_fit_prompt='', eeo=None):
+    def __init__(self, api_key=None, personal_info=None, experience=None, languages=None, resume_path=None, text_resume_path=None,customQuestions={}, debug=False, job_fit_prompt='', eeo=None, answer_cache=None,
+                 ai_workers=0, ai_timeout=75):
         """
         初始化云端AI响应生成器
         
@@ -40,6 +65,16 @@ class CloudAIResponseGenerator:
         self.openai_api_key = api_key  # 保存用户提供的OpenAI API密钥
         self.job_fit_prompt = job_fit_prompt  # 添加自定义提示词参数
         self.eeo = eeo or {}  # 添加EEO信息参数
+        self.answer_cache = answer_cache  # AnswerCache，相同问题不再重复调用云端API
+        self._batched = {}  # generate_responses批量得到的回答，按answer_key索引
+
+        # 并发回答：表单中需要AI的问题先提交到线程池，填写其他字段时在后台请求
+        self.ai_workers = ai_workers  # 最大并发请求数，0表示不并发
+        self.ai_timeout = ai_timeout  # 每次请求从开始执行起最多等待的秒数，应不少于云端API请求的60秒超时
+        self._executor = None
+        self._futures = {}  # answer_key -> (future, 开始执行时间记录)
+        self._batch_future = None
+        self.dispatch_stats = {'submitted': 0, 'ready': 0, 'waited': 0, 'timeouts': 0, 'errors': 0}
 
         self.customQuestions = customQuestions
         
@@ -257,7 +292,225 @@ class CloudAIResponseGenerator:
         """
         try:
             context = self._build_context()
+            key = answer_key(question_text, response_type, options, context)
+            dispatched = key in self._futures
+            if dispatched:
+                future, call = self._futures.pop(key)
+                answer = self._wait(future, call)
+                if future is not self._batch_future:
+                    # 超时或出错时返回None，由调用方使用原有的后备答案
+                    return answer
+            batched = self._batched.pop(key, None)
+            if batched is not None:
+                print(f"AI response {response_type} (batch): {batched}")
+                return batched
+            if dispatched:
+                # 批量请求超时、失败或漏答的问题单独请求，同样受每次请求的超时限制
+                return self._wait(*self._submit(self._answer, context, question_text, response_type, options,
+                                                max_tokens))
+            return self._answer(context, question_text, response_type, options, max_tokens)
+
+        except Exception as e:
+            print(f"生成回答时出错: {str(e)}")
+            return None
+
+    def _answer(self, context, question_text, response_type, options, max_tokens=3000):
+        """先查回答缓存，未命中时请求云端API并写入缓存"""
+        if self.answer_cache:
+            cached = self.answer_cache.get(question_text, response_type, options, context)
+            if cached is not None:
+                print(f"AI response {response_type} (cached): {cached}")
+                return cached
+
+        started = time.time()
+        answer = self._request_response(context, question_text, response_type, options, max_tokens)
+        if self.answer_cache and answer is not None:
+            self.answer_cache.put(question_text, response_type, answer, options, context,
+                                  latency=time.time() - started)
+        return answer
+
+    def submit_responses(self, ai_requests, batch=False, max_tokens=3000):
+        """
+        把表单当前步骤中需要AI的问题提交到线程池，立即返回
+
+        Args:
+            ai_requests: (问题, 回答类型, 选项) 元组列表，格式与generate_response的参数相同
+            batch: 为True且问题多于一个时，在后台发送一次批量请求（见generate_responses）
+
+        随后对同一问题调用generate_response时等待对应的结果，每次请求从开始执行起最多等待ai_timeout秒
+        （在线程池中排队的时间不计入）；超时或出错时返回None，调用方使用原有的后备答案。
+        批量请求超时或失败时，各问题改为单独请求。
+
+        Returns:
+            int: 提交的问题数，未启用并发时为0
+        """
+        if not self.ai_workers or not ai_requests:
+            return 0
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.ai_workers, thread_name_prefix='ai-answer')
+        self.discard_pending()
+        context = self._build_context()
+        batch_call = None
+        if batch and len(ai_requests) > 1:
+            self._batch_future, batch_call = self._submit(self.generate_responses, ai_requests, max_tokens)
+        for question_text, response_type, options in ai_requests:
+            key = answer_key(question_text, response_type, options, context)
+            if key in self._futures:
+                continue
+            if self._batch_future is not None:
+                self._futures[key] = (self._batch_future, batch_call)
+            else:
+                self._futures[key] = self._submit(self._answer, context, question_text, response_type, options,
+                                                  max_tokens)
+        self.dispatch_stats['submitted'] += len(self._futures)
+        return len(self._futures)
+
+    def _submit(self, fn, *args):
+        """提交到线程池；返回(future, call)，call['started']记录请求开始执行的时间"""
+        call = {'started': None}
+
+        def run():
+            call['started'] = time.time()
+            return fn(*args)
+
+        return self._executor.submit(run), call
+
+    def _wait(self, future, call):
+        """等待后台请求的结果，最多到请求开始执行后ai_timeout秒；超时或出错时返回None"""
+        if future.done():
+            self.dispatch_stats['ready'] += 1
+        else:
+            self.dispatch_stats['waited'] += 1
+        try:
+            while True:
+                started = call['started']
+                if started is not None:
+                    return future.result(timeout=max(0.0, started + self.ai_timeout - time.time()))
+                try:
+                    # 仍在排队：等到它开始执行（或完成），再按开始时间计算超时
+                    return future.result(timeout=0.1)
+                except FutureTimeoutError:
+                    continue
+        except FutureTimeoutError:
+            self.dispatch_stats['timeouts'] += 1
+            future.cancel()
+            print(f"AI请求开始后超过{self.ai_timeout}秒未返回")
+        except Exception as e:
+            self.dispatch_stats['errors'] += 1
+            print(f"后台AI请求出错: {str(e)}")
+        return None
+
+    def discard_pending(self):
+        """丢弃未被取用的后台请求（例如表单步骤被跳过时）"""
+        for future, _ in self._futures.values():
+            future.cancel()
+        self._futures = {}
+        self._batch_future = None
+
+    def dispatch_summary(self):
+        stats = self.dispatch_stats
+        return (f"AI dispatcher: {stats['submitted']} questions submitted, {stats['ready']} ready when needed, "
+                f"{stats['waited']} waited on, {stats['timeouts']} timed out, {stats['errors']} failed")
+
+    def close(self):
+        self.discard_pending()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _parse_answer(self, answer, response_type, options):
+        """把API返回的结果转换为对应的回答类型"""
+        if response_type == "numeric":
+            # 如果返回的不是数字，尝试从回答中提取数字
+            if not isinstance(answer, (int, float)):
+                numbers = re.findall(r'\d+', str(answer))
+                if numbers:
+                    return int(numbers[0])
+                return 0
+            return answer
+        elif response_type == "choice":
+            # 确保返回的索引在有效范围内
+            if isinstance(answer, int) and options and 0 <= answer < len(options):
+                return answer
+            return None
+
+        return answer
+
+    def generate_responses(self, ai_requests, max_tokens=3000):
+        """
+        一次请求批量回答表单当前步骤中所有需要AI的问题
+
+        Args:
+            ai_requests: (问题, 回答类型, 选项) 元组列表，格式与generate_response的参数相同
+
+        结果保存在本地，随后对同一问题调用generate_response时直接返回，不再单独请求API。
+        批量接口失败或漏答的问题仍由generate_response逐个请求。
+
+        Returns:
+            int: 批量得到回答的问题数
+        """
+        self._batched = {}
+        try:
+            context = self._build_context()
+            pending = {}  # answer_key -> (问题, 回答类型, 选项)
+            for question_text, response_type, options in ai_requests:
+                key = answer_key(question_text, response_type, options, context)
+                if key in self._batched or key in pending:
+                    continue
+                if self.answer_cache:
+                    cached = self.answer_cache.get(question_text, response_type, options, context)
+                    if cached is not None:
+                        self._batched[key] = cached
+                        continue
+                pending[key] = (question_text, response_type, options)
+            if len(pending) < 2:
+                # 单个问题走普通接口即可
+                return 0
 
+            request_data = {
+                "context": context,
+                "questions": [
+                    dict({"id": i, "question": question_text, "response_type": response_type},
+                         **({"options": options} if response_type == "choice" and options else {}))
+                    for i, (question_text, response_type, options) in enumerate(pending.values())
+                ],
+                "max_tokens": max_tokens,
+                "debug": self.debug
+            }
+            started = time.time()
+            response_data = self._call_cloud_api("generate-responses", request_data)
+            if not response_data or not isinstance(response_data.get("results"), list):
+                print("批量回答失败，将逐个请求AI回答")
+                return 0
+            latency = (time.time() - started) / len(pending)
+            pending = list(pending.items())
+
+            answered = 0
+            for item in response_data["results"]:
+                try:
+                    key, (question_text, response_type, options) = pending[int(item.get("id"))]
+                except (TypeError, ValueError, IndexError):
+                    continue
+                if item.get("result") is None:
+                    # 批量接口漏答的问题，随后由generate_response单独请求（数字类型不能被解析成0）
+                    continue
+                answer = self._parse_answer(item.get("result"), response_type, options)
+                if answer is None:
+                    continue
+                self._batched[key] = answer
+                answered += 1
+                if self.answer_cache:
+                    self.answer_cache.put(question_text, response_type, answer, options, context, latency=latency)
+            print(f"AI answered {answered}/{len(pending)} questions in one batch request ({time.time() - started:.1f}s)")
+            return answered
+
+        except Exception as e:
+            print(f"批量生成回答时出错: {str(e)}")
+            return 0
+
+    def _request_response(self, context, question_text, response_type, options, max_tokens):
+        """调用云端API回答一个问题，并把结果转换为对应的回答类型"""
+        try:
             # 准备发送到云端API的数据
             request_data = {
                 "context": context,
@@ -289,23 +542,7 @@ class CloudAIResponseGenerator:
 
             answer = response_data["result"]
             print(f"AI response {response_type}: {answer}")
-
-            if response_type == "numeric":
-                # 如果返回的不是数字，尝试从回答中提取数字
-                import re
-                if not isinstance(answer, (int, float)):
-                    numbers = re.findall(r'\d+', str(answer))
-                    if numbers:
-                        return int(numbers[0])
-                    return 0
-                return answer
-            elif response_type == "choice":
-                # 确保返回的索引在有效范围内
-                if isinstance(answer, int) and options and 0 <= answer < len(options):
-                    return answer
-                return None
-
-            return answer
+            return self._parse_answer(answer, response_type, options)
 
         except Exception as e:
             print(f"生成回答时出错: {str(e)}")
@@ -385,17 +622,30 @@ class LinkedinEasyApply:
         self.title_blacklist = parameters.get('titleBlacklist', []) or []
         self.poster_blacklist = parameters.get('posterBlacklist', []) or []
 
+        # Page state checks read only the banner/modal regions instead of page_source
+        self.page_probe = PageProbe(self.browser)
+
+        # State files are written behind the apply loop on a background thread
+        self.state_writer = WriteBehindWriter(
+            flush_interval=parameters.get('stateFlushSeconds', 5),
+            max_pending=parameters.get('stateFlushMaxPending', 50)
+        )
+
         # Duplicate application prevention configuration
         self.avoid_duplicate_applications = parameters.get('avoidDuplicateApplications', True)
         self.reapply_days = parameters.get('reapplyDays', 30)  # 多少天后可以重新投递
         self.applied_jobs_file = parameters.get('appliedJobsFile', 'applied_jobs.json')
-        self.applied_jobs = {}  # Store applied job records with dates
+        self.applied_jobs_backend = parameters.get('appliedJobsStore', 'sqlite')  # sqlite/json
+        self.applied_jobs = MemoryAppliedJobsStore()  # Store applied job records with dates
         
         # Auto blacklist applied companies configuration
         self.auto_blacklist_companies = parameters.get('autoBlacklistAppliedCompanies', False)  # 是否自动将投递成功的公司加入黑名单
         self.company_blacklist_days = parameters.get('companyBlacklistDays', 30)  # 公司黑名单天数，默认30天
         self.company_blacklist_file = parameters.get('companyBlacklistFile', 'company_blacklist.json')  # 公司黑名单文件
-        self.company_blacklist_with_dates = {}  # Store company blacklist with dates: {company_name: date_string}
+        self.company_blacklist_index = CompanyBlacklistIndex(
+            self.company_blacklist_file, self.company_blacklist_days, static_companies=self.company_blacklist,
+            writer=self.state_writer
+        )
 
         # Start from specific page configuration
         self.start_from_page = max(1, int(parameters.get('startFromPage', 1)))  # Minimum page 1
@@ -418,10 +668,41 @@ class LinkedinEasyApply:
         self.locations = [loc.strip() for loc in raw_locations if loc and loc.strip()]
 
         self.residency = parameters.get('residentStatus', [])
+        # Location -> geoId cache shared by all users, so a known location needs no search box round trip
+        self.geo_cache = GeoIdCache(
+            parameters.get('geoIdCacheFile', 'geo_ids.db'), ttl_days=parameters.get('geoIdCacheDays', 30)
+        )
+        self.pre_resolve_geo_ids = parameters.get('preResolveGeoIds', False)
         self.base_search_url = self.get_base_search_url(parameters)
-        self.seen_jobs = []
+        # Jobs evaluated in this session, optionally persisted so later runs skip them without clicking
+        self.persist_seen_jobs = parameters.get('persistSeenJobs', False)
+        self.seen_jobs_file = parameters.get(
+            'seenJobsFile',
+            os.path.splitext(self.applied_jobs_file)[0].replace('applied_jobs', 'seen_jobs') + '.bin'
+        )
+        self.seen_jobs = SeenJobs(self.seen_jobs_file if self.persist_seen_jobs else None, writer=self.state_writer)
+        if self.persist_seen_jobs:
+            print(f"Loaded {self.seen_jobs.previous_run_count} jobs seen in previous runs "
+                  f"({self.seen_jobs.memory_usage() / 1024:.1f} KB)")
         self.file_name = "output"
         self.unprepared_questions_file_name = "unprepared_questions"
+        self.unprepared_questions = UnpreparedQuestionCatalog(
+            self.unprepared_questions_file_name + ".json", writer=self.state_writer
+        )
+        self.current_job_id = None  # Job being processed, recorded with unprepared questions
+        # One JSONL event per job tile with the decision and per-phase timings
+        self.event_journal_enabled = parameters.get('eventJournal', True)
+        self.event_journal_file = parameters.get(
+            'eventJournalFile',
+            os.path.splitext(self.applied_jobs_file)[0].replace('applied_jobs', 'events') + '.jsonl'
+        )
+        self.event_journal = EventJournal(
+            self.event_journal_file,
+            writer=self.state_writer,
+            max_bytes=int(parameters.get('eventJournalMaxMB', 10) * 1024 * 1024)
+        ) if self.event_journal_enabled else None
+        self.job_timer = PhaseTimer()
+        self.current_search = {}
         self.output_file_directory = parameters['outputFileDirectory']
         self.resume_dir = parameters['uploads']['resume']
         self.text_resume = parameters.get('textResume', '')
@@ -448,6 +729,10 @@ class LinkedinEasyApply:
         self.debug = parameters.get('debug', False)
         self.evaluate_job_fit = parameters.get('evaluateJobFit', False)
         self.customQuestions = parameters.get('customQuestions', {})
+        # main.py passes configPath so entries added in the GUI apply without a restart
+        self.custom_questions = CustomQuestionMatcher(self.customQuestions, config_path=parameters.get('configPath'))
+        self.batch_ai_answers = parameters.get('batchAiAnswers', False)
+        self.question_rules = QuestionRuleEngine()  # keyword rules compiled once for all form questions
         self.jobFitPrompt = parameters.get('jobFitPrompt', '')  # 添加自定义提示词参数
 
         self.workExperiences = parameters.get('workExperiences', [])
@@ -455,6 +740,56 @@ class LinkedinEasyApply:
 
         self.speed_mode = parameters.get('speed_mode', 'slow') # slow/fast
         self.FastMode = True if self.speed_mode == 'fast' else False
+        self.list_scroll_pacing = parameters.get('listScrollPacing', 'auto')  # auto/human
+        # Waits end when the page is ready, but never before a human-like jitter floor
+        self.waiter = AdaptiveWaiter(
+            self.browser, jitter=parameters.get('waitJitter') or ((0.2, 0.5) if self.FastMode else (0.5, 1.0))
+        )
+
+        # Skip rules that only need tile data run over the whole page before any click
+        click_seconds = 1.5 if self.FastMode else 4.0  # mean sleep after clicking a tile
+        self.candidates = CandidateRegistry(click_seconds=click_seconds)  # every posting any search listed this run
+        self.prefilter = JobPrefilter(
+            self.title_blacklist, self.poster_blacklist,
+            is_company_blacklisted=self.is_company_blacklisted,
+            is_static_company=self.company_blacklist_index.is_static,
+            seen_jobs=self.seen_jobs,
+            is_already_applied=lambda link: self.is_job_already_applied(link, silent=True),
+            click_seconds=click_seconds,
+            candidates=self.candidates
+        )
+        self.filter_stats = FilterStats()  # totals for the whole run
+
+        # Per-search yield kept across runs orders the searches and caps how deep each one is walked
+        self.search_planner = SearchPlanner(
+            parameters.get(
+                'searchStatsFile',
+                os.path.splitext(self.applied_jobs_file)[0].replace('applied_jobs', 'search_stats') + '.json'
+            ),
+            filters=filters_signature(self.base_search_url),
+            exploration=parameters.get('searchExplorationFraction', 0.2),
+            max_pages=parameters.get('searchMaxPages') or None,
+            writer=self.state_writer
+        ) if parameters.get('searchPlanner', True) else None
+        # Incremental mode: each search only covers the time since it last completed, plus an overlap
+        self.search_checkpoints = SearchCheckpoints(
+            parameters.get(
+                'searchCheckpointsFile',
+                os.path.splitext(self.applied_jobs_file)[0].replace('applied_jobs', 'search_checkpoints') + '.json'
+            ),
+            filters=filters_signature(self.base_search_url),
+            overlap_seconds=int(parameters.get('incrementalOverlapMinutes', 60) * 60),
+            writer=self.state_writer
+        ) if parameters.get('incrementalSearch', False) else None
+        # Stops a search after a run of result pages where every tile was filtered out
+        self.pagination = PaginationController(max_zero_pages=parameters.get('maxZeroYieldPages', 2))
+
+        # AI answers are cached per question, option set and candidate context, shared by all bot processes
+        self.answer_cache = AnswerCache(
+            parameters.get('aiAnswerCacheFile', 'ai_answers.db'),
+            ttl_days=parameters.get('aiAnswerCacheDays', 30),
+            max_entries=parameters.get('aiAnswerCacheSize', 5000)
+        ) if parameters.get('aiAnswerCache', True) else None
 
         print("Using cloud AI services")
         self.ai_response_generator = CloudAIResponseGenerator(
@@ -467,9 +802,26 @@ class LinkedinEasyApply:
             customQuestions=self.customQuestions,
             job_fit_prompt=self.jobFitPrompt,  # 传递自定义提示词
             eeo=self.eeo,  # 传递EEO信息
+            answer_cache=self.answer_cache,
+            ai_workers=parameters.get('aiConcurrency', 3),
+            ai_timeout=parameters.get('aiAnswerTimeout', 75),
             debug=self.debug
         )
 
+        # Job descriptions and applicant counts shared by all users, so filters can run without a click
+        self.job_detail_cache = JobDetailCache(
+            parameters.get('jobDetailCacheFile', 'job_details.db'), ttl_hours=parameters.get('jobDetailCacheHours', 24)
+        ) if parameters.get('jobDetailCache', True) else None
+
+        # Pipelined mode: the next candidate loads in a second window while the current one is applied to
+        self.prefetcher = None
+        if parameters.get('pipelinedApply', False):
+            self.prefetcher = JobPrefetcher(
+                self.browser,
+                evaluate_fit=self.ai_response_generator.evaluate_job_fit if self.evaluate_job_fit else None
+            )
+            self.waiter.idle = self.prefetcher.poll
+
         # Load applied job records
         if self.avoid_duplicate_applications:
             self.load_applied_jobs()
@@ -480,7 +832,7 @@ class LinkedinEasyApply:
         # Load company blacklist if auto blacklist is enabled
         if self.auto_blacklist_companies:
             self.load_company_blacklist()
-            print(f"Auto company blacklist enabled, currently tracking {len(self.company_blacklist_with_dates)} blacklisted companies")
+            print(f"Auto company blacklist enabled, currently tracking {len(self.company_blacklist_index)} blacklisted companies")
 
         # Display start page configuration
         if self.start_from_page > 1:
@@ -491,37 +843,20 @@ class LinkedinEasyApply:
     def load_applied_jobs(self):
         """Load applied job records"""
         try:
-            if os.path.exists(self.applied_jobs_file):
-                with open(self.applied_jobs_file, 'r', encoding='utf-8') as f:
-                    applied_data = json.load(f)
-                
-                # old to new
-                if applied_data and isinstance(applied_data[0], str):
-                    from datetime import datetime
-                    current_time = datetime.now().isoformat()
-                    self.applied_jobs = {url: current_time for url in applied_data}
-                    self.save_applied_jobs()
-                else:
-                    self.applied_jobs = {item['url']: item['applied_date'] for item in applied_data}
-                
-                print(f"Successfully loaded {len(self.applied_jobs)} applied job records")
-            else:
-                print("Applied jobs record file not found, creating new record")
-                self.applied_jobs = {}
+            self.applied_jobs = open_applied_jobs_store(
+                self.applied_jobs_file, self.applied_jobs_backend, writer=self.state_writer
+            )
+            print(f"Successfully loaded {len(self.applied_jobs)} applied job records")
         except Exception as e:
             print(f"Failed to load applied job records: {e}")
-            self.applied_jobs = {}
+            print("Applied jobs will only be tracked in memory for this run")
+            self.applied_jobs = MemoryAppliedJobsStore()
 
     def save_applied_jobs(self):
         """Save applied job records"""
         try:
-            # 转换为新格式：包含URL和日期的对象列表
-            applied_list = [
-                {"url": url, "applied_date": date} 
-                for url, date in self.applied_jobs.items()
-            ]
-            with open(self.applied_jobs_file, 'w', encoding='utf-8') as f:
-                json.dump(applied_list, f, ensure_ascii=False, indent=2)
+            if isinstance(self.applied_jobs, AppliedJobsStore):
+                self.applied_jobs.flush()
             print(f"Saved {len(self.applied_jobs)} applied job records")
         except Exception as e:
             print(f"Failed to save applied job records: {e}")
@@ -537,14 +872,14 @@ class LinkedinEasyApply:
             return False
 
         # Clean link, remove query parameters, keep only base link
-        clean_link = job_link.split('?')[0] if job_link else ""
+        clean_link = clean_job_link(job_link)
         
-        if clean_link not in self.applied_jobs:
+        applied_date_str = self.applied_jobs.get(job_link) if job_link else None
+        if not applied_date_str:
             return False
         
         try:
-            from datetime import datetime, timedelta
-            applied_date_str = self.applied_jobs[clean_link]
+            from datetime import datetime
             applied_date = datetime.fromisoformat(applied_date_str.replace('Z', '+00:00'))
             current_date = datetime.now()
             
@@ -565,46 +900,16 @@ class LinkedinEasyApply:
     def load_company_blacklist(self):
         """Load company blacklist records"""
         try:
-            if os.path.exists(self.company_blacklist_file):
-                with open(self.company_blacklist_file, 'r', encoding='utf-8') as f:
-                    blacklist_data = json.load(f)
-                
-                # Handle both old format (list of strings) and new format (list of dicts)
-                if blacklist_data and isinstance(blacklist_data, list):
-                    if len(blacklist_data) > 0 and isinstance(blacklist_data[0], str):
-                        # Old format - convert to new format
-                        from datetime import datetime
-                        current_time = datetime.now().isoformat()
-                        self.company_blacklist_with_dates = {company: current_time for company in blacklist_data}
-                        self.save_company_blacklist()
-                    else:
-                        # New format - list of dicts with company and date
-                        self.company_blacklist_with_dates = {
-                            item['company']: item['blacklisted_date'] 
-                            for item in blacklist_data if isinstance(item, dict) and 'company' in item
-                        }
-                else:
-                    self.company_blacklist_with_dates = {}
-                
-                print(f"Successfully loaded {len(self.company_blacklist_with_dates)} blacklisted company records")
-            else:
-                self.company_blacklist_with_dates = {}
-                print("Company blacklist file not found, creating new record")
+            self.company_blacklist_index.load()
+            self.save_company_blacklist()  # Writes only if the old format was converted
         except Exception as e:
             print(f"Failed to load company blacklist records: {e}")
-            self.company_blacklist_with_dates = {}
 
     def save_company_blacklist(self):
         """Save company blacklist records"""
         try:
-            # Convert to new format: list of dicts with company and date
-            blacklist_list = [
-                {"company": company, "blacklisted_date": date} 
-                for company, date in self.company_blacklist_with_dates.items()
-            ]
-            with open(self.company_blacklist_file, 'w', encoding='utf-8') as f:
-                json.dump(blacklist_list, f, ensure_ascii=False, indent=2)
-            print(f"Saved {len(self.company_blacklist_with_dates)} blacklisted company records")
+            if self.company_blacklist_index.flush():
+                print(f"Saved {len(self.company_blacklist_index)} blacklisted company records")
         except Exception as e:
             print(f"Failed to save company blacklist records: {e}")
 
@@ -613,48 +918,17 @@ class LinkedinEasyApply:
         if not self.auto_blacklist_companies or not company_name:
             return False
         
-        company_lower = company_name.lower().strip()
-        
-        # Check static blacklist first
-        if company_lower in [word.lower() for word in self.company_blacklist]:
-            return True
-        
-        # Check dynamic blacklist with dates
-        if company_lower not in {k.lower() for k in self.company_blacklist_with_dates.keys()}:
-            return False
-        
         try:
-            from datetime import datetime, timedelta
-            # Find the company (case-insensitive)
-            blacklisted_company = None
-            blacklisted_date_str = None
-            for company, date_str in self.company_blacklist_with_dates.items():
-                if company.lower() == company_lower:
-                    blacklisted_company = company
-                    blacklisted_date_str = date_str
-                    break
-            
-            if not blacklisted_date_str:
-                return False
-            
-            blacklisted_date = datetime.fromisoformat(blacklisted_date_str.replace('Z', '+00:00'))
-            current_date = datetime.now()
-            days_passed = (current_date - blacklisted_date).days
-            
-            if days_passed >= self.company_blacklist_days:
-                # Blacklist period expired, remove from blacklist
-                del self.company_blacklist_with_dates[blacklisted_company]
-                self.save_company_blacklist()
-                print(f"Company '{blacklisted_company}' blacklist period ({days_passed} days) has expired, removed from blacklist")
-                return False
-            else:
-                return True  # Still blacklisted
+            return self.company_blacklist_index.is_blacklisted(company_name)
         except Exception as e:
             print(f"Error checking company blacklist for {company_name}: {e}")
             return False
 
     def add_company_to_blacklist(self, company_name):
-        """Add company to blacklist after successful application"""
+        """Add company to blacklist after successful application
+        
+        The file is written once per results page by save_company_blacklist.
+        """
         if not self.auto_blacklist_companies or not company_name:
             return
         
@@ -662,39 +936,134 @@ class LinkedinEasyApply:
         if not company_clean:
             return
         
-        from datetime import datetime
-        current_time = datetime.now().isoformat()
-        
-        # Add to blacklist (case-insensitive check)
-        company_lower = company_clean.lower()
-        existing_company = None
-        for company in self.company_blacklist_with_dates.keys():
-            if company.lower() == company_lower:
-                existing_company = company
-                break
-        
-        if existing_company:
-            # Update existing entry
-            self.company_blacklist_with_dates[existing_company] = current_time
-            print(f"Updated blacklist date for company '{existing_company}'")
+        if self.company_blacklist_index.add(company_clean):
+            print(f"Updated blacklist date for company '{self.company_blacklist_index.get_display_name(company_clean)}'")
         else:
-            # Add new entry
-            self.company_blacklist_with_dates[company_clean] = current_time
             print(f"Added company '{company_clean}' to blacklist for {self.company_blacklist_days} days")
-        
+
+    def save_seen_jobs(self):
+        """Save the job IDs seen in this session for later runs"""
+        if not self.persist_seen_jobs:
+            return
+        try:
+            self.seen_jobs.save()
+        except Exception as e:
+            print(f"Failed to save seen jobs: {e}")
+
+    def save_page_state(self):
+        """Queue writes for all state batched over a results page"""
         self.save_company_blacklist()
+        self.save_seen_jobs()
+        try:
+            self.unprepared_questions.flush()
+        except Exception as e:
+            print(f"Failed to save unprepared questions catalog: {e}")
+        if self.event_journal:
+            try:
+                self.event_journal.flush()
+            except Exception as e:
+                print(f"Failed to save event journal: {e}")
+
+    def open_job_tile(self, tile_handles, tile):
+        """Click a job tile and wait for its details pane"""
+        # The tile is only looked up again if it went stale
+        with self.job_timer.phase('click'):
+            tile_handles.call(tile, lambda job_tile: job_tile.find_element(By.TAG_NAME, 'a').click())
+
+        with self.job_timer.phase('description'):
+            self.waiter.wait('job_details', JOB_DETAILS_READY,
+                             budget=(3, 5) if not self.FastMode else (1, 2), args=(str(tile.job_id or ''),))
+
+    def read_job_details(self, tile):
+        """Read the open job's details pane in one call and store it in the job detail cache"""
+        if not self.job_detail_cache or tile.job_id is None:
+            return None
+        try:
+            data = self.browser.execute_script(JOB_DETAILS_JS) or {}
+        except Exception as e:
+            print(f"Could not read job details: {e}")
+            return None
+        if not data.get('description'):
+            return None
+        details = JobDetails(tile.job_id, data['description'], data.get('applicants_text') or '',
+                             parse_posted(data.get('primary_text')), data.get('company') or tile.company)
+        self.job_detail_cache.put(details)
+        return details
+
+    def plan_searches(self, searches):
+        """Order (position, location) pairs and attach a page budget (None = walk until the results end)"""
+        if not self.search_planner:
+            searches = [(position, location, None) for position, location in searches]
+            random.shuffle(searches)
+            return searches
+        plan = self.search_planner.plan(searches)
+        print("Search plan:\n" + self.search_planner.describe(plan))
+        return plan
+
+    def record_search_page(self, position, location, page_stats, seconds):
+        """Feed one walked results page to the search planner (page_stats None = no results)"""
+        if not self.search_planner:
+            return
+        page_stats = page_stats or {}
+        self.search_planner.record_page(
+            position, location, page_stats.get('new_jobs', 0), page_stats.get('applied', 0), seconds
+        )
+
+    def search_window_url(self, position, location):
+        """f_TPR filter covering the time since the search last completed (incremental mode only)"""
+        if not self.search_checkpoints:
+            return ""
+        seconds = self.search_checkpoints.window_seconds(position, location, self.search_window_seconds)
+        if seconds is None:
+            return ""
+        last = self.search_checkpoints.last_completed(position, location)
+        if last is not None:
+            print(f"Incremental search: {position} @ {location} last completed "
+                  f"{datetime.fromtimestamp(last):%Y-%m-%d %H:%M}, searching the last {seconds / 3600:.1f} hours")
+        return f"&f_TPR=r{seconds}"
+
+    def end_search(self, position, location, started_at):
+        """Close a search's page walk: update its yield statistics and incremental checkpoint"""
+        if self.search_planner:
+            self.search_planner.finish(position, location)
+        if self.search_checkpoints and self.pagination.completed():
+            self.search_checkpoints.complete(position, location, started_at)
+
+    def record_job_event(self, decision, job_title, company, job_location, link, skip_reasons=None, error=None):
+        """Append one journal event for the job tile just processed"""
+        if not self.event_journal:
+            return
+        event = {
+            'job_id': self.current_job_id,
+            'link': clean_job_link(link) if link else link,
+            'company': company,
+            'title': job_title,
+            'job_location': job_location,
+            'position': self.current_search.get('position'),
+            'location': self.current_search.get('location'),
+            'page': self.current_search.get('page'),
+            'decision': decision,
+            'skip_reasons': skip_reasons or [],
+            'timings': self.job_timer.as_dict(),
+        }
+        if error:
+            event['error'] = str(error)[:300]
+        try:
+            self.event_journal.record(event)
+        except Exception as e:
+            print(f"Failed to record job event: {e}")
 
     def add_applied_job(self, job_link):
         """Add applied job to records"""
         if not self.avoid_duplicate_applications or not job_link:
             return
 
-        # Clean link, remove query parameters, keep only base link
-        clean_link = job_link.split('?')[0]
         from datetime import datetime
         current_time = datetime.now().isoformat()
-        self.applied_jobs[clean_link] = current_time
-        self.save_applied_jobs()
+        try:
+            self.applied_jobs.add(job_link, current_time)
+        except Exception as e:
+            print(f"Failed to save applied job record: {e}")
 
     def logout(self):
         """Logs out from the current LinkedIn session."""
@@ -844,10 +1213,7 @@ class LinkedinEasyApply:
             # raise Exception("Could not login!")
 
     def security_check(self):
-        current_url = self.browser.current_url
-        page_source = self.browser.page_source
-
-        if '/checkpoint/challenge/' in current_url or 'security check' in page_source or 'quick verification' in page_source:
+        if self.page_probe.probe('checkpoint').kind == PageState.CHECKPOINT:
             input("Please complete the security check and press enter on this console when it is done.")
             time.sleep(random.uniform(5.5, 10.5))
 
@@ -872,6 +1238,9 @@ class LinkedinEasyApply:
         
     def start_applying(self):
         try:
+            if self.pre_resolve_geo_ids:
+                self.pre_resolve_locations(self.locations)
+
             # New logic: Prioritize positions_with_count if available
             if self.positions_with_count:
                 print("Detected 'positionsWithCount' configuration. Engaging new application logic...")
@@ -895,32 +1264,44 @@ class LinkedinEasyApply:
                         print(f"Warning: Global locations list is empty. Cannot search for position '{position_name}'.")
                         continue
                     
-                    shuffled_locations = random.sample(self.locations, len(self.locations))
-                    for location in shuffled_locations:
+                    planned_locations = self.plan_searches([(position_name, location) for location in self.locations])
+                    for (_, location, page_budget) in planned_locations:
                         current_applied_for_this_pos = self.applied_counts.get(position_name, 0) # Re-check count before processing a new location
                         if current_applied_for_this_pos >= max_applications:
                             print(f"Position '{position_name}' reached limit before processing location '{location}'. Stopping search for this position.")
                             break  # Break from location loop, move to next position_config
 
-                        location_url = "&location=" + location + "&geoId=" + self.click_location_url(location)
+                        location_url = self.get_location_url(location)
                         job_page_number = self.start_from_page - 2  # Will be incremented to start_from_page - 2 in loop
                         print(f"Searching for position '{position_name}' in '{location}' starting from page {self.start_from_page}.")
+                        self.pagination.start(page_budget)
+                        page_start = search_start = time.time()
+                        window_url = self.search_window_url(position_name, location)
 
                         try:
                             while True:
                                 current_applied_for_this_pos = self.applied_counts.get(position_name, 0) # Re-check count before fetching new page
                                 if current_applied_for_this_pos >= max_applications:
                                     print(f"Position '{position_name}' reached limit ({current_applied_for_this_pos}/{max_applications}) before fetching new page in '{location}'. Stopping.")
+                                    self.pagination.end(POSITION_TARGET)
                                     break # Break from while loop (pages) for current location
+                                stop_reason = self.pagination.should_stop()
+                                if stop_reason:
+                                    print(f"Position '{position_name}' @ '{location}': {stop_reason}. Ending search for this location.")
+                                    self.pagination.end(stop_reason)
+                                    break
 
                                 page_sleep += 1
                                 job_page_number += 1
+                                page_start = time.time()
                                 print(f"Position '{position_name}' @ '{location}': Going to job page {job_page_number}")
-                                self.next_job_page(position_name, location_url, job_page_number)
+                                self.next_job_page(position_name, location_url, job_page_number, window_url)
                                 time.sleep(random.uniform(1, 2)) if not self.FastMode else time.sleep(random.uniform(0.5, 1))
                                 print("Starting the application process for this page...")
                                 # Pass current_position_config to apply_jobs for targeted application and counting
-                                self.apply_jobs(location, current_position_config=position_config) 
+                                page_stats = self.apply_jobs(location, current_position_config=position_config)
+                                self.record_search_page(position_name, location, page_stats, time.time() - page_start)
+                                self.pagination.record_page(page_stats)
                                 print("Job applications on this page have been processed.")
 
                                 # Time control logic (similar to existing logic)
@@ -935,6 +1316,7 @@ class LinkedinEasyApply:
                                     time.sleep(sleep_time)
                                     page_sleep +=1 # To avoid immediate re-trigger if loop is very fast
                         except Exception as e:
+                            self.pagination.end(stop_reason_for(e))
                             # Check if it's a daily limit error that should stop everything
                             if "Daily limit reached - stopping application process" in str(e):
                                 print("🛑 Daily limit reached - stopping all application processes")
@@ -952,7 +1334,11 @@ class LinkedinEasyApply:
                                 traceback.print_exc()
                             else: # Expected exceptions for end of job list or similar
                                  print(f"Position '{position_name}' @ '{location}': {str(e)}. Ending search for this location.")
+                                 if "Job list UI elements not found" not in str(e):
+                                     self.record_search_page(position_name, location, None, time.time() - page_start)
                             # Any exception (including no more jobs) breaks the while True loop for the current location
+                        finally:
+                            self.end_search(position_name, location, search_start)
                         
                         # After a location is fully processed (or an error occurred), check count again.
                         if self.applied_counts.get(position_name, 0) >= max_applications:
@@ -975,29 +1361,40 @@ class LinkedinEasyApply:
             # --- Existing logic starts below --- 
             # This part will only execute if self.positions_with_count is empty.
             print("'positionsWithCount' is not configured or is empty. Engaging original application logic...")
-            searches = list(product(self.positions, self.locations))
-            random.shuffle(searches)
+            searches = self.plan_searches(product(self.positions, self.locations))
 
             page_sleep = 0
             minimum_time = 60 * 2  # minimum time bot should run before taking a break
             minimum_page_time = time.time() + minimum_time
 
-            for (position, location) in searches:
+            for (position, location, page_budget) in searches:
                 try:
-                    location_url = "&location=" + location + "&geoId=" + self.click_location_url(location)
+                    location_url = self.get_location_url(location)
                     job_page_number = self.start_from_page - 2  # Will be incremented to start_from_page - 1 in loop
+                    self.pagination.start(page_budget)
+                    page_start = search_start = time.time()
+                    window_url = self.search_window_url(position, location)
 
                     print(f"Starting the search for {position} in {location} from page {self.start_from_page}.")
 
                     try:
                         while True:
+                            stop_reason = self.pagination.should_stop()
+                            if stop_reason:
+                                print(f"{position} @ {location}: {stop_reason}. Moving to next search.")
+                                self.pagination.end(stop_reason)
+                                break
+
                             page_sleep += 1
                             job_page_number += 1
+                            page_start = time.time()
                             print("Going to job page " + str(job_page_number))
-                            self.next_job_page(position, location_url, job_page_number)
+                            self.next_job_page(position, location_url, job_page_number, window_url)
                             time.sleep(random.uniform(1, 2)) if not self.FastMode else time.sleep(random.uniform(0.5, 1))
                             print("Starting the application process for this page...")
-                            self.apply_jobs(location)
+                            page_stats = self.apply_jobs(location)
+                            self.record_search_page(position, location, page_stats, time.time() - page_start)
+                            self.pagination.record_page(page_stats)
                             print("Job applications on this page have been successfully completed.")
 
                             time_left = minimum_page_time - time.time()
@@ -1011,6 +1408,7 @@ class LinkedinEasyApply:
                                 time.sleep(sleep_time)
                                 page_sleep += 1
                     except Exception as e:
+                        self.pagination.end(stop_reason_for(e))
                         # Check if it's a daily limit error that should stop everything
                         if "Daily limit reached - stopping application process" in str(e):
                             print("🛑 Daily limit reached - stopping all application processes")
@@ -1028,7 +1426,10 @@ class LinkedinEasyApply:
                             traceback.print_exc()
                         else:
                             print(f"{position} @ {location}: {str(e)}. Moving to next search.")
-                        pass
+                            if "Job list UI elements not found" not in str(e):
+                                self.record_search_page(position, location, None, time.time() - page_start)
+                    finally:
+                        self.end_search(position, location, search_start)
                     
                 except Exception as e:
                     # Check if it's a daily limit error that should stop everything
@@ -1059,25 +1460,41 @@ class LinkedinEasyApply:
             else:
                 print(f"Error in start_applying: {e}")
                 traceback.print_exc()
+        finally:
+            print(f"Run total: {self.filter_stats.summary()}")
+            print(self.pagination.summary())
+            print(self.candidates.summary())
+            if self.prefetcher:
+                print(self.prefetcher.summary())
+                self.prefetcher.close()
+            if self.job_detail_cache:
+                print(self.job_detail_cache.summary())
+            if self.answer_cache:
+                print(self.answer_cache.summary())
+            if self.ai_response_generator.ai_workers:
+                print(self.ai_response_generator.dispatch_summary())
+            self.ai_response_generator.close()
+            print(self.waiter.summary())
+            self.state_writer.flush()
 
     def apply_jobs(self, location, current_position_config=None):
+        # Filter stats are taken on every exit, so a page that ends early does not leak its counts into the next one
+        try:
+            return self._apply_jobs_on_page(location, current_position_config)
+        finally:
+            page_filter_stats = self.prefilter.take_stats()
+            self.filter_stats.merge(page_filter_stats)
+            print(page_filter_stats.summary())
+
+    def _apply_jobs_on_page(self, location, current_position_config=None):
         # 添加统计变量
         jobs_processed = 0
         jobs_applied = 0
         jobs_skipped = 0
+        jobs_opened = 0  # tiles that passed the filters, the page's yield of new jobs
         start_seen_count = len(self.seen_jobs)
         
-        no_jobs_text = ""
-        try:
-            no_jobs_element = self.browser.find_element(By.CLASS_NAME,
-                                                        'jobs-search-two-pane__no-results-banner--expand')
-            no_jobs_text = no_jobs_element.text
-        except:
-            pass
-        if 'No matching jobs found' in no_jobs_text:
-            raise Exception("No more jobs on this page.")
-
-        if 'unfortunately, things are' in self.browser.page_source.lower():
+        if self.page_probe.probe('search').kind == PageState.NO_RESULTS:
             raise Exception("No more jobs on this page.")
 
         job_results_header = ""
@@ -1129,10 +1546,8 @@ class LinkedinEasyApply:
                 raise Exception("No more jobs on this page.")  # TODO: Seemed to encounter an error where we ran out of jobs and didn't go to next page, perhaps because I didn't have scrolling on?
             else:
                 job_list[0].find_element(By.TAG_NAME, 'a').click()
-                time.sleep(random.uniform(2, 3))
-                # Scroll logic (currently disabled for testing)
-                self.scroll_slow(job_results_by_class, step=600, )  # Scroll down
-                self.scroll_slow(job_results_by_class, step=900, reverse=True)  # Scroll up
+                self.waiter.wait('first_job_details', JOB_DETAILS_READY, budget=(2, 3), args=('',))
+                self.materialize_job_list(job_results_by_class, ul_element)
 
         except NoSuchElementException:
             print("No job results found using the specified XPaths or class.")
@@ -1143,7 +1558,20 @@ class LinkedinEasyApply:
             print(f"An unexpected error occurred: {e}")
             raise Exception(f"Unexpected error fetching job list: {e}")
 
-        for i in range(len(job_list)):
+        # Read every tile in one script call; element handles are only looked up for tiles that pass the filters
+        list_element = self.browser.find_elements(By.CLASS_NAME, ul_element_class)[0]
+        snapshot_start = time.perf_counter()
+        tiles = snapshot_job_tiles(self.browser, list_element)
+        tile_handles = TileHandles(self.browser, tiles, list_element)
+        search_label = f"{self.current_search.get('position')} @ {location}"
+        self.candidates.register_page(tiles, search_label)
+        prefiltered = self.prefilter.filter_page(tiles)
+        # Next tile to open after each candidate, for the prefetch window
+        candidate_tiles = [tile for tile in tiles if tile.index not in prefiltered]
+        next_candidates = {current.index: following for current, following in zip(candidate_tiles, candidate_tiles[1:])}
+        print(f"Read {len(tiles)} job tiles in {(time.perf_counter() - snapshot_start) * 1000:.0f} ms")
+
+        for tile in tiles:
             # === START: New logic for position counting and matching ===
             if current_position_config:
                 target_position_name = current_position_config['name']
@@ -1158,100 +1586,58 @@ class LinkedinEasyApply:
             # jobs_processed - 只有真正开始处理的职位才计入
             jobs_processed += 1
 
-            job_title, company, poster, job_location, apply_method, link = "", "", "", "", "", ""
-            job_tile = self.browser.find_elements(By.CLASS_NAME, ul_element_class)[0].find_elements(By.CLASS_NAME, 'scaffold-layout__list-item')[i]
-            try:
-                job_title_element = job_tile.find_element(By.TAG_NAME, 'a')
-                job_title = job_title_element.find_element(By.TAG_NAME, 'strong').text
-                # link = job_title_element.get_attribute('href').split('?')[0]
-                link = job_title_element.get_attribute('href')
-            except:
-                pass
-            try:
-                # company = job_tile.find_element(By.CLASS_NAME, 'job-card-container__primary-description').text # original code
-                company = job_tile.find_element(By.CLASS_NAME, 'artdeco-entity-lockup__subtitle').text
-            except:
-                pass
-            try:
-                # get the name of the person who posted for the position, if any is listed
-                hiring_line = job_tile.find_element(By.XPATH, '//span[contains(.,\' is hiring for this\')]')
-                hiring_line_text = hiring_line.text
-                name_terminating_index = hiring_line_text.find(' is hiring for this')
-                if name_terminating_index != -1:
-                    poster = hiring_line_text[:name_terminating_index]
-            except:
-                pass
-            try:
-                job_location = job_tile.find_element(By.CLASS_NAME, 'job-card-container__metadata-item').text
-            except:
-                pass
-            try:
-                apply_method = job_tile.find_element(By.CLASS_NAME, 'job-card-container__apply-method').text
-            except:
-                pass
-
-            contains_blacklisted_keywords = False
-
+            job_title, company, poster = tile.title, tile.company, tile.poster
+            job_location, apply_method, link = tile.location, tile.apply_method, tile.link
+            self.current_job_id = tile.job_id
+            self.job_timer = PhaseTimer()
+            self.current_search['location'] = location
 
-            for word in self.title_blacklist:
-                if word.lower() in job_title.lower():
-                    contains_blacklisted_keywords = True
-                    break
+            # Tile-level rules ran for the whole page up front; only the auto blacklist can change meanwhile
+            skip_reason = prefiltered.get(tile.index) or self.prefilter.recheck(tile)
+            # Marked before it is opened, so whatever the outcome (applied, failed, not Easy Apply, an error)
+            # no later search in this run opens the posting again
+            self.candidates.mark_evaluated(tile, search_label)
 
-            # Check if company is blacklisted (both static and dynamic blacklist)
-            is_company_blacklisted = self.is_company_blacklisted(company)
-            
-            if not is_company_blacklisted and \
-                    company.lower() not in [word.lower() for word in self.company_blacklist] and \
-                    poster.lower() not in [word.lower() for word in self.poster_blacklist] and \
-                    contains_blacklisted_keywords is False and link not in self.seen_jobs and \
-                    not self.is_job_already_applied(link):
+            if not skip_reason:
+                jobs_opened += 1
                 try:
-                    # Click the job to load description
-                    max_retries = 3
-                    retries = 0
-                    while retries < max_retries:
-                        try:
-                            # TODO: This is throwing an exception when running out of jobs on a page
-                            job_el = job_tile.find_element(By.TAG_NAME, 'a')
-                            job_el.click()
-                            break
-                        except StaleElementReferenceException:
-                            retries += 1
-                            continue
-
-                    time.sleep(random.uniform(3, 5)) if not self.FastMode else time.sleep(random.uniform(1, 2))
+                    # In pipelined mode the details may already have been read in the prefetch window
+                    # Details come from the job detail cache, the prefetch window or, after clicking, the pane
+                    prefetched = None
+                    details = self.job_detail_cache.get(tile.job_id) if self.job_detail_cache else None
+                    if details is not None:
+                        print(f"Using cached details for job {tile.job_id} (fetched "
+                              f"{(time.time() - details.fetched_at) / 3600:.1f}h ago)")
+                    elif self.prefetcher:
+                        with self.job_timer.phase('prefetch'):
+                            prefetched = details = self.prefetcher.take(tile)
+                        if prefetched is not None and self.job_detail_cache:
+                            self.job_detail_cache.put(JobDetails(tile.job_id, prefetched.description,
+                                                                 prefetched.applicants_text, company=company))
+                    tile_opened = details is None
+                    if tile_opened:
+                        self.open_job_tile(tile_handles, tile)
+                        details = self.read_job_details(tile)
+                    if self.prefetcher:
+                        next_tile = next_candidates.get(tile.index)
+                        if next_tile is not None and not (self.job_detail_cache and self.job_detail_cache.has(next_tile.job_id)):
+                            self.prefetcher.prefetch(next_tile)
 
                     # 检查申请人数是否超过设定的阈值
                     if self.lessApplicantsEnabled:
                         try:
-                            # 尝试找到显示申请人数的元素
-                            desc_container = self.browser.find_element(By.CLASS_NAME, 'job-details-jobs-unified-top-card__tertiary-description-container')
-                            description_text = desc_container.text
-                            
+                            # 显示申请人数的元素（缓存或预取时已读取）
+                            if details is not None:
+                                description_text = details.applicants_text
+                            else:
+                                desc_container = self.browser.find_element(By.CLASS_NAME, 'job-details-jobs-unified-top-card__tertiary-description-container')
+                                description_text = desc_container.text
+
                             # 提取申请人数（支持多种格式）
                             # 英文格式: "2 applicants"
                             # 中文格式: "2 位申请者", "超过 100 位申请者", "超过 100 位会员点击过"申请""
-                            applicants_count = None
-                            
-                            # 匹配各种格式的正则表达式
-                            patterns = [
-                                r'(\d+)\s+applicants?',  # 英文: "2 applicants"
-                                r'(\d+)\s*位申请者',      # 中文: "2 位申请者"
-                                r'超过\s*(\d+)\s*位申请者',  # 中文: "超过 100 位申请者"
-                                r'over\s*(\d+)\s*applicants',  # 英文: "over 100 applicants"
-                                r'超过\s*(\d+)\s*位会员点击过"?申请"?',  # 中文: "超过 100 位会员点击过"申请""
-                                r'over\s*(\d+)\s*people clicked apply'  # 英文: "Over 100 people clicked apply"
-                            ]
-                            
-                            # 尝试所有模式
-                            for pattern in patterns:
-                                match = re.search(pattern, description_text)
-                                if match:
-                                    # 提取数字
-                                    applicants_count = int(match.group(1))
-                                    break
-                            
+                            applicants_count = parse_applicants_count(description_text)
+
                             # 如果成功提取到申请人数
                             if applicants_count is not None:
                                 print(f"Detected applicants count: {applicants_count}")
@@ -1260,8 +1646,10 @@ class LinkedinEasyApply:
                                 if applicants_count > self.lessApplicantsCount:
                                     print(f"Applicants count ({applicants_count}) exceeds threshold ({self.lessApplicantsCount}), skipping job")
                                     jobs_skipped += 1  # jobs_skipped
-                                    if link and link not in self.seen_jobs: 
-                                        self.seen_jobs.append(link)
+                                    self.prefilter.drop('applicants', 'too many applicants')
+                                    self.seen_jobs.add(link)
+                                    self.record_job_event('skipped', job_title, company, job_location, link,
+                                                          [f"applicants count {applicants_count} exceeds {self.lessApplicantsCount}"])
                                     continue
                         except Exception as e:
                             print(f"检查申请人数时出错: {e}")
@@ -1272,23 +1660,36 @@ class LinkedinEasyApply:
 
                     if self.evaluate_job_fit:
                         try:
-                            # Get job description
-                            job_description = self.browser.find_element(
-                                By.ID, 'job-details'
-                            ).text  
-
-                            # Evaluate if we should apply
-                            if not self.ai_response_generator.evaluate_job_fit(job_title, job_description):
+                            # Evaluate if we should apply; a prefetched job was evaluated in the background
+                            with self.job_timer.phase('evaluate_job_fit'):
+                                is_fit = prefetched.fit() if prefetched is not None else None
+                            if is_fit is None:
+                                # Get job description
+                                with self.job_timer.phase('description'):
+                                    job_description = details.description if details is not None else \
+                                        self.browser.find_element(By.ID, 'job-details').text
+
+                                with self.job_timer.phase('evaluate_job_fit'):
+                                    is_fit = self.ai_response_generator.evaluate_job_fit(job_title, job_description)
+                            if not is_fit:
                                 print("Skipping application: Job requirements not aligned with candidate profile per AI evaluation.")
                                 jobs_skipped += 1  # jobs_skipped
-                                if link and link not in self.seen_jobs: self.seen_jobs.append(link) # Mark as seen
+                                self.prefilter.drop('job_fit', 'not aligned with candidate profile')
+                                self.seen_jobs.add(link)  # Mark as seen
+                                self.record_job_event('skipped', job_title, company, job_location, link,
+                                                      ["not aligned with candidate profile per AI evaluation"])
                                 continue
                         except Exception as e:
                             print(f"Could not load job description for AI evaluation: {e}")
                             # Decide if you want to proceed without AI evaluation or skip
-                            # if link and link not in self.seen_jobs: self.seen_jobs.append(link)
+                            # self.seen_jobs.add(link)
                             # continue 
 
+                    # A cached or prefetched job is only clicked once it is going to be applied to
+                    if not tile_opened:
+                        self.open_job_tile(tile_handles, tile)
+
+                    apply_error = None
                     try:
                         done_applying = self.apply_to_job()
                         if done_applying:
@@ -1314,6 +1715,7 @@ class LinkedinEasyApply:
                             print("🛑 Daily limit reached - stopping application process")
                             raise Exception("Daily limit reached - stopping application process")
                         
+                        apply_error = e_apply
                         temp = self.file_name
                         self.file_name = "failed"
                         print(f"Failed to apply to job: '{job_title}'. Link: {link}. Error: {e_apply}")
@@ -1333,10 +1735,21 @@ class LinkedinEasyApply:
                         print(
                             f"Unable to save the job information in the file for '{job_title}'. Error: {e_write}")
                         # traceback.print_exc() # Already printed by the application failure usually
+
+                    if apply_error is not None:
+                        self.record_job_event('failed', job_title, company, job_location, link, error=apply_error)
+                    elif done_applying:
+                        self.record_job_event('applied', job_title, company, job_location, link)
+                    else:
+                        self.record_job_event('skipped', job_title, company, job_location, link,
+                                              ["already applied or not Easy Apply"])
                 except Exception as e_outer_job_loop:
                     # Check if it's a daily limit error that should stop the entire process
                     if "Daily limit reached - stopping application process" in str(e_outer_job_loop):
                         print("🔄 The program stopped gracefully: The LinkedIn daily application limit has been reached")
+                        self.record_job_event('failed', job_title, company, job_location, link,
+                                              ["daily Easy Apply limit reached"])
+                        self.save_page_state()
                         end_seen_count = len(self.seen_jobs)
                         newly_seen = end_seen_count - start_seen_count
                         print(f"Page processing complete - Processed: {jobs_processed}, Applied: {jobs_applied}, Skipped: {jobs_skipped}, Newly seen: {newly_seen}")
@@ -1346,25 +1759,11 @@ class LinkedinEasyApply:
                     
                     print(f"Outer loop error for job '{job_title}': {e_outer_job_loop}")
                     traceback.print_exc()
+                    self.record_job_event('failed', job_title, company, job_location, link, error=e_outer_job_loop)
                     # pass # Original was pass, consider if seen_jobs needs update here
             else:
-                # This 'else' corresponds to the blacklist/seen_jobs check
-                skip_reason = []
-                # Check both static and dynamic blacklist
-                if self.is_company_blacklisted(company):
-                    skip_reason.append("company blacklisted (auto-blacklisted)")
-                elif company.lower() in [word.lower() for word in self.company_blacklist]:
-                    skip_reason.append("company blacklisted (static)")
-                if poster.lower() in [word.lower() for word in self.poster_blacklist]:
-                    skip_reason.append("poster blacklisted")
-                if contains_blacklisted_keywords:
-                    skip_reason.append("title contains blacklisted keywords")
-                if link in self.seen_jobs:
-                    skip_reason.append("already seen in this session")
-                if self.is_job_already_applied(link, silent=True):  # Use silent=True to avoid duplicate logs
-                    skip_reason.append("already applied previously")
-                
-                reason_text = ", ".join(skip_reason) if skip_reason else "unknown reason"
+                # This 'else' corresponds to the blacklist/seen_jobs prefilter
+                reason_text = ", ".join(skip_reason)
                 
                 try:
                     print(f"Skipping job - {company} {job_title} (Reason: {reason_text})")
@@ -1372,13 +1771,22 @@ class LinkedinEasyApply:
                     print(f"Skipping job - {company.encode('gbk', 'replace').decode('gbk')} {job_title.encode('gbk', 'replace').decode('gbk')} (Reason: {reason_text})")
                 
                 jobs_skipped += 1
+                self.record_job_event('skipped', job_title, company, job_location, link, skip_reason)
                 
-                if link not in self.seen_jobs and link:
-                    self.seen_jobs.append(link)
+                self.seen_jobs.add(link)
+
+        # Persist state changed on this page in a single write per file
+        self.save_page_state()
 
         end_seen_count = len(self.seen_jobs)
         newly_seen = end_seen_count - start_seen_count
         print(f"Page processing complete - Processed: {jobs_processed}, Applied: {jobs_applied}, Skipped: {jobs_skipped}, Newly seen: {newly_seen}")
+        if tile_handles.lookups:
+            print(f"Re-resolved {tile_handles.lookups} stale job tiles by job ID")
+        print(self.page_probe.summary())
+        print(f"Seen jobs: {end_seen_count} this session, {self.seen_jobs.previous_run_count} from previous runs, "
+              f"using {self.seen_jobs.memory_usage() / 1024:.1f} KB")
+        return {'tiles': len(tiles), 'new_jobs': jobs_opened, 'applied': jobs_applied}
 
     def apply_to_job(self):
         easy_apply_button = None
@@ -1400,24 +1808,14 @@ class LinkedinEasyApply:
             pass
 
         print("Starting the job application...")
-        easy_apply_button.click()
-        
-        # Check for daily application limit after clicking
-        time.sleep(random.uniform(2, 3)) if not self.FastMode else time.sleep(random.uniform(1, 2))
+        with self.job_timer.phase('easy_apply'):
+            easy_apply_button.click()
+
+            # Check for daily application limit once the modal is up
+            self.waiter.wait('easy_apply_modal', MODAL_OPEN, budget=(2, 3) if not self.FastMode else (1, 2))
         
         # Check if we've reached the daily Easy Apply limit
-        daily_limit_messages = [
-            "you've reached today's easy apply limit",
-            "reached today's easy apply limit",
-            "easy apply limit for today",
-            "continue applying tomorrow",
-            "daily submissions to help ensure",
-            "您已达到今天的快速申请限额",
-            "今日快速申请限额",
-            "明天继续申请"
-        ]
-        
-        if any(msg in self.browser.page_source.lower() for msg in daily_limit_messages):
+        if self.page_probe.probe('apply').kind == PageState.DAILY_LIMIT:
             print("❌ you've reached today's easy apply limit")
             # Try to close any modal dialogs
             try:
@@ -1433,7 +1831,8 @@ class LinkedinEasyApply:
 
         while submit_application_text not in button_text.lower() and '提交' not in button_text:
             try:
-                self.fill_up()
+                with self.job_timer.phase('fill_up', repeated=True):
+                    self.fill_up()
                 next_button = self.browser.find_element(By.CLASS_NAME, "artdeco-button--primary")
                 button_text = next_button.text.lower()
                 print(button_text)
@@ -1443,56 +1842,28 @@ class LinkedinEasyApply:
                         self.unfollow()
                     except:
                         print("Failed to unfollow company.")
-                time.sleep(random.uniform(1.5, 2.5)) if not self.FastMode else time.sleep(random.uniform(1, 2))
-                next_button.click()
-                time.sleep(random.uniform(3.0, 5.0)) if not self.FastMode else time.sleep(random.uniform(2.0, 3.0))
+                is_submit = submit_application_text in button_text or '提交' in button_text
+                with self.job_timer.phase('submit' if is_submit else 'next'):
+                    self.waiter.wait('before_next', budget=(1.5, 2.5) if not self.FastMode else (1, 2))
+                    step_signature = self.waiter.signature()
+                    next_button.click()
+                    self.waiter.wait('after_next', MODAL_STEP_CHANGED,
+                                     budget=(3.0, 5.0) if not self.FastMode else (2.0, 3.0), args=(step_signature,))
 
                 # Newer error handling
-                error_messages = [
-                    'enter a valid',
-                    'enter a decimal',
-                    'Enter a whole number'
-                    'Enter a whole number between 0 and 99',
-                    'file is required',
-                    'whole number',
-                    'make a selection',
-                    'select checkbox to proceed',
-                    'saisissez un numéro',
-                    '请输入whole编号',
-                    '请输入decimal编号',
-                    '长度超过 0.0',
-                    'Numéro de téléphone',
-                    'Introduce un número de whole entre',
-                    'Inserisci un numero whole compreso',
-                    'Preguntas adicionales',
-                    'Insira um um número',
-                    'Cuántos años'
-                    'use the format',
-                    'A file is required',
-                    '请选择',
-                    '请 选 择',
-                    '請選擇',
-                    '請 選 擇',
-                    '請輸入有效',
-                    'Inserisci',
-                    'wholenummer',
-                    'Wpisz liczb',
-                    'zakresu od',
-                    'tussen'
-                ]
-
-                if any(error in self.browser.page_source.lower() for error in error_messages):
-                    raise Exception("Failed answering required questions or uploading required files.")
+                page_state = self.page_probe.probe('apply')
+                if page_state.kind == PageState.VALIDATION_ERROR:
+                    raise Exception(f"Failed answering required questions or uploading required files. {page_state.error_summary()}")
             except:
                 traceback.print_exc()
                 self.browser.find_element(By.CLASS_NAME, 'artdeco-modal__dismiss').click()
-                time.sleep(random.uniform(2, 3)) if not self.FastMode else time.sleep(random.uniform(1, 2))
+                self.waiter.wait('discard_dialog', CONFIRM_DIALOG_OPEN, budget=(2, 3) if not self.FastMode else (1, 2))
                 self.browser.find_elements(By.CLASS_NAME, 'artdeco-modal__confirm-dialog-btn')[0].click()
-                time.sleep(random.uniform(2, 3)) if not self.FastMode else time.sleep(random.uniform(1, 2))
+                self.waiter.wait('discard_closed', MODAL_CLOSED, budget=(2, 3) if not self.FastMode else (1, 2))
                 raise Exception("Failed to apply to job!")
 
         closed_notification = False
-        time.sleep(random.uniform(2, 3)) if not self.FastMode else time.sleep(random.uniform(1, 2))
+        self.waiter.wait('confirmation', POST_APPLY_READY, budget=(2, 3) if not self.FastMode else (1, 2))
         try:
             self.browser.find_element(By.CLASS_NAME, 'artdeco-modal__dismiss').click()
             closed_notification = True
@@ -1509,7 +1880,7 @@ class LinkedinEasyApply:
         except:
             pass
 
-        time.sleep(random.uniform(3, 5)) if not self.FastMode else time.sleep(random.uniform(2, 3))
+        self.waiter.wait('confirmation_closed', MODAL_CLOSED, budget=(3, 5) if not self.FastMode else (2, 3))
 
         if closed_notification is False:
             raise Exception("Could not close the applied confirmation window!")
@@ -1530,7 +1901,7 @@ class LinkedinEasyApply:
                         print("Trying to fill up city field")
                         print(self.personal_info['City'])
                         self.enter_text(input_field, self.personal_info['City'])
-                        time.sleep(1.5)
+                        self.waiter.wait('city_typeahead', TYPEAHEAD_READY, budget=(1.5, 1.5))
                         input_field.send_keys(Keys.DOWN)
                         input_field.send_keys(Keys.RETURN)
                     elif 'zip' in lb or 'zip / postal code' in lb or 'postal' in lb:
@@ -1553,7 +1924,7 @@ class LinkedinEasyApply:
                             print("Trying to fill up city field")
                             print(self.personal_info['City'])
                             self.enter_text(input_field, self.personal_info['City'])
-                            time.sleep(1.5)
+                            self.waiter.wait('city_typeahead', TYPEAHEAD_READY, budget=(1.5, 1.5))
                             input_field.send_keys(Keys.DOWN)
                             input_field.send_keys(Keys.RETURN)
                         elif 'zip' in lb or 'zip / postal code' in lb or 'postal' in lb:
@@ -1571,794 +1942,567 @@ class LinkedinEasyApply:
         else:
             return 'no'
 
-    def _extract_question_text(self, question_element, default_text: str = ""):
-        """Extract a robust question text for a form element.
-
-        This method tries multiple fallbacks to get the visible question text:
-        1) The element's own <label>
-        2) Any span under .fb-dash-form-element__label
-        3) The nearest preceding group title/subtitle:
-           .jobs-easy-apply-form-section__group-title and
-           .jobs-easy-apply-form-section__group-subtitle
-        The collected pieces are concatenated and normalized to lowercase.
-        """
-        pieces = []
-        try:
-            if isinstance(default_text, str) and default_text.strip():
-                pieces.append(default_text.strip())
-
-            # 1) Own label
-            try:
-                label_el = question_element.find_element(By.TAG_NAME, 'label')
-                label_txt = label_el.text.strip()
-                if label_txt:
-                    pieces.append(label_txt)
-            except Exception:
-                pass
-
-            # 2) fb-dash-form-element__label span
-            try:
-                span_els = question_element.find_elements(
-                    By.XPATH,
-                    './/*[contains(@class, "fb-dash-form-element__label")]//span'
-                )
-                if span_els:
-                    span_txt = span_els[0].text.strip()
-                    if span_txt:
-                        pieces.append(span_txt)
-            except Exception:
-                pass
-
-            # 3) Nearest preceding group title/subtitle
-            try:
-                # title
-                title_nodes = question_element.find_elements(
-                    By.XPATH,
-                    'preceding::span[contains(@class, "jobs-easy-apply-form-section__group-title")][1]'
-                )
-                if title_nodes:
-                    title_txt = title_nodes[0].text.strip()
-                    if title_txt:
-                        # put title at the beginning
-                        pieces.insert(0, title_txt)
-
-                # subtitle
-                subtitle_nodes = question_element.find_elements(
-                    By.XPATH,
-                    'preceding::span[contains(@class, "jobs-easy-apply-form-section__group-subtitle")][1]'
-                )
-                if subtitle_nodes:
-                    subtitle_txt = subtitle_nodes[0].text.strip()
-                    if subtitle_txt:
-                        pieces.append(subtitle_txt)
-            except Exception:
-                pass
-
-            combined = ' '.join([p for p in pieces if p]).strip()
-            return combined.lower() if combined else (default_text or '').strip().lower()
-        except Exception:
-            return (default_text or '').strip().lower()
-
     # 主要代码
     def additional_questions(self, form):
-        questions = form.find_elements(By.CLASS_NAME, 'fb-dash-form-element')
-        for question in questions:
-            try:
-                # Radio check
+        """Answer every question of the current form step.
+
+        All questions are classified in one script call (see form_schema), then
+        each is handed to the handler for its control type, so no time is spent
+        probing for controls a question does not have. Questions that will need
+        the AI are sent off first (to the thread pool, or as one batch request)
+        and filled after the others, so their round trips overlap with the
+        deterministic fields; every answer is joined before this returns and
+        the caller clicks Next.
+        """
+        try:
+            questions = extract_form_schema(self.browser, form)
+        except Exception as e:
+            print(f"Could not read the form questions: {e}")
+            return
+        handlers = {
+            'radio': self._answer_radio_question,
+            'text': self._answer_text_question,
+            'numeric': self._answer_text_question,
+            'date': self._answer_date_question,
+            'select': self._answer_dropdown_question,
+            'checkbox': self._answer_checkbox_question,
+        }
+        ai_requests = {schema.qid: self.ai_request_for(schema) for schema in questions}
+        ai_requests = {qid: request for qid, request in ai_requests.items() if request is not None}
+        generator = self.ai_response_generator
+        if generator.submit_responses(list(ai_requests.values()), batch=self.batch_ai_answers):
+            # The AI works in the background while the other fields are filled; its questions go last
+            questions = [schema for schema in questions if schema.qid not in ai_requests] + \
+                        [schema for schema in questions if schema.qid in ai_requests]
+        elif self.batch_ai_answers and len(ai_requests) > 1:
+            # Questions that will need the AI are answered in one request before the fields are filled
+            generator.generate_responses(list(ai_requests.values()))
+        for schema in questions:
+            if schema.type not in handlers:
+                print(f"Skipping question with unsupported control: {schema.text}")
+                continue
+            # As the per-control probes did, a failed handler falls through to the question's other controls
+            for attempt in [schema] + schema.fallbacks:
+                handler = handlers.get(attempt.type)
+                if handler is None:
+                    continue
                 try:
-                    radio_fieldset = question.find_element(By.TAG_NAME, 'fieldset')
-                    question_span = radio_fieldset.find_element(By.CLASS_NAME, 'fb-dash-form-element__label').find_elements(By.TAG_NAME, 'span')[0]
-                    radio_text = self._extract_question_text(question, default_text=question_span.text)
-                    print(f"Radio question text: {radio_text}")
-
-                    # First check whether it matches the custom question
-                    custom_answer = None
-                    if hasattr(self, 'customQuestions'):
-                        for custom_question, answer in self.customQuestions.items():
-                            print('custom_question:', custom_question.lower())
-                            if custom_question.lower() in radio_text:
-                                custom_answer = answer
-                                print(f"Found matches for custom radio questions: '{radio_text}' -> '{custom_answer}'")
-                                break
-
-                    radio_labels = radio_fieldset.find_elements(By.TAG_NAME, 'label')
-                    radio_options = [(i, text.text.lower()) for i, text in enumerate(radio_labels)]
-                    print(f"radio options: {[opt[1] for opt in radio_options]}")
-
-                    if len(radio_options) == 0:
-                        raise Exception("No radio options found in question")
-
-                    # If there is a custom answer, use it first
-                    if custom_answer:
-                        selected = False
-                        for i, (_, option_text) in enumerate(radio_options):
-                            if custom_answer.lower() in option_text:
-                                radio_labels[i].click()
-                                print(f"Custom answer single option selected: '{radio_text}' -> '{option_text}'")
-                                selected = True
-                                break
-                        
-                        if selected:
-                            continue
-
-                    # If there is no matching custom answer, use the original logic
-                    answer = None
-
-                    # Try to determine answer using existing logic
-                    if 'driver\'s licence' in radio_text or 'driver\'s license' in radio_text:
-                        answer = self.get_answer('driversLicence')
-                    elif any(keyword in radio_text.lower() for keyword in
-                            [
-                                'Aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
-                                'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
-                                'aborigine', 'ancestral', 'native peoples', 'original people',
-                                'first people', 'gender', 'race', 'disability', 'latino', 'torres',
-                                'do you identify'
-                            ]):
-                        
-                        print(f"EEO-related radio question detected: {radio_text}")
-                        
-                        # 构建EEO上下文信息
-                        eeo_context = ""
-                        if hasattr(self, 'eeo') and self.eeo:
-                            eeo_info = []
-                            for key, value in self.eeo.items():
-                                if value:
-                                    eeo_info.append(f"{key}: {value}")
-                            if eeo_info:
-                                eeo_context = f" My EEO information: {', '.join(eeo_info)}."
-                        
-                        # 添加EEO上下文到问题中
-                        enhanced_question = radio_text + eeo_context
-                        
-                        # 使用AI来智能选择最佳EEO选项
-                        ai_response = self.ai_response_generator.generate_response(
-                            enhanced_question,
-                            response_type="choice",
-                            options=radio_options
-                        )
-                        
-                        if ai_response is not None:
-                            print(f"AI selected EEO radio option: {radio_options[ai_response]} for question: '{radio_text}'")
-                            to_select = radio_labels[ai_response]
-                            to_select.click()
-                            continue
-                        
-                        # AI失败时的后备逻辑 - 使用原有的关键词匹配
-                        print("AI response failed for EEO radio question, using fallback keyword matching")
-                        answer = None
-                        if 'gender' in radio_text.lower() and 'gender' in self.eeo:
-                            eeo_value = self.eeo['gender']
-                            if 'male' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'male' in option[1].lower() and 'female' not in option[1].lower()), None)
-                            elif 'female' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'female' in option[1].lower()), None)
-                            else:
-                                negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish']
-                                answer = next((option for option in radio_options if
-                                            any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
-                        
-                        elif 'race' in radio_text.lower() and 'race' in self.eeo:
-                            eeo_value = self.eeo['race']
-                            if 'asian' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'asian' in option[1].lower()), None)
-                            elif 'white' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'white' in option[1].lower()), None)
-                            elif 'black' in eeo_value.lower() or 'african' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'black' in option[1].lower() or 'african' in option[1].lower()), None)
-                            elif 'hispanic' in eeo_value.lower() or 'latino' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'hispanic' in option[1].lower() or 'latino' in option[1].lower()), None)
-                            elif 'american indian' in eeo_value.lower() or 'alaska native' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'american indian' in option[1].lower() or 'alaska' in option[1].lower()), None)
-                            elif 'hawaiian' in eeo_value.lower() or 'pacific' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'hawaiian' in option[1].lower() or 'pacific' in option[1].lower()), None)
-                            elif 'two or more' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'two' in option[1].lower() and 'more' in option[1].lower()), None)
-                            else:
-                                negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish']
-                                answer = next((option for option in radio_options if
-                                            any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
-                        
-                        elif 'disability' in radio_text.lower() and 'disability' in self.eeo:
-                            eeo_value = self.eeo['disability']
-                            if 'yes' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'yes' in option[1].lower()), None)
-                            elif 'no' in eeo_value.lower():
-                                answer = next((option for option in radio_options if 'no' in option[1].lower()), None)
-                            else:
-                                negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish', 'choose']
-                                answer = next((option for option in radio_options if
-                                            any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
-                        
-                        else:
-                            # 默认选择拒绝回答的选项
-                            negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish', 'choose']
-                            answer = next((option for option in radio_options if
-                                        any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
-
-                    elif 'assessment' in radio_text:
-                        answer = self.get_answer("assessment")
-
-                    elif 'clearance' in radio_text:
-                        answer = self.get_answer("securityClearance")
-
-                    elif 'north korea' in radio_text:
-                        answer = 'no'
+                    question = find_question_element(form, attempt)
+                    handler(question, attempt)
+                    break
+                except Exception as e:
+                    print(f"An exception occurred while filling up {attempt.type} field: {e}")
+        # Nothing submitted for this step may be picked up after Next is clicked
+        generator.discard_pending()
 
-                    elif 'previously employ' in radio_text or 'previous employ' in radio_text:
-                        answer = 'no'
+    def ai_request_for(self, schema):
+        """(question, response type, options) the handler for ``schema`` will ask the AI, or None.
 
-                    elif 'authorized' in radio_text or 'authorised' in radio_text or 'legally' in radio_text:
-                        answer = self.get_answer('legallyAuthorized')
+        Mirrors where the handlers fall through to generate_response; a wrong
+        guess only costs an unused batch answer or one extra single request.
+        """
+        if not schema.text or self.custom_questions.lookup(schema.text) is not None:
+            return None
+        if schema.type == 'radio':
+            rule = self.question_rules.match(schema.text, 'radio', eeo=self.eeo)
+        elif schema.type in ('text', 'numeric', 'select'):
+            rule = self.question_rules.match(schema.text, schema.type, options=schema.options)
+        else:
+            return None
+        if schema.type in ('text', 'numeric'):
+            return (schema.text, schema.type, None) if rule is None else None
+        choices = list(enumerate(schema.options))
+        if rule is None:
+            return schema.text, "choice", choices
+        if rule.source == 'eeo':
+            return self.eeo_question(schema.text), "choice", choices
+        return None
+
+    def eeo_question(self, question_text):
+        """Question text with the configured EEO answers appended for the AI"""
+        eeo_info = [f"{key}: {value}" for key, value in (self.eeo or {}).items() if value]
+        if not eeo_info:
+            return question_text
+        return question_text + f" My EEO information: {', '.join(eeo_info)}."
+
+    def find_custom_answer(self, question_text, control):
+        """Answer from the customQuestions entry matching the question, or None"""
+        if self.custom_questions.reload_if_changed():
+            self.customQuestions = self.custom_questions.questions
+            self.ai_response_generator.customQuestions = self.customQuestions
+        match = self.custom_questions.lookup(question_text)
+        if match is None:
+            return None
+        custom_question, answer = match
+        print(f"Custom {control} question matched '{custom_question}': '{question_text}' -> '{answer}'")
+        return answer
+
+    def _answer_radio_question(self, question, schema):
+        radio_fieldset = question.find_element(By.TAG_NAME, 'fieldset')
+        radio_text = schema.text
+        print(f"Radio question text: {radio_text}")
+
+        # First check whether it matches the custom question
+        custom_answer = self.find_custom_answer(radio_text, 'radio')
+
+        radio_labels = radio_fieldset.find_elements(By.TAG_NAME, 'label')
+        radio_options = list(enumerate(schema.options))
+        print(f"radio options: {[opt[1] for opt in radio_options]}")
+
+        if len(radio_options) == 0:
+            raise Exception("No radio options found in question")
+
+        # If there is a custom answer, use it first
+        if custom_answer:
+            selected = False
+            for i, (_, option_text) in enumerate(radio_options):
+                if custom_answer.lower() in option_text:
+                    radio_labels[i].click()
+                    print(f"Custom answer single option selected: '{radio_text}' -> '{option_text}'")
+                    selected = True
+                    break
+            
+            if selected:
+                return
 
-                    elif any(keyword in radio_text.lower() for keyword in
-                            ['certified', 'certificate', 'cpa', 'chartered accountant', 'qualification']):
-                        answer = self.get_answer('certifiedProfessional')
+        # If there is no matching custom answer, use the original logic
+        answer = None
 
-                    elif 'urgent' in radio_text:
-                        answer = self.get_answer('urgentFill')
+        # Try to determine answer from the rule table
+        rule = self.question_rules.match(radio_text, 'radio', eeo=self.eeo)
+        source = rule.source if rule is not None else None
+        if source == 'checkbox':
+            answer = self.get_answer(rule.key)
 
-                    elif 'commut' in radio_text or 'on-site' in radio_text or 'hybrid' in radio_text or 'onsite' in radio_text:
-                        answer = self.get_answer('commute')
+        elif source == 'constant':
+            answer = rule.key
 
-                    elif 'remote' in radio_text:
-                        answer = self.get_answer('remote')
+        elif source == 'eeo':
+            print(f"EEO-related radio question detected: {radio_text}")
+            
+            # 添加EEO上下文到问题中
+            enhanced_question = self.eeo_question(radio_text)
+            
+            # 使用AI来智能选择最佳EEO选项
+            ai_response = self.ai_response_generator.generate_response(
+                enhanced_question,
+                response_type="choice",
+                options=radio_options
+            )
+            
+            if ai_response is not None:
+                print(f"AI selected EEO radio option: {radio_options[ai_response]} for question: '{radio_text}'")
+                to_select = radio_labels[ai_response]
+                to_select.click()
+                return
+            
+            # AI失败时的后备逻辑 - 使用原有的关键词匹配
+            print("AI response failed for EEO radio question, using fallback keyword matching")
+            answer = None
+            if 'gender' in radio_text.lower() and 'gender' in self.eeo:
+                eeo_value = self.eeo['gender']
+                if 'male' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'male' in option[1].lower() and 'female' not in option[1].lower()), None)
+                elif 'female' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'female' in option[1].lower()), None)
+                else:
+                    negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish']
+                    answer = next((option for option in radio_options if
+                                any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
+            
+            elif 'race' in radio_text.lower() and 'race' in self.eeo:
+                eeo_value = self.eeo['race']
+                if 'asian' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'asian' in option[1].lower()), None)
+                elif 'white' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'white' in option[1].lower()), None)
+                elif 'black' in eeo_value.lower() or 'african' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'black' in option[1].lower() or 'african' in option[1].lower()), None)
+                elif 'hispanic' in eeo_value.lower() or 'latino' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'hispanic' in option[1].lower() or 'latino' in option[1].lower()), None)
+                elif 'american indian' in eeo_value.lower() or 'alaska native' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'american indian' in option[1].lower() or 'alaska' in option[1].lower()), None)
+                elif 'hawaiian' in eeo_value.lower() or 'pacific' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'hawaiian' in option[1].lower() or 'pacific' in option[1].lower()), None)
+                elif 'two or more' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'two' in option[1].lower() and 'more' in option[1].lower()), None)
+                else:
+                    negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish']
+                    answer = next((option for option in radio_options if
+                                any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
+            
+            elif 'disability' in radio_text.lower() and 'disability' in self.eeo:
+                eeo_value = self.eeo['disability']
+                if 'yes' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'yes' in option[1].lower()), None)
+                elif 'no' in eeo_value.lower():
+                    answer = next((option for option in radio_options if 'no' in option[1].lower()), None)
+                else:
+                    negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish', 'choose']
+                    answer = next((option for option in radio_options if
+                                any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
+            
+            else:
+                # 默认选择拒绝回答的选项
+                negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish', 'choose']
+                answer = next((option for option in radio_options if
+                            any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
+
+        elif source == 'education':
+            for degree in self.checkboxes['degreeCompleted']:
+                if degree.lower() in radio_text:
+                    answer = "yes"
+                    break
 
-                    elif 'background check' in radio_text:
-                        answer = self.get_answer('backgroundCheck')
+        elif source == 'experience':
+            if self.experience_default > 0:
+                answer = 'yes'
+            else:
+                for experience in self.experience:
+                    if experience.lower() in radio_text:
+                        answer = "yes"
+                        break
 
-                    elif 'drug test' in radio_text:
-                        answer = self.get_answer('drugTest')
+        elif source == 'veteran':
+            eeo_value = self.eeo['veteran']
+            if 'protected veteran' in eeo_value.lower():
+                answer = next((option for option in radio_options if 'protected' in option[1].lower() and 'veteran' in option[1].lower()), None)
+            elif 'not a protected veteran' in eeo_value.lower():
+                answer = next((option for option in radio_options if 'not' in option[1].lower() and 'protected' in option[1].lower()), None)
+            elif 'veteran but not' in eeo_value.lower():
+                answer = next((option for option in radio_options if 'veteran' in option[1].lower() and 'not' in option[1].lower() and 'protected' in option[1].lower()), None)
+            else:
+                negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish', 'choose']
+                answer = next((option for option in radio_options if
+                            any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
+        
+        to_select = None
+        if answer is not None:
+            print(f"Choosing answer: {answer}")
+            i = 0
+            for option_text in schema.options:
+                if answer in option_text:
+                    to_select = radio_labels[i]
+                    break
+                i += 1
+            if to_select is None:
+                print("Answer not found in radio options")
+
+        if to_select is None:
+            print("No answer determined")
+            self.record_unprepared_question("radio", radio_text)
+
+            # Since no response can be determined, we use AI to identify the best responseif available, falling back to the final option if the AI response is not available
+            ai_response = self.ai_response_generator.generate_response(
+                radio_text,
+                response_type="choice",
+                options=radio_options
+            )
+            if ai_response is not None:
+                to_select = radio_labels[ai_response]
+                self.record_unprepared_answer("radio", radio_text, radio_options[ai_response][1])
+            else:
+                to_select = radio_labels[len(radio_labels) - 1]
+        to_select.click()
 
-                    elif 'currently living' in radio_text or 'currently reside' in radio_text or 'right to live' in radio_text:
-                        answer = self.get_answer('residency')
+    def _answer_text_question(self, question, schema):
+        question_text = schema.text
+        print(question_text)
 
-                    elif 'level of education' in radio_text:
-                        for degree in self.checkboxes['degreeCompleted']:
-                            if degree.lower() in radio_text:
-                                answer = "yes"
-                                break
+        # First check whether it matches the custom question
+        custom_answer = self.find_custom_answer(question_text, 'text')
+        
+        txt_field = question.find_element(By.ID, schema.element_id) if schema.element_id else \
+            question.find_element(By.CSS_SELECTOR, 'input, textarea')
+        # For decimal and integer response fields, the id contains 'numeric' while the type remains 'text'
+        text_field_type = schema.type
+
+        # If there is a custom answer, use it first
+        if custom_answer:
+            self.enter_text(txt_field, custom_answer)
+            print(f"Custom text answer filled in: '{question_text}' -> '{custom_answer}'")
+            return
 
-                    elif 'experience' in radio_text:
-                        if self.experience_default > 0:
-                            answer = 'yes'
-                        else:
-                            for experience in self.experience:
-                                if experience.lower() in radio_text:
-                                    answer = "yes"
-                                    break
+        # If there is no matching custom answer, use the original logic
+        to_enter = ''
+        rule = self.question_rules.match(question_text, text_field_type)
+        source = rule.source if rule is not None else None
+        if source == 'experience_years':
+            no_of_years = None
+            for experience in self.experience:
+                if experience.lower() in question_text:
+                    no_of_years = int(self.experience[experience])
+                    break
+            if no_of_years is None:
+                self.record_unprepared_question(text_field_type, question_text)
+                no_of_years = int(self.experience_default)
+            to_enter = no_of_years
 
-                    elif 'data retention' in radio_text:
-                        answer = 'no'
+        elif source == 'gpa':
+            to_enter = self.university_gpa
 
-                    elif 'sponsor' in radio_text:
-                        answer = self.get_answer('requireVisa')
-                    
-                    elif 'veteran' in radio_text.lower() and 'veteran' in self.eeo:
-                        eeo_value = self.eeo['veteran']
-                        if 'protected veteran' in eeo_value.lower():
-                            answer = next((option for option in radio_options if 'protected' in option[1].lower() and 'veteran' in option[1].lower()), None)
-                        elif 'not a protected veteran' in eeo_value.lower():
-                            answer = next((option for option in radio_options if 'not' in option[1].lower() and 'protected' in option[1].lower()), None)
-                        elif 'veteran but not' in eeo_value.lower():
-                            answer = next((option for option in radio_options if 'veteran' in option[1].lower() and 'not' in option[1].lower() and 'protected' in option[1].lower()), None)
-                        else:
-                            negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish', 'choose']
-                            answer = next((option for option in radio_options if
-                                        any(neg_keyword in option[1].lower() for neg_keyword in negative_keywords)), None)
-                    
-                    to_select = None
-                    if answer is not None:
-                        print(f"Choosing answer: {answer}")
-                        i = 0
-                        for radio in radio_labels:
-                            if answer in radio.text.lower():
-                                to_select = radio_labels[i]
-                                break
-                            i += 1
-                        if to_select is None:
-                            print("Answer not found in radio options")
+        elif source == 'personal':
+            to_enter = self.personal_info[rule.key]
 
-                    if to_select is None:
-                        print("No answer determined")
-                        self.record_unprepared_question("radio", radio_text)
-                        question_text = question.find_element(By.TAG_NAME, 'label').text.lower()
+        elif source == 'full_name':
+            to_enter = self.personal_info['First Name'] + " " + self.personal_info['Last Name']
 
-                        # Since no response can be determined, we use AI to identify the best responseif available, falling back to the final option if the AI response is not available
-                        ai_response = self.ai_response_generator.generate_response(
-                            question_text,
-                            response_type="choice",
-                            options=radio_options
-                        )
-                        if ai_response is not None:
-                            to_select = radio_labels[ai_response]
-                        else:
-                            to_select = radio_labels[len(radio_labels) - 1]
-                    to_select.click()
-
-                    if radio_labels:
-                        continue
-                except Exception as e:
-                    print(f"No custom radio option was matched")
+        elif source == 'notice':
+            if text_field_type == 'numeric':
+                to_enter = int(self.notice_period)
+            else:
+                to_enter = str(self.notice_period)
 
-                # Questions check
-                try:
-                    question_text = self._extract_question_text(question)
-                    print(question_text)
-
-                    # First check whether it matches the custom question
-                    custom_answer = None
-                    if hasattr(self, 'customQuestions'):
-                        for custom_question, answer in self.customQuestions.items():
-                            if custom_question.lower() in question_text:
-                                custom_answer = answer
-                                print(f"Find custom text question matches: '{question_text}' -> '{custom_answer}'")
-                                break
+        elif source == 'salary':
+            if text_field_type == 'numeric':
+                to_enter = int(self.salary_minimum)
+            else:
+                to_enter = float(self.salary_minimum)
+            self.record_unprepared_question(text_field_type, question_text)
+
+        # Since no response can be determined, we use AI to generate a response if available, falling back to 0 or empty string if the AI response is not available
+        if text_field_type == 'numeric':
+            if not isinstance(to_enter, (int, float)):
+                self.record_unprepared_question(text_field_type, question_text)
+                ai_response = self.ai_response_generator.generate_response(
+                    question_text,
+                    response_type="numeric"
+                )
+                self.record_unprepared_answer(text_field_type, question_text, ai_response)
+                to_enter = ai_response if ai_response is not None else 0
+        elif to_enter == '':
+            self.record_unprepared_question(text_field_type, question_text)
+            ai_response = self.ai_response_generator.generate_response(
+                question_text,
+                response_type="text"
+            )
+            self.record_unprepared_answer(text_field_type, question_text, ai_response)
+            to_enter = ai_response if ai_response is not None else " ‏‏‎ "
+
+        self.enter_text(txt_field, to_enter)
+
+    def _answer_date_question(self, question, schema):
+        date_picker = question.find_element(By.CLASS_NAME, 'artdeco-datepicker__input')
+        date_picker.clear()
+        date_picker.send_keys(date.today().strftime("%m/%d/%y"))
+        time.sleep(1.5)
+        date_picker.send_keys(Keys.RETURN)
+        time.sleep(0.5)
+
+    def _answer_dropdown_question(self, question, schema):
+        question_text = schema.text
+        print(f"Dropdown question text: {question_text}")
+        
+        # First check whether it matches the custom question
+        custom_answer = self.find_custom_answer(question_text, 'dropdown')
                     
-                    txt_field_visible = False
-                    try:
-                        txt_field = question.find_element(By.TAG_NAME, 'input')
-                        txt_field_visible = True
-                    except:
-                        try:
-                            txt_field = question.find_element(By.TAG_NAME, 'textarea')
-                            txt_field_visible = True
-                        except:
-                            raise Exception("Could not find textarea or input tag for question")
-
-                    if 'numeric' in txt_field.get_attribute('id').lower():
-                        # For decimal and integer response fields, the id contains 'numeric' while the type remains 'text' 
-                        text_field_type = 'numeric'
-                    elif 'text' in txt_field.get_attribute('type').lower():
-                        text_field_type = 'text'
-                    else:
-                        raise Exception("Could not determine input type of input field!")
-
-                    # If there is a custom answer, use it first
-                    if custom_answer:
-                        self.enter_text(txt_field, custom_answer)
-                        print(f"Custom text answer filled in: '{question_text}' -> '{custom_answer}'")
-                        continue
-
-                    # If there is no matching custom answer, use the original logic
-                    to_enter = ''
-                    if ('experience' in question_text and 'salary' not in question_text) or 'how many years in' in question_text:
-                        no_of_years = None
-                        for experience in self.experience:
-                            if experience.lower() in question_text:
-                                no_of_years = int(self.experience[experience])
-                                break
-                        if no_of_years is None:
-                            self.record_unprepared_question(text_field_type, question_text)
-                            no_of_years = int(self.experience_default)
-                        to_enter = no_of_years
-
-                    elif 'grade point average' in question_text:
-                        to_enter = self.university_gpa
-
-                    elif 'first name' in question_text:
-                        to_enter = self.personal_info['First Name']
-
-                    elif 'last name' in question_text:
-                        to_enter = self.personal_info['Last Name']
-
-                    elif 'name' in question_text:
-                        to_enter = self.personal_info['First Name'] + " " + self.personal_info['Last Name']
-
-                    elif 'pronouns' in question_text:
-                        to_enter = self.personal_info['Pronouns']
-
-                    elif 'phone' in question_text:
-                        to_enter = self.personal_info['Mobile Phone Number']
-                    elif '联系电话' in question_text:
-                        to_enter = self.personal_info['Mobile Phone Number']
-
-                    elif 'linkedin' in question_text:
-                        to_enter = self.personal_info['Linkedin']
+        dropdown_field = question.find_element(By.TAG_NAME, 'select')
+        options = schema.options
+        print(f"Dropdown options: {options}")
+        
+        # If there is a custom answer, use it first
+        if custom_answer:
+            selected = False
+            for option in options:
+                if custom_answer.lower() in option.lower():
+                    self.select_dropdown(dropdown_field, option)
+                    print(f"Custom drop-down menu option selected: '{question_text}' -> '{option}'")
+                    selected = True
+                    break
+            
+            if selected:
+                return
 
-                    elif 'message to hiring' in question_text or 'cover letter' in question_text:
-                        to_enter = self.personal_info['MessageToManager']
+        # 如果没有匹配的自定义答案，使用规则表
+        rule = self.question_rules.match(question_text, 'select', options=options)
+        source = rule.source if rule is not None else None
+        if source == 'language':
+            proficiency = "None"
+            for language in self.languages:
+                if language.lower() in question_text:
+                    proficiency = self.languages[language]
+                    break
+            self.select_dropdown(dropdown_field, proficiency)
 
-                    elif 'website' in question_text or 'github' in question_text or 'portfolio' in question_text:
-                        to_enter = self.personal_info['Website']
+        elif source in ('checkbox', 'constant'):
+            choice = self.choose_dropdown_option(options, rule)
+            if choice == "" and rule.fallback == 'record':
+                self.record_unprepared_question("dropdown", question_text)
+            self.select_dropdown(dropdown_field, choice)
 
-                    elif 'notice' in question_text or 'weeks' in question_text:
-                        if text_field_type == 'numeric':
-                            to_enter = int(self.notice_period)
-                        else:
-                            to_enter = str(self.notice_period)
+        elif source == 'personal':
+            self.select_dropdown(dropdown_field, self.personal_info[rule.key])
 
-                    elif 'salary' in question_text or 'expectation' in question_text or 'compensation' in question_text or 'CTC' in question_text:
-                        if text_field_type == 'numeric':
-                            to_enter = int(self.salary_minimum)
-                        else:
-                            to_enter = float(self.salary_minimum)
-                        self.record_unprepared_question(text_field_type, question_text)
-
-                    # Since no response can be determined, we use AI to generate a response if available, falling back to 0 or empty string if the AI response is not available
-                    if text_field_type == 'numeric':
-                        if not isinstance(to_enter, (int, float)):
-                            ai_response = self.ai_response_generator.generate_response(
-                                question_text,
-                                response_type="numeric"
-                            )
-                            to_enter = ai_response if ai_response is not None else 0
-                    elif to_enter == '':
-                        ai_response = self.ai_response_generator.generate_response(
-                            question_text,
-                            response_type="text"
-                        )
-                        to_enter = ai_response if ai_response is not None else " ‏‏‎ "
-
-                    self.enter_text(txt_field, to_enter)
-                    continue
-                except Exception as e:
-                    print(f"An exception occurred while filling up text field")
+        elif source == 'eeo':
+            print(f"EEO-related dropdown question detected: {question_text}")
 
-                # Date Check
-                try:
-                    date_picker = question.find_element(By.CLASS_NAME, 'artdeco-datepicker__input ')
-                    date_picker.clear()
-                    date_picker.send_keys(date.today().strftime("%m/%d/%y"))
-                    time.sleep(1.5)
-                    date_picker.send_keys(Keys.RETURN)
-                    time.sleep(0.5)
-                    continue
-                except Exception as e:
-                    print(f"An exception occurred while filling up date picker field")
+            # 使用AI来智能选择最佳EEO选项
+            choice = options[len(options) - 1]  # 默认选择最后一个选项
+            choices = [(i, option) for i, option in enumerate(options)]
 
-                # Dropdown check
-                try:
-                    question_text = self._extract_question_text(question)
-                    print(f"Dropdown question text: {question_text}")
-                    
-                    # First check whether it matches the custom question
-                    custom_answer = None
-                    if hasattr(self, 'customQuestions'):
-                        for custom_question, answer in self.customQuestions.items():
-                            if custom_question.lower() in question_text:
-                                custom_answer = answer
-                                print(f"Found custom dropdown menu question matching: '{question_text}' -> '{custom_answer}'")
-                                break
-                                
-                    dropdown_field = question.find_element(By.TAG_NAME, 'select')
-                    select = Select(dropdown_field)
-                    options = [option.text for option in select.options]
-                    print(f"Dropdown options: {options}")
-                    
-                    # If there is a custom answer, use it first
-                    if custom_answer:
-                        selected = False
-                        for option in options:
-                            if custom_answer.lower() in option.lower():
-                                self.select_dropdown(dropdown_field, option)
-                                print(f"Custom drop-down menu option selected: '{question_text}' -> '{option}'")
-                                selected = True
-                                break
-                        
-                        if selected:
-                            continue
-
-                    # 如果没有匹配的自定义答案，使用原逻辑
-                    if 'proficiency' in question_text:
-                        proficiency = "None"
-                        for language in self.languages:
-                            if language.lower() in question_text:
-                                proficiency = self.languages[language]
-                                break
-                        self.select_dropdown(dropdown_field, proficiency)
+            # 添加EEO上下文到问题中
+            enhanced_question = self.eeo_question(question_text)
 
-                    elif 'clearance' in question_text:
-                        answer = self.get_answer('securityClearance')
+            ai_response = self.ai_response_generator.generate_response(
+                enhanced_question,
+                response_type="choice",
+                options=choices
+            )
 
-                        choice = ""
-                        for option in options:
-                            if answer == 'yes':
-                                choice = option
-                            else:
-                                if 'no' in option.lower():
-                                    choice = option
-                        if choice == "":
-                            self.record_unprepared_question("dropdown", question_text)
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'assessment' in question_text:
-                        answer = self.get_answer('assessment')
-                        choice = ""
-                        for option in options:
-                            if answer == 'yes':
-                                choice = option
-                            else:
-                                if 'no' in option.lower():
-                                    choice = option
-                        # if choice == "":
-                        #    choice = options[len(options) - 1]
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'commut' in question_text or 'on-site' in question_text or 'hybrid' in question_text or 'onsite' in question_text:
-                        answer = self.get_answer('commute')
-
-                        choice = ""
-                        for option in options:
-                            if answer == 'yes':
-                                choice = option
-                            else:
-                                if 'no' in option.lower():
-                                    choice = option
-                        # if choice == "":
-                        #    choice = options[len(options) - 1]
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'country code' in question_text:
-                        self.select_dropdown(dropdown_field, self.personal_info['Phone Country Code'])
-
-                    elif 'north korea' in question_text:
-                        choice = ""
-                        for option in options:
-                            if 'no' in option.lower():
-                                choice = option
-                        if choice == "":
-                            choice = options[len(options) - 1]
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'previously employed' in question_text or 'previous employment' in question_text:
-                        choice = ""
-                        for option in options:
-                            if 'no' in option.lower():
-                                choice = option
-                        if choice == "":
-                            choice = options[len(options) - 1]
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'sponsor' in question_text:
-                        answer = self.get_answer('requireVisa')
-                        choice = ""
-                        for option in options:
-                            if answer == 'yes':
-                                choice = option
-                            else:
-                                if 'no' in option.lower():
-                                    choice = option
-                        if choice == "":
-                            choice = options[len(options) - 1]
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'above 18' in question_text.lower():  # Check for "above 18" in the question text
-                        choice = ""
-                        for option in options:
-                            if 'yes' in option.lower():  # Select 'yes' option
-                                choice = option
-                        if choice == "":
-                            choice = options[0]  # Default to the first option if 'yes' is not found
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'currently living' in question_text or 'currently reside' in question_text:
-                        answer = self.get_answer('residency')
-                        choice = ""
-                        for option in options:
-                            if answer == 'yes':
-                                choice = option
-                            else:
-                                if 'no' in option.lower():
-                                    choice = option
-                        if choice == "":
-                            choice = options[len(options) - 1]
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'authorized' in question_text or 'authorised' in question_text:
-                        answer = self.get_answer('legallyAuthorized')
-                        choice = ""
-                        for option in options:
-                            if answer == 'yes':
-                                # find some common words
-                                choice = option
-                            else:
-                                if 'no' in option.lower():
-                                    choice = option
-                        if choice == "":
-                            choice = options[len(options) - 1]
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif any(keyword in question_text.lower() for keyword in
-                             [
-                                 'aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
-                                 'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
-                                 'aborigine', 'ancestral', 'native peoples', 'original people',
-                                 'first people', 'gender', 'race', 'disability', 'latino', 'veteran'
-                             ]):
-
-                        print(f"EEO-related dropdown question detected: {question_text}")
-
-                        # 使用AI来智能选择最佳EEO选项
-                        choice = options[len(options) - 1]  # 默认选择最后一个选项
-                        choices = [(i, option) for i, option in enumerate(options)]
-
-                        # 构建EEO上下文信息
-                        eeo_context = ""
-                        if hasattr(self, 'eeo') and self.eeo:
-                            eeo_info = []
-                            for key, value in self.eeo.items():
-                                if value:
-                                    eeo_info.append(f"{key}: {value}")
-                            if eeo_info:
-                                eeo_context = f" My EEO information: {', '.join(eeo_info)}."
-
-                        # 添加EEO上下文到问题中
-                        enhanced_question = question_text + eeo_context
-
-                        ai_response = self.ai_response_generator.generate_response(
-                            enhanced_question,
-                            response_type="choice",
-                            options=choices
-                        )
-
-                        if ai_response is not None:
-                            choice = options[ai_response]
-                            print(f"AI selected EEO option: '{choice}' for question: '{question_text}'")
-                        else:
-                            # AI失败时的后备逻辑 - 使用配置的EEO信息进行基本匹配
-                            print("AI response failed, using fallback EEO matching logic")
-
-                            # 尝试使用EEO配置
-                            if 'gender' in question_text.lower() and 'gender' in self.eeo:
-                                eeo_value = self.eeo['gender']
-                                if 'male' in eeo_value.lower():
-                                    choice = next((option for option in options if
-                                                   'male' in option.lower() and 'female' not in option.lower()), "")
-                                elif 'female' in eeo_value.lower():
-                                    choice = next((option for option in options if 'female' in option.lower()), "")
-
-                            elif 'race' in question_text.lower() and 'race' in self.eeo:
-                                eeo_value = self.eeo['race']
-                                race_mapping = {
-                                    'asian': 'asian',
-                                    'white': 'white',
-                                    'black': ['black', 'african'],
-                                    'hispanic': ['hispanic', 'latino'],
-                                    'american indian': ['american indian', 'alaska'],
-                                    'hawaiian': ['hawaiian', 'pacific'],
-                                    'two or more': ['two', 'more']
-                                }
-
-                                for race_key, search_terms in race_mapping.items():
-                                    if race_key in eeo_value.lower():
-                                        if isinstance(search_terms, list):
-                                            choice = next((option for option in options if
-                                                           any(term in option.lower() for term in search_terms)), "")
-                                        else:
-                                            choice = next(
-                                                (option for option in options if search_terms in option.lower()), "")
-                                        break
-
-                            elif 'disability' in question_text.lower() and 'disability' in self.eeo:
-                                eeo_value = self.eeo['disability']
-                                if 'yes' in eeo_value.lower():
-                                    choice = next((option for option in options if 'yes' in option.lower()), "")
-                                elif 'no' in eeo_value.lower():
-                                    choice = next((option for option in options if 'no' in option.lower()), "")
-
-                            elif 'veteran' in question_text.lower() and 'veteran' in self.eeo:
-                                eeo_value = self.eeo['veteran']
-                                if 'protected veteran' in eeo_value.lower():
-                                    choice = next((option for option in options if
-                                                   'protected' in option.lower() and 'veteran' in option.lower() and 'not' not in option.lower()),
-                                                  "")
-                                elif 'not a protected veteran' in eeo_value.lower():
-                                    choice = next((option for option in options if
-                                                   'not' in option.lower() and 'protected' in option.lower()), "")
-                                elif 'veteran but not' in eeo_value.lower():
-                                    choice = next((option for option in options if
-                                                   'veteran' in option.lower() and 'not' in option.lower() and 'protected' in option.lower()),
-                                                  "")
-
-                            # 如果仍然没有找到匹配项，使用默认的拒绝回答选项
-                            if not choice:
-                                negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish',
-                                                     'choose']
-                                for option in options:
-                                    if any(neg_keyword in option.lower() for neg_keyword in negative_keywords):
-                                        choice = option
-                                        break
-
-                        if not choice and options:
-                            choice = options[len(options) - 1]
-
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'citizenship' in question_text:
-                        answer = self.get_answer('legallyAuthorized')
-                        choice = ""
-                        for option in options:
-                            if answer == 'yes':
-                                if 'no' in option.lower():
-                                    choice = option
-                        if choice == "":
-                            choice = options[len(options) - 1]
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'clearance' in question_text:
-                        answer = self.get_answer('clearance')
-                        choice = ""
-                        for option in options:
-                            if answer == 'yes':
-                                choice = option
+            if ai_response is not None:
+                choice = options[ai_response]
+                print(f"AI selected EEO option: '{choice}' for question: '{question_text}'")
+            else:
+                # AI失败时的后备逻辑 - 使用配置的EEO信息进行基本匹配
+                print("AI response failed, using fallback EEO matching logic")
+
+                # 尝试使用EEO配置
+                if 'gender' in question_text.lower() and 'gender' in self.eeo:
+                    eeo_value = self.eeo['gender']
+                    if 'male' in eeo_value.lower():
+                        choice = next((option for option in options if
+                                       'male' in option.lower() and 'female' not in option.lower()), "")
+                    elif 'female' in eeo_value.lower():
+                        choice = next((option for option in options if 'female' in option.lower()), "")
+
+                elif 'race' in question_text.lower() and 'race' in self.eeo:
+                    eeo_value = self.eeo['race']
+                    race_mapping = {
+                        'asian': 'asian',
+                        'white': 'white',
+                        'black': ['black', 'african'],
+                        'hispanic': ['hispanic', 'latino'],
+                        'american indian': ['american indian', 'alaska'],
+                        'hawaiian': ['hawaiian', 'pacific'],
+                        'two or more': ['two', 'more']
+                    }
+
+                    for race_key, search_terms in race_mapping.items():
+                        if race_key in eeo_value.lower():
+                            if isinstance(search_terms, list):
+                                choice = next((option for option in options if
+                                               any(term in option.lower() for term in search_terms)), "")
                             else:
-                                if 'no' in option.lower():
-                                    choice = option
-                        if choice == "":
-                            choice = options[len(options) - 1]
-
-                        self.select_dropdown(dropdown_field, choice)
-                    elif 'notifications' in question_text and options:
-                        choice = ""
-                        for option in options:
-                            if 'yes' in option.lower():
-                                choice = option
-
-                        if choice == "":
-                            choice = options[len(options) - 1]
-
-                        self.select_dropdown(dropdown_field, choice)
-
-                    elif 'email' in question_text:
-                        continue  # assume email address is filled in properly by default
-
-                    elif 'experience' in question_text or 'understanding' in question_text or 'familiar' in question_text or 'comfortable' in question_text or 'able to' in question_text:
-                        answer = 'no'
-                        if self.experience_default > 0:
-                            answer = 'yes'
-                        else:
-                            for experience in self.experience:
-                                if experience.lower() in question_text and self.experience[experience] > 0:
-                                    answer = 'yes'
-                                    break
-                        if answer == 'no':
-                            # record unlisted experience as unprepared questions
-                            self.record_unprepared_question("dropdown", question_text)
-
-                        choice = ""
-                        for option in options:
-                            if answer in option.lower():
-                                choice = option
-                        if choice == "":
-                            choice = options[len(options) - 1]
-                        self.select_dropdown(dropdown_field, choice)
+                                choice = next(
+                                    (option for option in options if search_terms in option.lower()), "")
+                            break
 
-                    else:
-                        print(f"Unhandled dropdown question: {question_text}")
-                        self.record_unprepared_question("dropdown", question_text)
-
-                        # Since no response can be determined, we use AI to identify the best responseif available, falling back "yes" or the final response if the AI response is not available
-                        choice = options[len(options) - 1]
-                        choices = [(i, option) for i, option in enumerate(options)]
-                        ai_response = self.ai_response_generator.generate_response(
-                            question_text,
-                            response_type="choice",
-                            options=choices
-                        )
-                        if ai_response is not None:
-                            choice = options[ai_response]
-                        else:
-                            choice = ""
-                            for option in options:
-                                if 'yes' in option.lower():
-                                    choice = option
+                elif 'disability' in question_text.lower() and 'disability' in self.eeo:
+                    eeo_value = self.eeo['disability']
+                    if 'yes' in eeo_value.lower():
+                        choice = next((option for option in options if 'yes' in option.lower()), "")
+                    elif 'no' in eeo_value.lower():
+                        choice = next((option for option in options if 'no' in option.lower()), "")
+
+                elif 'veteran' in question_text.lower() and 'veteran' in self.eeo:
+                    eeo_value = self.eeo['veteran']
+                    if 'protected veteran' in eeo_value.lower():
+                        choice = next((option for option in options if
+                                       'protected' in option.lower() and 'veteran' in option.lower() and 'not' not in option.lower()),
+                                      "")
+                    elif 'not a protected veteran' in eeo_value.lower():
+                        choice = next((option for option in options if
+                                       'not' in option.lower() and 'protected' in option.lower()), "")
+                    elif 'veteran but not' in eeo_value.lower():
+                        choice = next((option for option in options if
+                                       'veteran' in option.lower() and 'not' in option.lower() and 'protected' in option.lower()),
+                                      "")
+
+                # 如果仍然没有找到匹配项，使用默认的拒绝回答选项
+                if not choice:
+                    negative_keywords = ['prefer', 'decline', 'don\'t', 'specified', 'none', 'wish',
+                                         'choose']
+                    for option in options:
+                        if any(neg_keyword in option.lower() for neg_keyword in negative_keywords):
+                            choice = option
+                            break
 
-                        print(f"Selected option: {choice}")
-                        self.select_dropdown(dropdown_field, choice)
-                    continue
-                except Exception as e:
-                    print(f"An exception occurred while filling up dropdown field")
+            if not choice and options:
+                choice = options[len(options) - 1]
+
+            self.select_dropdown(dropdown_field, choice)
+
+        elif source == 'citizenship':
+            answer = self.get_answer('legallyAuthorized')
+            choice = ""
+            for option in options:
+                if answer == 'yes':
+                    if 'no' in option.lower():
+                        choice = option
+            if choice == "":
+                choice = options[len(options) - 1]
+            self.select_dropdown(dropdown_field, choice)
+
+        elif source == 'skip':
+            return  # assume email address is filled in properly by default
+
+        elif source == 'experience':
+            answer = 'no'
+            if self.experience_default > 0:
+                answer = 'yes'
+            else:
+                for experience in self.experience:
+                    if experience.lower() in question_text and self.experience[experience] > 0:
+                        answer = 'yes'
+                        break
+            if answer == 'no':
+                # record unlisted experience as unprepared questions
+                self.record_unprepared_question("dropdown", question_text)
+
+            choice = ""
+            for option in options:
+                if answer in option.lower():
+                    choice = option
+            if choice == "":
+                choice = options[len(options) - 1]
+            self.select_dropdown(dropdown_field, choice)
+
+        else:
+            print(f"Unhandled dropdown question: {question_text}")
+            self.record_unprepared_question("dropdown", question_text)
+
+            # Since no response can be determined, we use AI to identify the best responseif available, falling back "yes" or the final response if the AI response is not available
+            choice = options[len(options) - 1]
+            choices = [(i, option) for i, option in enumerate(options)]
+            ai_response = self.ai_response_generator.generate_response(
+                question_text,
+                response_type="choice",
+                options=choices
+            )
+            if ai_response is not None:
+                choice = options[ai_response]
+                self.record_unprepared_answer("dropdown", question_text, choice)
+            else:
+                choice = ""
+                for option in options:
+                    if 'yes' in option.lower():
+                        choice = option
+
+            print(f"Selected option: {choice}")
+            self.select_dropdown(dropdown_field, choice)
+
+    def choose_dropdown_option(self, options, rule):
+        """Dropdown option for a 'checkbox' or 'constant' rule; ``rule.fallback`` applies when no option fits"""
+        choice = ""
+        if rule.source == 'checkbox' and self.get_answer(rule.key) == 'yes':
+            choice = options[len(options) - 1] if options else ""
+        else:
+            wanted = 'no' if rule.source == 'checkbox' else rule.key
+            for option in options:
+                if wanted in option.lower():
+                    choice = option
+        if choice == "" and options:
+            if rule.fallback == 'last':
+                choice = options[len(options) - 1]
+            elif rule.fallback == 'first':
+                choice = options[0]
+        return choice
+
+    def _answer_checkbox_question(self, question, schema):
+        # Checkbox for agreeing to terms and service
+        clickable_checkbox = question.find_element(By.TAG_NAME, 'label')
+        clickable_checkbox.click()
 
-                # Checkbox check for agreeing to terms and service
-                try:
-                    clickable_checkbox = question.find_element(By.TAG_NAME, 'label')
-                    clickable_checkbox.click()
-                except Exception as e:
-                    print(f"An exception occurred while filling up checkbox field")
-            except Exception as e:
-                print(f"An exception occurred while processing the problem")
-                
     def fill_up(self):
         try:
             easy_apply_modal_content = self.browser.find_element(By.CLASS_NAME, "jobs-easy-apply-modal__content")
@@ -2387,26 +2531,40 @@ class LinkedinEasyApply:
     def write_to_file(self, company, job_title, link, location, search_location):
         to_write = [company, job_title, link, location, search_location, datetime.now()]
         file_path = self.file_name + ".csv"
-        print(f'updated {file_path}.')
-
-        with open(file_path, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow(to_write)
+        self.state_writer.append_csv_row(file_path, to_write)
+        print(f'Queued update of {file_path}.')
 
     def record_unprepared_question(self, answer_type, question_text):
-        to_write = [answer_type, question_text]
-        file_path = self.unprepared_questions_file_name + ".csv"
-
         try:
-            with open(file_path, 'a') as f:
-                writer = csv.writer(f)
-                writer.writerow(to_write)
-                print(f'Updated {file_path} with {to_write}.')
-        except:
-            print(
-                "Special characters in questions are not allowed. Failed to update unprepared questions log.")
+            entry = self.unprepared_questions.record(answer_type, question_text, job_id=self.current_job_id)
+            if entry:
+                print(f"Queued unprepared {answer_type} question for saving (seen {entry['count']} times): "
+                      f"{question_text}")
+        except Exception as e:
+            print(f"Failed to update unprepared questions catalog: {e}")
             print(question_text)
 
+    def record_unprepared_answer(self, answer_type, question_text, answer):
+        """Remember the AI answer given to an unprepared question"""
+        try:
+            self.unprepared_questions.record_ai_answer(answer_type, question_text, answer)
+        except Exception as e:
+            print(f"Failed to record AI answer for unprepared question: {e}")
+
+    def materialize_job_list(self, scrollable_element, list_element):
+        """Scroll the results list until every tile is rendered, falling back to fixed-step scrolling"""
+        pace = (0.5, 0.6) if self.list_scroll_pacing == 'human' else None
+        start = time.perf_counter()
+        try:
+            report = materialize_job_list(self.browser, scrollable_element, list_element, pace=pace)
+            print(f"Rendered {report['hydrated']}/{report['tiles']} job tiles in {report['steps']} scroll steps, "
+                  f"{time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            print(f"Load-detecting scroll failed, using fixed-step scrolling: {e}")
+            self.scroll_slow(scrollable_element, step=600)  # Scroll down
+            self.scroll_slow(scrollable_element, step=900, reverse=True)  # Scroll up
+            print(f"Scrolled job list in {time.perf_counter() - start:.1f}s")
+
     def scroll_slow(self, scrollable_element, start=0, end=3600, step=100, reverse=False):
         if reverse:
             start, end = end, start
@@ -2442,7 +2600,8 @@ class LinkedinEasyApply:
             
         # 注意：我们现在在页面内容中直接检查申请人数，不再使用URL参数
 
-        if parameters['newestPostingsFirst']:
+        # Incremental mode lists newest first so a search can stop once it reaches jobs it already processed
+        if parameters['newestPostingsFirst'] or parameters.get('incrementalSearch', False):
             newestPostingsFirst_url += "&sortBy=DD"
 
         level = 1
@@ -2494,6 +2653,11 @@ class LinkedinEasyApply:
                     date_url = dates[key]
                     break
 
+        # In incremental mode the date window is set per search by next_job_page instead
+        self.search_window_seconds = int(date_url[len("&f_TPR=r"):]) if date_url else None
+        if parameters.get('incrementalSearch', False):
+            date_url = ""
+
         easy_apply_url = "&f_AL=true"
 
         extra_search_terms = [distance_url, remote_url, lessthanTenApplicants_url, newestPostingsFirst_url, job_types_url, experience_url]
@@ -2502,15 +2666,38 @@ class LinkedinEasyApply:
 
         return extra_search_terms_str
 
-    def next_job_page(self, position, location_url, job_page):
+    def next_job_page(self, position, location_url, job_page, window_url=""):
         # location_url should already contain "&location=...&geoId=..."
         # Build the complete URL properly
         url = "https://www.linkedin.com/jobs/search/?" + self.base_search_url.lstrip('&') + \
-              "&keywords=" + position + location_url + "&start=" + str(job_page * 25)
+              "&keywords=" + position + location_url + window_url + "&start=" + str(job_page * 25)
+        self.current_search = {'position': position, 'location': self.current_search.get('location'), 'page': job_page}
         self.browser.get(url)
 
         self.avoid_lock()
 
+    def get_location_url(self, location):
+        """Build the location part of a search URL, resolving the geoId through the cache"""
+        geo_id = self.geo_cache.get(location)
+        if geo_id is None:
+            start = time.perf_counter()
+            geo_id = self.click_location_url(location)
+            if geo_id:
+                self.geo_cache.put(location, geo_id)
+                print(f"Resolved geoId {geo_id} for '{location}' in {time.perf_counter() - start:.1f}s")
+        else:
+            print(f"Using cached geoId {geo_id} for '{location}'")
+        return "&location=" + location + "&geoId=" + (geo_id or '')
+
+    def pre_resolve_locations(self, locations):
+        """Resolve every location missing from the geoId cache before searching starts"""
+        missing = self.geo_cache.missing(locations)
+        if not missing:
+            return
+        print(f"Resolving geoIds for {len(missing)} locations: {', '.join(missing)}")
+        for location in missing:
+            self.get_location_url(location)
+
     def click_location_url(self, keyword):
         try:
             self.browser.get("https://www.linkedin.com/jobs/search/")
@@ -2534,11 +2721,11 @@ class LinkedinEasyApply:
             
             # 现在输入新位置
             location_input.send_keys(keyword)
-            time.sleep(2)
+            self.waiter.wait('location_typeahead', TYPEAHEAD_READY, budget=(2, 2))
 
             location_seach_button = self.browser.find_element(By.XPATH, '//*[@id="global-nav-search"]/div/div[2]/button[1]')
             location_seach_button.click()
-            time.sleep(5)
+            self.waiter.wait('location_search', URL_HAS_GEO_ID, budget=(5, 5), timeout=10)
             # 获取当前地址的链接,提取参数geoId
             url = self.browser.current_url
             geoId = self.parse_geoId_from_url(url)
@@ -2575,6 +2762,7 @@ class LinkedinEasyApply:
                     upload_type = self.browser.find_element(By.CSS_SELECTOR, f"label[for='{input_id}']")
                     if 'resume' in upload_type.text.lower():
                         upload_button.send_keys(self.resume_dir)
+                        self.waiter.wait('resume_upload', UPLOAD_FINISHED, timeout=15)
                     elif 'cover' in upload_type.text.lower():
                         if self.cover_letter_dir != '':
                             upload_button.send_keys(self.cover_letter_dir)
@@ -2641,7 +2829,7 @@ class LinkedinEasyApply:
                     print("Trying to fill up city field")
                     print(self.personal_info['City'])
                     self.enter_text(input_field, self.personal_info['City'])
-                    time.sleep(1.5)
+                    self.waiter.wait('city_typeahead', TYPEAHEAD_READY, budget=(1.5, 1.5))
                     input_field.send_keys(Keys.DOWN)
                     input_field.send_keys(Keys.RETURN)
 
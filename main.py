@@ -4,6 +4,7 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
 from validate_email import validate_email
 from linkedineasyapply import LinkedinEasyApply
+from persistence import install_flush_handlers
 import shutil
 import sys
 import platform # For more detailed platform info like machine architecture
@@ -656,6 +657,7 @@ if __name__ == '__main__':
     args = parser.parse_args()
 
     parameters = validate_yaml(args.config)
+    parameters['configPath'] = args.config  # lets the bot hot-reload customQuestions
     browser = None
 
     browser = init_browser()
@@ -664,6 +666,7 @@ if __name__ == '__main__':
         print("Script cannot continue due to browser initialization failure. Please check the error messages above.")
     else:
         bot = LinkedinEasyApply(parameters, browser)
+        install_flush_handlers(bot.state_writer)  # queued state is written on exit and SIGTERM
         bot.login()
         bot.security_check()
         bot.start_applying()
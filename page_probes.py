@@ -0,0 +1,190 @@
+import json
+import time
+
+DAILY_LIMIT_MESSAGES = [
+    "you've reached today's easy apply limit",
+    "reached today's easy apply limit",
+    "easy apply limit for today",
+    "continue applying tomorrow",
+    "daily submissions to help ensure",
+    "您已达到今天的快速申请限额",
+    "今日快速申请限额",
+    "明天继续申请"
+]
+
+# Casefolded here and matched against the casefolded probe text, which covers the whole modal, so
+# only error wording belongs here: field labels and section headers would flag every step they appear on
+VALIDATION_ERROR_MESSAGES = [message.casefold() for message in [
+    'enter a valid',
+    'enter a decimal',
+    'Enter a whole number',
+    'Enter a whole number between 0 and 99',
+    'file is required',
+    'whole number',
+    'make a selection',
+    'select checkbox to proceed',
+    'saisissez un numéro',
+    '请输入whole编号',
+    '请输入decimal编号',
+    '长度超过 0.0',
+    'Introduce un número de whole entre',
+    'Inserisci un numero whole compreso',
+    'Insira um um número',
+    'use the format',
+    'A file is required',
+    '请选择',
+    '请 选 择',
+    '請選擇',
+    '請 選 擇',
+    '請輸入有效',
+    'wholenummer',
+    'Wpisz liczb',
+    'zakresu od',
+    'tussen',
+]]
+
+NO_RESULTS_MESSAGES = [
+    'no matching jobs found',
+    'unfortunately, things are',
+]
+
+CHECKPOINT_MESSAGES = [
+    'security check',
+    'quick verification',
+]
+
+# Regions whose text each probe reads, instead of the whole serialized page
+PROBE_REGIONS = {
+    'search': '.jobs-search-two-pane__no-results-banner--expand, [class*="no-results"], .artdeco-empty-state, '
+              '[role="alert"]',
+    'apply': '.jobs-easy-apply-modal, .artdeco-modal, [role="alertdialog"], [role="alert"], .artdeco-toast-item',
+    'checkpoint': 'main h1, main h2, form h1, form h2, [role="alert"]',
+}
+
+# Returns the visible text of the matching regions (outermost matches only),
+# the visible inline validation errors with the ID of the field they belong
+# to, and the URL and title. arguments: region selector, max chars per region.
+PROBE_JS = """
+const [selector, maxChars] = arguments;
+const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+const regions = [];
+for (const el of document.querySelectorAll(selector)) {
+    if (!visible(el) || regions.some(region => region.contains(el))) {
+        continue;
+    }
+    regions.push(el);
+}
+const errors = [];
+for (const feedback of document.querySelectorAll('.artdeco-inline-feedback--error')) {
+    if (!visible(feedback)) {
+        continue;
+    }
+    let field = feedback.id ? document.querySelector('[aria-describedby~="' + CSS.escape(feedback.id) + '"]') : null;
+    if (!field) {
+        const container = feedback.closest('.fb-dash-form-element, .jobs-easy-apply-form-element, [data-test-form-element]');
+        field = container ? container.querySelector('input, select, textarea') : null;
+    }
+    errors.push({field_id: field ? field.id : '', message: (feedback.innerText || '').trim()});
+}
+return {
+    url: location.href,
+    title: document.title,
+    text: regions.map(el => (el.innerText || '').slice(0, maxChars)).join('\\n'),
+    errors: errors,
+};
+"""
+
+
+class PageState:
+    """Typed result of a page probe"""
+
+    OK = 'ok'
+    NO_RESULTS = 'no_results'
+    DAILY_LIMIT = 'daily_limit'
+    VALIDATION_ERROR = 'validation_error'
+    CHECKPOINT = 'checkpoint'
+
+    def __init__(self, kind, errors=None, url='', text=''):
+        self.kind = kind
+        self.errors = errors or []  # [{'field_id': ..., 'message': ...}] for validation errors
+        self.url = url
+        self.text = text
+
+    def error_summary(self):
+        return "; ".join(f"{error['field_id'] or '?'}: {error['message']}" for error in self.errors)
+
+    def __repr__(self):
+        return f"PageState({self.kind!r}, errors={len(self.errors)})"
+
+
+def classify(probe, region):
+    """Map raw probe data to a PageState"""
+    text = (probe.get('text') or '').casefold()
+    url = probe.get('url') or ''
+    errors = [error for error in probe.get('errors') or [] if error.get('message') or error.get('field_id')]
+    heading_text = text + '\n' + (probe.get('title') or '').casefold()
+    if '/checkpoint/challenge/' in url or \
+            (region == 'checkpoint' and any(message in heading_text for message in CHECKPOINT_MESSAGES)):
+        return PageState(PageState.CHECKPOINT, url=url, text=text)
+    if any(message in text for message in DAILY_LIMIT_MESSAGES):
+        return PageState(PageState.DAILY_LIMIT, url=url, text=text)
+    if region == 'apply' and (errors or any(message in text for message in VALIDATION_ERROR_MESSAGES)):
+        return PageState(PageState.VALIDATION_ERROR, errors=errors, url=url, text=text)
+    if region == 'search' and any(message in text for message in NO_RESULTS_MESSAGES):
+        return PageState(PageState.NO_RESULTS, url=url, text=text)
+    return PageState(PageState.OK, url=url, text=text)
+
+
+class PageProbe:
+    """Page state checks that read only the relevant regions of the page.
+
+    Each probe is one ``execute_script`` call returning a few KB at most, in
+    place of ``browser.page_source``. To report what that saves, the full page
+    source is fetched and timed on the first probe and every
+    ``calibrate_every`` probes after that; savings are measured against the
+    latest such sample.
+    """
+
+    def __init__(self, browser, calibrate_every=50, max_chars=20000):
+        self.browser = browser
+        self.calibrate_every = calibrate_every
+        self.max_chars = max_chars
+        self.probes = 0
+        self.page_source_bytes = None
+        self.page_source_ms = None
+        self.bytes_saved = 0
+        self.ms_saved = 0.0
+
+    def _calibrate(self):
+        start = time.perf_counter()
+        page_source = self.browser.page_source
+        self.page_source_ms = (time.perf_counter() - start) * 1000
+        self.page_source_bytes = len(page_source.encode('utf-8'))
+
+    def probe(self, region):
+        """Return the PageState for ``region`` ('search', 'apply' or 'checkpoint')"""
+        if self.calibrate_every and self.probes % self.calibrate_every == 0:
+            try:
+                self._calibrate()
+            except Exception as e:
+                print(f"Could not sample page source size: {e}")
+        self.probes += 1
+
+        start = time.perf_counter()
+        probe = self.browser.execute_script(PROBE_JS, PROBE_REGIONS[region], self.max_chars) or {}
+        probe_ms = (time.perf_counter() - start) * 1000
+        probe_bytes = len(json.dumps(probe, ensure_ascii=False).encode('utf-8'))
+        state = classify(probe, region)
+
+        if self.page_source_bytes is not None:
+            bytes_saved = self.page_source_bytes - probe_bytes
+            ms_saved = self.page_source_ms - probe_ms
+            self.bytes_saved += bytes_saved
+            self.ms_saved += ms_saved
+            print(f"Probe {region}: {state.kind}, {probe_bytes} bytes in {probe_ms:.0f} ms "
+                  f"(saved {bytes_saved / 1024:.0f} KB, {ms_saved:.0f} ms vs page_source)")
+        return state
+
+    def summary(self):
+        return (f"{self.probes} page probes saved ~{self.bytes_saved / (1024 * 1024):.1f} MB "
+                f"and ~{self.ms_saved / 1000:.1f}s compared to page_source scans")
@@ -0,0 +1,93 @@
+from collections import Counter
+
+# Reasons a search stopped walking result pages, as shown in the run summary
+ZERO_YIELD = 'zero-yield pages in a row'
+PAGE_BUDGET = 'page budget reached'
+END_OF_RESULTS = 'end of results'
+ONLY_SUGGESTIONS = 'only suggested jobs left'
+LIST_NOT_FOUND = 'job list not found'
+POSITION_TARGET = 'position target reached'
+DAILY_LIMIT = 'daily limit reached'
+ERROR = 'error'
+
+# Stops that reached the end of the results, so the search counts as completed. A zero-yield stop
+# does not: pages past the ones already seen can still hold new jobs
+COMPLETE_REASONS = {END_OF_RESULTS, ONLY_SUGGESTIONS}
+
+_EXCEPTION_REASONS = [
+    ("Daily limit reached", DAILY_LIMIT),
+    ("No more jobs on this page.", END_OF_RESULTS),
+    ("Nothing to do here, moving forward...", ONLY_SUGGESTIONS),
+    ("Job list UI elements not found", LIST_NOT_FOUND),
+]
+
+
+def stop_reason_for(error):
+    """Map an exception that ended a page walk to a stop reason"""
+    message = str(error)
+    for fragment, reason in _EXCEPTION_REASONS:
+        if fragment in message:
+            return reason
+    return ERROR
+
+
+class PaginationController:
+    """Decides when to stop walking the result pages of a search.
+
+    A page's yield is the number of tiles that passed the filters and were
+    opened. Once ``max_zero_pages`` pages in a row yield nothing (everything
+    seen, applied or blacklisted) the search stops, as it does when the page
+    budget from the search plan runs out. The reason each search stopped is
+    counted for the run summary.
+    """
+
+    def __init__(self, max_zero_pages=2):
+        self.max_zero_pages = max_zero_pages
+        self.reasons = Counter()
+        self.pages = 0
+        self.zero_pages = 0
+        self.last_reason = None
+        self._budget = None
+        self._search_pages = 0
+        self._zero_run = 0
+        self._ended = True
+
+    def start(self, page_budget=None):
+        self._budget = page_budget
+        self._search_pages = 0
+        self._zero_run = 0
+        self._ended = False
+        self.last_reason = None
+
+    def record_page(self, page_stats):
+        self.pages += 1
+        self._search_pages += 1
+        if (page_stats or {}).get('new_jobs', 0):
+            self._zero_run = 0
+        else:
+            self.zero_pages += 1
+            self._zero_run += 1
+
+    def should_stop(self):
+        """Return the reason to stop before fetching the next page, or None"""
+        if self.max_zero_pages and self._zero_run >= self.max_zero_pages:
+            return f"{self._zero_run} {ZERO_YIELD}"
+        if self._budget and self._search_pages >= self._budget:
+            return PAGE_BUDGET
+        return None
+
+    def end(self, reason):
+        """Record why the current search stopped; only the first reason counts"""
+        if self._ended:
+            return
+        self._ended = True
+        self.last_reason = ZERO_YIELD if reason.endswith(ZERO_YIELD) else reason
+        self.reasons[self.last_reason] += 1
+
+    def completed(self):
+        """Whether the search that just ended was walked to the end of its results"""
+        return self.last_reason in COMPLETE_REASONS
+
+    def summary(self):
+        stops = ", ".join(f"{reason} {count}" for reason, count in self.reasons.most_common()) or "none"
+        return f"Walked {self.pages} result pages ({self.zero_pages} with no new jobs); searches stopped: {stops}"
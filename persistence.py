@@ -0,0 +1,182 @@
+import io
+import os
+import csv
+import json
+import time
+import atexit
+import signal
+import tempfile
+import threading
+
+
+def atomic_write(path, data, encoding='utf-8'):
+    """Write ``data`` (str or bytes) to ``path`` through a temp file and rename.
+
+    The temp file lives in the same directory so ``os.replace`` is atomic; a
+    crash leaves either the old file or the new one, never a truncated mix.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    prefix = '.' + os.path.basename(path) + '.'
+    fd, tmp_path = tempfile.mkstemp(prefix=prefix, suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data.encode(encoding) if isinstance(data, str) else data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write_json(path, data, **dump_kwargs):
+    dump_kwargs.setdefault('ensure_ascii', False)
+    atomic_write(path, json.dumps(data, **dump_kwargs))
+
+
+class WriteBehindWriter:
+    """Buffers bot state writes and performs them on a background thread.
+
+    Two kinds of writes are supported:
+    - snapshots (``write_json``/``write_bytes``): only the latest content per
+      path is kept and written atomically with ``atomic_write``
+    - appends (``append_csv_row``/``append_text``): chunks are batched and
+      appended with a single write + fsync per file
+
+    Pending writes are flushed once ``max_pending`` records are queued or
+    ``flush_interval`` seconds after the first one, and always on ``flush``
+    and ``close``; ``install_flush_handlers`` adds interpreter exit and
+    SIGTERM. Callers on the Selenium thread only pay for copying their data
+    into the queue.
+    """
+
+    def __init__(self, flush_interval=5.0, max_pending=50):
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._snapshots = {}  # path -> bytes/str/(data, dump_kwargs)
+        self._appends = {}  # path -> [text chunk, ...]
+        self._pending = 0
+        self._first_pending_at = None
+        # Re-entrant so a SIGTERM arriving mid-enqueue or mid-flush can still flush
+        self._lock = threading.RLock()
+        self._io_lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='WriteBehindWriter', daemon=True)
+        self._thread.start()
+
+    def _enqueue(self, update):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WriteBehindWriter is closed")
+            update()
+            self._pending += 1
+            if self._first_pending_at is None:
+                self._first_pending_at = time.monotonic()
+            self._wakeup.notify()
+
+    def write_json(self, path, data, **dump_kwargs):
+        """Queue a JSON snapshot; ``data`` must not be mutated by the caller afterwards"""
+        self._enqueue(lambda: self._snapshots.__setitem__(path, (data, dump_kwargs)))
+
+    def write_bytes(self, path, data):
+        self._enqueue(lambda: self._snapshots.__setitem__(path, data))
+
+    def append_text(self, path, text):
+        self._enqueue(lambda: self._appends.setdefault(path, []).append(text))
+
+    def append_csv_row(self, path, row):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow(row)
+        self.append_text(path, buffer.getvalue())
+
+    def _take_pending(self):
+        snapshots, appends = self._snapshots, self._appends
+        self._snapshots, self._appends = {}, {}
+        self._pending = 0
+        self._first_pending_at = None
+        return snapshots, appends
+
+    def _write(self, snapshots, appends):
+        for path, content in snapshots.items():
+            try:
+                if isinstance(content, tuple):
+                    data, dump_kwargs = content
+                    atomic_write_json(path, data, **dump_kwargs)
+                else:
+                    atomic_write(path, content)
+            except Exception as e:
+                print(f"Failed to write {path}: {e}")
+        for path, chunks in appends.items():
+            try:
+                with open(path, 'a', newline='', encoding='utf-8') as f:
+                    f.write(''.join(chunks))
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                print(f"Failed to append {len(chunks)} records to {path}: {e}")
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._closed:
+                    if self._pending >= self.max_pending:
+                        break
+                    if self._first_pending_at is not None:
+                        remaining = self._first_pending_at + self.flush_interval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._wakeup.wait(remaining)
+                    else:
+                        self._wakeup.wait()
+                if self._closed:
+                    return
+            self.flush()
+
+    def flush(self):
+        """Write everything queued so far before returning
+
+        The I/O lock is always taken before the queue lock, and batches are
+        written in the order they were taken, so a newer snapshot is never
+        overwritten by an older one.
+        """
+        with self._io_lock:
+            with self._lock:
+                snapshots, appends = self._take_pending()
+            self._write(snapshots, appends)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wakeup.notify()
+        self.flush()
+
+
+def install_flush_handlers(writer):
+    """Close ``writer`` at interpreter exit and flush it on SIGTERM/SIGBREAK.
+
+    Meant for the program's entry point: it replaces process-wide signal
+    handlers, chaining to the previous ones, so library code should not call it.
+    """
+    atexit.register(writer.close)
+    if threading.current_thread() is not threading.main_thread():
+        return
+    for signum in (getattr(signal, 'SIGTERM', None), getattr(signal, 'SIGBREAK', None)):
+        if signum is None:
+            continue
+
+        def handle_signal(signum, frame, previous=signal.getsignal(signum)):
+            writer.flush()
+            if callable(previous):
+                previous(signum, frame)
+            else:
+                raise SystemExit(128 + signum)
+
+        try:
+            signal.signal(signum, handle_signal)
+        except (ValueError, OSError):
+            pass
@@ -0,0 +1,144 @@
+import os
+import re
+import csv
+import json
+import argparse
+from datetime import datetime
+
+from persistence import atomic_write_json
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_TRAILING_MARKS_RE = re.compile(r'[\s*:?？：。.]+$')
+
+MAX_EXAMPLE_JOB_IDS = 5
+
+
+def normalize_question(question_text):
+    """Lowercase, collapse whitespace and drop trailing '?', ':' and required-field '*' marks"""
+    if not question_text:
+        return ""
+    text = _WHITESPACE_RE.sub(' ', str(question_text)).strip().lower()
+    return _TRAILING_MARKS_RE.sub('', text)
+
+
+class UnpreparedQuestionCatalog:
+    """Aggregated record of questions the bot could not answer from the config.
+
+    Entries are keyed by (normalized question text, answer type) and hold the
+    number of occurrences, first/last seen times, a few example job IDs and the
+    AI answer last used for the question. The catalog is updated in memory and
+    written as one JSON snapshot by ``flush``; a legacy
+    ``unprepared_questions.csv`` next to it is folded in on first load.
+    """
+
+    def __init__(self, path, writer=None):
+        self.path = path
+        self.writer = writer
+        self._entries = {}  # (normalized question, answer type) -> entry dict
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    for entry in json.load(f):
+                        self._entries[(entry['key'], entry['answer_type'])] = entry
+            except Exception as e:
+                print(f"Failed to load unprepared questions catalog {self.path}: {e}")
+            return
+
+        legacy_csv = os.path.splitext(self.path)[0] + '.csv'
+        if os.path.exists(legacy_csv):
+            seen_at = datetime.fromtimestamp(os.path.getmtime(legacy_csv)).isoformat()
+            with open(legacy_csv, 'r', encoding='utf-8', errors='replace', newline='') as f:
+                for row in csv.reader(f):
+                    if len(row) >= 2:
+                        self.record(row[0], row[1], seen_at=seen_at)
+            print(f"Imported {len(self._entries)} unprepared questions from {legacy_csv}")
+
+    def _entry(self, answer_type, question_text, seen_at):
+        key = normalize_question(question_text)
+        if not key:
+            return None
+        entry = self._entries.get((key, answer_type))
+        if entry is None:
+            entry = {
+                'key': key,
+                'question': str(question_text).strip(),
+                'answer_type': answer_type,
+                'count': 0,
+                'first_seen': seen_at,
+                'last_seen': seen_at,
+                'example_job_ids': [],
+                'last_ai_answer': None,
+            }
+            self._entries[(key, answer_type)] = entry
+        return entry
+
+    def record(self, answer_type, question_text, job_id=None, seen_at=None):
+        """Count one more occurrence of an unprepared question"""
+        seen_at = seen_at or datetime.now().isoformat()
+        entry = self._entry(answer_type, question_text, seen_at)
+        if entry is None:
+            return None
+        entry['count'] += 1
+        entry['last_seen'] = seen_at
+        if job_id is not None and job_id not in entry['example_job_ids']:
+            entry['example_job_ids'] = (entry['example_job_ids'] + [job_id])[-MAX_EXAMPLE_JOB_IDS:]
+        self._dirty = True
+        return entry
+
+    def record_ai_answer(self, answer_type, question_text, answer):
+        """Remember the AI answer used for a question so it can become a custom answer"""
+        entry = self._entries.get((normalize_question(question_text), answer_type))
+        if entry is None or answer is None:
+            return
+        entry['last_ai_answer'] = answer
+        self._dirty = True
+
+    def flush(self):
+        if not self._dirty:
+            return False
+        snapshot = [dict(entry, example_job_ids=list(entry['example_job_ids'])) for entry in self._entries.values()]
+        if self.writer:
+            self.writer.write_json(self.path, snapshot, indent=2)
+        else:
+            atomic_write_json(self.path, snapshot, indent=2)
+        self._dirty = False
+        return True
+
+    def most_frequent(self, limit=None):
+        ranked = sorted(self._entries.values(), key=lambda entry: (-entry['count'], entry['key']))
+        return ranked[:limit] if limit else ranked
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def export_custom_questions(catalog, limit=50):
+    """Render the most frequent questions as a ``customQuestions`` YAML block"""
+    lines = ["customQuestions:"]
+    for entry in catalog.most_frequent(limit):
+        answer = entry['last_ai_answer']
+        lines.append(f"  # {entry['count']}x {entry['answer_type']}, last seen {entry['last_seen'][:10]}")
+        lines.append(f"  {json.dumps(entry['question'], ensure_ascii=False)}: "
+                     f"{json.dumps('' if answer is None else str(answer), ensure_ascii=False)}")
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Rank unprepared questions and export them as customQuestions entries")
+    parser.add_argument('catalog', nargs='?', default='unprepared_questions.json')
+    parser.add_argument('--top', type=int, default=50, help='Number of questions to export')
+    parser.add_argument('--yaml', action='store_true', help='Print a customQuestions YAML block instead of a table')
+    args = parser.parse_args()
+
+    catalog = UnpreparedQuestionCatalog(args.catalog)
+    if args.yaml:
+        print(export_custom_questions(catalog, args.top))
+    else:
+        print(f"{'count':>6}  {'type':<9} {'last seen':<10}  question -> last AI answer")
+        for entry in catalog.most_frequent(args.top):
+            print(f"{entry['count']:>6}  {entry['answer_type']:<9} {entry['last_seen'][:10]:<10}  "
+                  f"{entry['question']} -> {entry['last_ai_answer']}")
@@ -0,0 +1,173 @@
+from keyword_matcher import KeywordMatcher
+
+
+class QuestionRule:
+    """Maps questions containing any of ``keywords`` to an answer source.
+
+    ``source`` names how the answer is produced (``checkbox`` reads the
+    ``checkboxes`` config entry ``key``, ``constant`` answers ``key``,
+    ``personal`` reads ``personalInfo[key]``; the other sources have their own
+    handler code). A rule does not apply when the question also contains one
+    of ``exclude``, when ``eeo_key`` is set but missing from the EEO config, or
+    when ``needs_options`` is set and the control has no options.
+    ``fallback`` tells dropdown answers what to pick when no option matches:
+    ``last``, ``first``, ``record`` (leave empty and record the question) or
+    None (leave empty).
+    """
+
+    def __init__(self, name, keywords, source, key=None, exclude=(), fallback=None, eeo_key=None,
+                 needs_options=False):
+        self.name = name
+        self.keywords = [keyword.casefold() for keyword in keywords]
+        self.source = source
+        self.key = key
+        self.exclude = [keyword.casefold() for keyword in exclude]
+        self.fallback = fallback
+        self.eeo_key = eeo_key
+        self.needs_options = needs_options
+
+    def __repr__(self):
+        return f"QuestionRule({self.name!r}, {self.source!r}, {self.key!r})"
+
+
+EEO_KEYWORDS = [
+    'aboriginal', 'native', 'indigenous', 'tribe', 'first nations',
+    'native american', 'native hawaiian', 'inuit', 'metis', 'maori',
+    'aborigine', 'ancestral', 'native peoples', 'original people',
+    'first people', 'gender', 'race', 'disability', 'latino',
+]
+
+# Rules per control type, highest priority first: a question gets the first
+# rule that applies, like the if/elif chains these replace.
+RULES = {
+    'radio': [
+        QuestionRule('drivers_licence', ["driver's licence", "driver's license"], 'checkbox', 'driversLicence'),
+        QuestionRule('eeo', EEO_KEYWORDS + ['torres', 'do you identify'], 'eeo'),
+        QuestionRule('assessment', ['assessment'], 'checkbox', 'assessment'),
+        QuestionRule('clearance', ['clearance'], 'checkbox', 'securityClearance'),
+        QuestionRule('north_korea', ['north korea'], 'constant', 'no'),
+        QuestionRule('previously_employed', ['previously employ', 'previous employ'], 'constant', 'no'),
+        QuestionRule('authorized', ['authorized', 'authorised', 'legally'], 'checkbox', 'legallyAuthorized'),
+        QuestionRule('certified', ['certified', 'certificate', 'cpa', 'chartered accountant', 'qualification'],
+                     'checkbox', 'certifiedProfessional'),
+        QuestionRule('urgent', ['urgent'], 'checkbox', 'urgentFill'),
+        QuestionRule('commute', ['commut', 'on-site', 'hybrid', 'onsite'], 'checkbox', 'commute'),
+        QuestionRule('remote', ['remote'], 'checkbox', 'remote'),
+        QuestionRule('background_check', ['background check'], 'checkbox', 'backgroundCheck'),
+        QuestionRule('drug_test', ['drug test'], 'checkbox', 'drugTest'),
+        QuestionRule('residency', ['currently living', 'currently reside', 'right to live'], 'checkbox', 'residency'),
+        QuestionRule('education', ['level of education'], 'education'),
+        QuestionRule('experience', ['experience'], 'experience'),
+        QuestionRule('data_retention', ['data retention'], 'constant', 'no'),
+        QuestionRule('sponsor', ['sponsor'], 'checkbox', 'requireVisa'),
+        QuestionRule('veteran', ['veteran'], 'veteran', eeo_key='veteran'),
+    ],
+    'text': [
+        QuestionRule('experience_years', ['experience'], 'experience_years', exclude=['salary']),
+        QuestionRule('years_in', ['how many years in'], 'experience_years'),
+        QuestionRule('gpa', ['grade point average'], 'gpa'),
+        QuestionRule('first_name', ['first name'], 'personal', 'First Name'),
+        QuestionRule('last_name', ['last name'], 'personal', 'Last Name'),
+        QuestionRule('full_name', ['name'], 'full_name'),
+        QuestionRule('pronouns', ['pronouns'], 'personal', 'Pronouns'),
+        QuestionRule('phone', ['phone', '联系电话'], 'personal', 'Mobile Phone Number'),
+        QuestionRule('linkedin', ['linkedin'], 'personal', 'Linkedin'),
+        QuestionRule('message', ['message to hiring', 'cover letter'], 'personal', 'MessageToManager'),
+        QuestionRule('website', ['website', 'github', 'portfolio'], 'personal', 'Website'),
+        QuestionRule('notice', ['notice', 'weeks'], 'notice'),
+        QuestionRule('salary', ['salary', 'expectation', 'compensation', 'ctc'], 'salary'),
+    ],
+    'select': [
+        QuestionRule('language', ['proficiency'], 'language'),
+        QuestionRule('clearance', ['clearance'], 'checkbox', 'securityClearance', fallback='record'),
+        QuestionRule('assessment', ['assessment'], 'checkbox', 'assessment'),
+        QuestionRule('commute', ['commut', 'on-site', 'hybrid', 'onsite'], 'checkbox', 'commute'),
+        QuestionRule('country_code', ['country code'], 'personal', 'Phone Country Code'),
+        QuestionRule('north_korea', ['north korea'], 'constant', 'no', fallback='last'),
+        QuestionRule('previously_employed', ['previously employed', 'previous employment'], 'constant', 'no',
+                     fallback='last'),
+        QuestionRule('sponsor', ['sponsor'], 'checkbox', 'requireVisa', fallback='last'),
+        QuestionRule('above_18', ['above 18'], 'constant', 'yes', fallback='first'),
+        QuestionRule('residency', ['currently living', 'currently reside'], 'checkbox', 'residency', fallback='last'),
+        QuestionRule('authorized', ['authorized', 'authorised'], 'checkbox', 'legallyAuthorized', fallback='last'),
+        QuestionRule('eeo', EEO_KEYWORDS + ['veteran'], 'eeo'),
+        QuestionRule('citizenship', ['citizenship'], 'citizenship'),
+        QuestionRule('notifications', ['notifications'], 'constant', 'yes', fallback='last', needs_options=True),
+        QuestionRule('email', ['email'], 'skip'),
+        QuestionRule('experience', ['experience', 'understanding', 'familiar', 'comfortable', 'able to'],
+                     'experience'),
+    ],
+}
+
+# Schema control types that share another type's rules
+CONTROL_ALIASES = {'numeric': 'text', 'dropdown': 'select'}
+
+
+class QuestionRuleEngine:
+    """Classifies a question for its control type with one keyword scan.
+
+    The keywords of each control's rule table are compiled into one
+    KeywordMatcher when the engine is built; ``match`` scans the question once
+    and walks only the rules whose keywords occurred, in priority order. The
+    same questions come back on almost every form, so the candidate rules of
+    each question are remembered (up to ``memo_size`` questions) and later
+    forms skip the scan.
+    """
+
+    def __init__(self, rules=None, memo_size=4096):
+        self.rules = rules or RULES
+        self.memo_size = memo_size
+        self._matchers = {}
+        self._by_keyword = {}  # control -> keyword -> [priority]
+        for control, table in self.rules.items():
+            by_keyword = self._by_keyword.setdefault(control, {})
+            keywords = []
+            for priority, rule in enumerate(table):
+                for keyword in rule.keywords:
+                    by_keyword.setdefault(keyword, []).append(priority)
+                keywords.extend(rule.keywords + rule.exclude)
+            self._matchers[control] = KeywordMatcher(keywords)
+        self._memo = {}
+        self.scans = 0
+        self.memo_hits = 0
+
+    @property
+    def keyword_count(self):
+        return sum(len(matcher.keywords) for matcher in self._matchers.values())
+
+    def _candidates(self, question_text, control):
+        """(priority, excluded) pairs of the rules whose keywords occur in ``question_text``"""
+        memo_key = (control, question_text)
+        candidates = self._memo.get(memo_key)
+        if candidates is not None:
+            self.memo_hits += 1
+            return candidates
+        self.scans += 1
+        found = self._matchers[control].find(question_text)
+        by_keyword = self._by_keyword[control]
+        table = self.rules[control]
+        priorities = sorted({priority for keyword in found for priority in by_keyword.get(keyword, ())})
+        candidates = tuple(
+            (priority, any(keyword in found for keyword in table[priority].exclude)) for priority in priorities
+        )
+        if len(self._memo) >= self.memo_size:
+            self._memo.clear()
+        self._memo[memo_key] = candidates
+        return candidates
+
+    def match(self, question_text, control, eeo=None, options=None):
+        """The rule for ``question_text`` asked with a ``control`` control, or None"""
+        control = CONTROL_ALIASES.get(control, control)
+        table = self.rules.get(control)
+        if not table or not question_text:
+            return None
+        for priority, excluded in self._candidates(question_text, control):
+            rule = table[priority]
+            if excluded:
+                continue
+            if rule.eeo_key and rule.eeo_key not in (eeo or {}):
+                continue
+            if rule.needs_options and not options:
+                continue
+            return rule
+        return None
@@ -0,0 +1,213 @@
+import os
+import json
+import math
+import random
+import hashlib
+import argparse
+from datetime import datetime
+
+from geo_cache import normalize_location
+from persistence import atomic_write_json
+
+# Seconds of pseudo-history at the average rate blended into every search, so
+# one lucky or unlucky page does not decide a search's rank
+PRIOR_SECONDS = 300
+
+
+def filters_signature(base_search_url):
+    """Short hash of the search filters, so changing filters starts fresh statistics"""
+    return hashlib.sha1((base_search_url or '').encode('utf-8')).hexdigest()[:10]
+
+
+def search_key(position, location, filters=''):
+    return ' | '.join([(position or '').strip().casefold(), normalize_location(location), filters])
+
+
+class SearchStats:
+    """Yield of one (position, location, filters) search accumulated over runs"""
+
+    def __init__(self, position, location, runs=0, pages=0, new_jobs=0, applied=0, seconds=0.0,
+                 zero_depth=None, last_run=None):
+        self.position = position
+        self.location = location
+        self.runs = runs
+        self.pages = pages
+        self.new_jobs = new_jobs  # tiles that passed the filters and were opened
+        self.applied = applied
+        self.seconds = seconds
+        self.zero_depth = zero_depth  # average number of pages walked before yield dropped to zero
+        self.last_run = last_run
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data.get(name) for name in (
+            'position', 'location', 'runs', 'pages', 'new_jobs', 'applied', 'seconds', 'zero_depth', 'last_run'
+        ) if data.get(name) is not None})
+
+    def as_dict(self):
+        return dict(vars(self))
+
+    def applies_per_hour(self, prior_rate=0.0):
+        """Applications per hour, smoothed towards ``prior_rate`` (per second)"""
+        return (self.applied + prior_rate * PRIOR_SECONDS) / (self.seconds + PRIOR_SECONDS) * 3600
+
+    def apply_rate(self):
+        return self.applied / self.new_jobs if self.new_jobs else 0.0
+
+    def new_jobs_per_page(self):
+        return self.new_jobs / self.pages if self.pages else 0.0
+
+
+class SearchPlanner:
+    """Orders searches and sets their page budgets from historical yield.
+
+    Searches with history run in order of expected applications per hour and
+    stop one page past the depth where their yield used to drop to zero. A
+    fraction ``exploration`` of each plan (at least one search) is drawn at
+    random, preferring the least sampled searches, so cold searches still get
+    tried; explored searches without history get ``explore_pages`` pages and
+    explored searches with history walk uncapped (up to ``max_pages``), so a
+    budget learned too small gets measured again. A walk stopped by its budget
+    while pages still had new jobs raises the search's zero depth past that
+    budget, so budgets can grow as well as shrink.
+    When nothing has history yet the plan is a plain shuffle without budgets.
+    """
+
+    def __init__(self, path, filters='', exploration=0.2, explore_pages=2, max_pages=None, writer=None, rng=None):
+        self.path = path
+        self.filters = filters
+        self.exploration = exploration
+        self.explore_pages = explore_pages
+        self.max_pages = max_pages
+        self.writer = writer
+        self.rng = rng or random.Random()
+        self._stats = {}  # search key -> SearchStats
+        self._active = {}  # search key -> [pages walked, page count when yield first hit zero]
+        self._budgets = {}  # search key -> page budget of the current plan
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for key, data in json.load(f).items():
+                    self._stats[key] = SearchStats.from_dict(data)
+        except Exception as e:
+            print(f"Failed to load search statistics {self.path}: {e}")
+
+    def stats(self, position, location):
+        return self._stats.get(search_key(position, location, self.filters))
+
+    def average_rate(self):
+        seconds = sum(stats.seconds for stats in self._stats.values())
+        applied = sum(stats.applied for stats in self._stats.values())
+        return applied / seconds if seconds else 0.0
+
+    def _budget(self, stats):
+        if stats is None or stats.zero_depth is None:
+            return self.max_pages
+        budget = math.ceil(stats.zero_depth) + 1
+        return min(budget, self.max_pages) if self.max_pages else budget
+
+    def plan(self, searches):
+        """Return [(position, location, page budget or None)] in the order to run them"""
+        searches = list(searches)
+        known = [self.stats(position, location) for position, location in searches]
+        if not any(known):
+            shuffled = [(position, location, self.max_pages) for position, location in searches]
+            self.rng.shuffle(shuffled)
+            return shuffled
+
+        prior_rate = self.average_rate()
+        explore_count = min(len(searches), max(1, round(len(searches) * self.exploration))) if self.exploration else 0
+        # Least sampled first, random among equals
+        by_runs = sorted(range(len(searches)),
+                         key=lambda i: ((known[i].runs if known[i] else 0), self.rng.random()))
+        explore = set(by_runs[:explore_count])
+
+        exploit = sorted((i for i in range(len(searches)) if i not in explore),
+                         key=lambda i: (-(known[i] or SearchStats('', '')).applies_per_hour(prior_rate),
+                                        known[i].runs if known[i] else 0))
+        plan = [(searches[i][0], searches[i][1], self._budget(known[i])) for i in exploit]
+        for i in explore:
+            budget = self.max_pages if known[i] else self.explore_pages
+            plan.insert(self.rng.randint(0, len(plan)), (searches[i][0], searches[i][1], budget))
+        self._budgets = {search_key(position, location, self.filters): budget for position, location, budget in plan}
+        return plan
+
+    def describe(self, plan):
+        prior_rate = self.average_rate()
+        lines = [f"{'#':>3} {'applies/h':>9} {'new/page':>8} {'budget':>6}  search"]
+        for number, (position, location, budget) in enumerate(plan, 1):
+            stats = self.stats(position, location)
+            rate = f"{stats.applies_per_hour(prior_rate):.1f}" if stats else 'cold'
+            per_page = f"{stats.new_jobs_per_page():.1f}" if stats else '-'
+            lines.append(f"{number:>3} {rate:>9} {per_page:>8} {budget or '-':>6}  {position} @ {location}")
+        return "\n".join(lines)
+
+    def record_page(self, position, location, new_jobs, applied, seconds):
+        """Add one results page of a search that is being walked"""
+        key = search_key(position, location, self.filters)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = SearchStats(position, location)
+        stats.pages += 1
+        stats.new_jobs += new_jobs
+        stats.applied += applied
+        stats.seconds += seconds
+        active = self._active.setdefault(key, [0, None])
+        active[0] += 1
+        if new_jobs == 0 and active[1] is None:
+            active[1] = active[0]
+        self._dirty = True
+
+    def finish(self, position, location):
+        """Close the statistics of a search once its page walk ended"""
+        key = search_key(position, location, self.filters)
+        active = self._active.pop(key, None)
+        budget = self._budgets.pop(key, None)
+        stats = self._stats.get(key)
+        if active is None or stats is None:
+            return
+        stats.runs += 1
+        stats.last_run = datetime.now().isoformat()
+        if active[1] is not None:
+            depth = active[1] - 1  # productive pages before the first empty one
+            stats.zero_depth = depth if stats.zero_depth is None else (stats.zero_depth + depth) / 2
+        elif budget is not None and active[0] >= budget:
+            # Still finding jobs when the budget ran out: the yield reaches deeper than the budget
+            stats.zero_depth = max(stats.zero_depth or 0, budget + 1)
+        self._dirty = True
+        self.flush()
+
+    def flush(self):
+        if not self._dirty or not self.path:
+            return False
+        snapshot = {key: stats.as_dict() for key, stats in self._stats.items()}
+        if self.writer:
+            self.writer.write_json(self.path, snapshot, indent=2)
+        else:
+            atomic_write_json(self.path, snapshot, indent=2)
+        self._dirty = False
+        return True
+
+    def ranked(self):
+        prior_rate = self.average_rate()
+        return sorted(self._stats.values(), key=lambda stats: -stats.applies_per_hour(prior_rate))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Show per-search yield statistics collected across runs")
+    parser.add_argument('stats', nargs='?', default='search_stats.json')
+    args = parser.parse_args()
+
+    planner = SearchPlanner(args.stats)
+    prior_rate = planner.average_rate()
+    print(f"{'applies/h':>9} {'apply %':>7} {'new/page':>8} {'pages':>6} {'runs':>5} {'0-depth':>7}  search")
+    for stats in planner.ranked():
+        depth = '-' if stats.zero_depth is None else f"{stats.zero_depth:.1f}"
+        print(f"{stats.applies_per_hour(prior_rate):>9.1f} {stats.apply_rate() * 100:>6.0f}% "
+              f"{stats.new_jobs_per_page():>8.1f} {stats.pages:>6} {stats.runs:>5} {depth:>7}  "
+              f"{stats.position} @ {stats.location}")
@@ -0,0 +1,109 @@
+import os
+import sys
+import bisect
+import heapq
+from array import array
+
+from job_ids import clean_job_link, extract_job_id
+from persistence import atomic_write
+
+_FILE_MAGIC = b'EABSEEN1'
+
+
+class SeenJobs:
+    """Jobs already evaluated, keyed by numeric LinkedIn job ID.
+
+    The same posting reached from different searches carries different query
+    strings, so links are reduced to their job ID before being stored. Links
+    without a recognisable ID fall back to their cleaned URL.
+
+    When ``path`` is given, IDs seen in earlier runs are loaded from a sorted
+    array of unsigned 64-bit integers (8 bytes per job) and checked with a
+    binary search; ``save`` merges the IDs seen in this run back into it.
+    """
+
+    def __init__(self, path=None, writer=None):
+        self.path = path
+        self.writer = writer
+        self._job_ids = set()
+        self._links = set()
+        self._previous_ids = array('Q')
+        if path:
+            self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                if f.read(len(_FILE_MAGIC)) != _FILE_MAGIC:
+                    print(f"Ignoring {self.path}: not a seen jobs file")
+                    return
+                data = f.read()
+            ids = array('Q')
+            ids.frombytes(data[:len(data) - len(data) % ids.itemsize])
+            self._previous_ids = ids
+        except Exception as e:
+            print(f"Failed to load seen jobs from {self.path}: {e}")
+            self._previous_ids = array('Q')
+
+    @staticmethod
+    def _key(link):
+        job_id = extract_job_id(link)
+        return job_id if job_id is not None else clean_job_link(link)
+
+    def add(self, link):
+        if not link:
+            return
+        key = self._key(link)
+        if isinstance(key, int):
+            self._job_ids.add(key)
+        else:
+            self._links.add(key)
+
+    def seen_this_session(self, link):
+        if not link:
+            return False
+        key = self._key(link)
+        return key in self._job_ids if isinstance(key, int) else key in self._links
+
+    def _in_previous_ids(self, job_id):
+        index = bisect.bisect_left(self._previous_ids, job_id)
+        return index < len(self._previous_ids) and self._previous_ids[index] == job_id
+
+    def seen_in_previous_run(self, link):
+        job_id = extract_job_id(link) if link else None
+        return job_id is not None and self._in_previous_ids(job_id)
+
+    def __contains__(self, link):
+        return self.seen_this_session(link) or self.seen_in_previous_run(link)
+
+    def __len__(self):
+        """Number of jobs seen in this session"""
+        return len(self._job_ids) + len(self._links)
+
+    @property
+    def previous_run_count(self):
+        return len(self._previous_ids)
+
+    def memory_usage(self):
+        """Approximate bytes held by the seen-jobs structures"""
+        total = sys.getsizeof(self._job_ids) + sys.getsizeof(self._links) + sys.getsizeof(self._previous_ids)
+        total += sum(sys.getsizeof(job_id) for job_id in self._job_ids)
+        total += sum(sys.getsizeof(link) for link in self._links)
+        return total
+
+    def save(self):
+        """Merge this session's job IDs into the sorted array on disk"""
+        if not self.path:
+            return
+        new_ids = sorted(job_id for job_id in self._job_ids if not self._in_previous_ids(job_id))
+        if not new_ids:
+            return
+        merged = array('Q', heapq.merge(self._previous_ids, new_ids))
+        data = _FILE_MAGIC + merged.tobytes()
+        if self.writer:
+            self.writer.write_bytes(self.path, data)
+        else:
+            atomic_write(self.path, data)
+        self._previous_ids = merged
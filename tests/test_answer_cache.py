@@ -0,0 +1,69 @@
+from answer_cache import AnswerCache, answer_key
+
+DAY = 86400
+
+
+def test_key_covers_question_type_options_and_context():
+    key = answer_key('Years of  Python?', 'numeric', [(0, 'Yes'), (1, 'No')], 'resume')
+    assert key == answer_key('years of python?', 'numeric', ['YES', 'no'], 'resume')
+    assert key != answer_key('years of python?', 'text', ['yes', 'no'], 'resume')
+    assert key != answer_key('years of python?', 'numeric', ['yes'], 'resume')
+    assert key != answer_key('years of python?', 'numeric', ['yes', 'no'], 'edited resume')
+
+
+def test_hits_misses_and_saved_time(tmp_path):
+    cache = AnswerCache(str(tmp_path / 'answers.db'))
+    assert cache.get('Years of Python?', 'numeric', context='resume') is None
+    cache.put('Years of Python?', 'numeric', 5, context='resume', latency=2.5)
+    assert cache.get('years of python?', 'numeric', context='resume') == 5
+    assert cache.get('years of python?', 'numeric', context='other resume') is None
+    cache.put('Ignored?', 'text', None)
+    assert (cache.hits, cache.misses, cache.seconds_saved) == (1, 2, 2.5)
+    assert cache.stats() == (1, 0)
+    cache.close()
+
+
+def test_entries_expire_after_the_ttl(tmp_path):
+    cache = AnswerCache(str(tmp_path / 'answers.db'), ttl_days=30)
+    cache.put('Old question?', 'text', 'old', now=1000)
+    cache.put('New question?', 'text', 'new', now=1000 + 20 * DAY)
+    assert cache.get('Old question?', 'text', now=1000 + 29 * DAY) == 'old'
+    assert cache.get('Old question?', 'text', now=1000 + 31 * DAY) is None
+    assert cache.purge(now=1000 + 31 * DAY) == 1
+    assert cache.get('New question?', 'text', now=1000 + 31 * DAY) == 'new'
+    cache.close()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = AnswerCache(str(tmp_path / 'answers.db'), max_entries=2)
+    cache.put('First?', 'text', 1, now=100)
+    cache.put('Second?', 'text', 2, now=200)
+    assert cache.get('First?', 'text', now=300) == 1
+    cache.put('Third?', 'text', 3, now=400)
+    assert cache.get('Second?', 'text', now=500) is None
+    assert cache.get('First?', 'text', now=500) == 1
+    assert cache.get('Third?', 'text', now=500) == 3
+    cache.close()
+
+
+def test_pinned_entries_are_kept_and_not_overwritten(tmp_path):
+    cache = AnswerCache(str(tmp_path / 'answers.db'), ttl_days=1, max_entries=1)
+    cache.put('Salary?', 'numeric', 50000, now=100)
+    key = answer_key('Salary?', 'numeric')
+    assert cache.pin(key[:8], answer=90000) == key
+    cache.put('Salary?', 'numeric', 40000, now=200)
+    cache.put('Other?', 'text', 'x', now=300)
+    cache.put('Another?', 'text', 'y', now=400)
+    assert cache.purge(now=100 + 10 * DAY) == 1
+    assert cache.get('Salary?', 'numeric', now=100 + 10 * DAY) == 90000
+    assert cache.stats() == (1, 1)
+    cache.close()
+
+
+def test_shared_between_connections(tmp_path):
+    path = str(tmp_path / 'answers.db')
+    first, second = AnswerCache(path), AnswerCache(path)
+    first.put('Notice period?', 'text', '2 weeks')
+    assert second.get('Notice period?', 'text') == '2 weeks'
+    first.close()
+    second.close()
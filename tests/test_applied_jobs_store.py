@@ -0,0 +1,57 @@
+import json
+
+import pytest
+
+from applied_jobs_store import (AppliedJobsStore, JsonAppliedJobsStore, MemoryAppliedJobsStore,
+                                SqliteAppliedJobsStore, open_applied_jobs_store)
+from job_ids import clean_job_link, extract_job_id
+
+
+@pytest.mark.parametrize('link, job_id', [
+    ('https://www.linkedin.com/jobs/view/3912345678/?refId=abc', 3912345678),
+    ('https://www.linkedin.com/jobs/view/senior-engineer-at-acme-3912345678', 3912345678),
+    ('https://www.linkedin.com/jobs/search/?keywords=x&currentJobId=3912345678', 3912345678),
+    ('https://www.linkedin.com/company/acme/', None),
+    ('', None),
+])
+def test_extract_job_id(link, job_id):
+    assert extract_job_id(link) == job_id
+
+
+def test_clean_job_link_drops_query():
+    assert clean_job_link('https://www.linkedin.com/jobs/view/3912345678/?refId=abc') == \
+        'https://www.linkedin.com/jobs/view/3912345678/'
+
+
+def test_store_interface_is_abstract():
+    with pytest.raises(TypeError):
+        AppliedJobsStore()
+
+
+def test_memory_store_resolves_by_job_id():
+    store = MemoryAppliedJobsStore()
+    store.add('https://www.linkedin.com/jobs/view/3912345678/?refId=abc', '2026-01-01T00:00:00')
+    assert store.get('https://www.linkedin.com/jobs/view/senior-engineer-at-acme-3912345678') == '2026-01-01T00:00:00'
+    assert 'https://www.linkedin.com/jobs/view/1111111111/' not in store
+    assert len(store) == 1
+
+
+def test_json_store_reads_legacy_formats_and_persists(tmp_path):
+    path = tmp_path / 'applied_jobs.json'
+    path.write_text(json.dumps({'https://www.linkedin.com/jobs/view/3912345678/': '2026-01-01T00:00:00'}))
+    store = JsonAppliedJobsStore(str(path))
+    store.add('https://www.linkedin.com/jobs/view/4000000001/', '2026-02-01T00:00:00')
+    saved = json.loads(path.read_text())
+    assert {item['url'] for item in saved} == {
+        'https://www.linkedin.com/jobs/view/3912345678/', 'https://www.linkedin.com/jobs/view/4000000001/'}
+
+
+def test_sqlite_store_imports_legacy_json(tmp_path):
+    json_path = tmp_path / 'applied_jobs.json'
+    json_path.write_text(json.dumps(['https://www.linkedin.com/jobs/view/3912345678/']))
+    store = open_applied_jobs_store(str(json_path), 'sqlite')
+    assert isinstance(store, SqliteAppliedJobsStore)
+    assert store.get('https://www.linkedin.com/jobs/search/?currentJobId=3912345678') is not None
+    store.add('https://www.linkedin.com/jobs/view/4000000001/?trk=x', '2026-02-01T00:00:00')
+    assert len(store) == 2
+    store.close()
@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+
+from candidate_registry import CandidateRegistry
+from job_filters import JobPrefilter
+from seen_jobs import SeenJobs
+
+VIEW = 'https://www.linkedin.com/jobs/view/{}/'
+
+
+def tile(index, job_id, company='Acme', title='Python Developer'):
+    return SimpleNamespace(index=index, job_id=job_id, link=VIEW.format(job_id), company=company,
+                           title=title, poster='')
+
+
+def prefilter(seen, candidates, companies=(), applied=()):
+    return JobPrefilter([], [], lambda company: company in companies, lambda company: False,
+                        seen, lambda link: link in applied, candidates=candidates)
+
+
+def process_page(registry, seen, jobs, tiles, search):
+    """What apply_jobs does with a page, minus the browser: returns the job IDs it would click.
+
+    Only skipped tiles go into SeenJobs; opened ones (applied, failed, not Easy Apply) are only
+    marked evaluated.
+    """
+    registry.register_page(tiles, search)
+    skipped = jobs.filter_page(tiles)
+    opened = []
+    for job in tiles:
+        registry.mark_evaluated(job, search)
+        if job.index in skipped:
+            seen.add(job.link)
+        else:
+            opened.append(job.job_id)
+    return opened
+
+
+def test_overlapping_searches_are_counted():
+    registry = CandidateRegistry()
+    registry.register_page([tile(0, 1), tile(1, 2)], 'python @ United States')
+    registry.register_page([tile(0, 2), tile(1, 3)], 'python @ New York')
+    assert registry.surfaced == 4
+    assert registry.duplicates == 1
+    assert registry.overlaps == {('python @ United States', 'python @ New York'): 1}
+
+
+def test_opened_postings_are_not_opened_again_by_a_later_search():
+    registry, seen = CandidateRegistry(), SeenJobs()
+    jobs = prefilter(seen, registry)
+    # Job 1 fails to apply and job 2 turns out not to be Easy Apply: neither is added to SeenJobs
+    assert process_page(registry, seen, jobs, [tile(0, 1), tile(1, 2)], 'python @ United States') == [1, 2]
+    assert not seen.seen_this_session(VIEW.format(1))
+
+    later = [tile(0, 2), tile(1, 3), tile(2, 1)]
+    assert process_page(registry, seen, jobs, later, 'python @ New York') == [3]
+    assert registry.evaluated_under(tile(0, 1)) == 'python @ United States'
+    assert registry.loads_avoided == 2
+
+
+def test_avoided_loads_count_only_postings_that_would_have_been_opened():
+    registry, seen = CandidateRegistry(), SeenJobs()
+    jobs = prefilter(seen, registry, companies={'Blocked'}, applied={VIEW.format(3)})
+    process_page(registry, seen, jobs, [tile(0, 1), tile(1, 2, company='Blocked'), tile(2, 3)], 'first')
+
+    later = [tile(0, 1), tile(1, 2, company='Blocked'), tile(2, 3), tile(3, 4)]
+    assert process_page(registry, seen, jobs, later, 'second') == [4]
+    # Job 2 is blacklisted and job 3 already applied to: skipped either way, so no load was avoided
+    assert registry.loads_avoided == 1
+
+
+def test_repeats_within_a_search_are_not_counted_again():
+    registry, seen = CandidateRegistry(), SeenJobs()
+    jobs = prefilter(seen, registry)
+    process_page(registry, seen, jobs, [tile(0, 1)], 'first')
+
+    for _ in range(2):
+        assert process_page(registry, seen, jobs, [tile(0, 1), tile(1, 1)], 'second') == []
+    assert registry.loads_avoided == 1
+
+    # A job listed again on a later page of the search that evaluated it saved nothing
+    assert process_page(registry, seen, jobs, [tile(0, 1)], 'first') == []
+    assert registry.loads_avoided == 1
@@ -0,0 +1,48 @@
+import json
+from datetime import datetime, timedelta
+
+from company_blacklist import CompanyBlacklistIndex
+
+
+def test_lookup_is_case_insensitive_and_static_entries_never_expire(tmp_path):
+    index = CompanyBlacklistIndex(str(tmp_path / 'blacklist.json'), 7, static_companies=['  Acme Corp '])
+    assert index.is_blacklisted('ACME CORP', now=datetime.now() + timedelta(days=365))
+    assert index.is_static('acme corp')
+    assert not index.is_blacklisted('')
+
+
+def test_dated_entries_expire(tmp_path):
+    start = datetime(2026, 1, 1)
+    index = CompanyBlacklistIndex(str(tmp_path / 'blacklist.json'), 7)
+    index.add('Globex', now=start)
+    assert index.is_blacklisted('globex', now=start + timedelta(days=6))
+    assert not index.is_blacklisted('globex', now=start + timedelta(days=8))
+    assert len(index) == 0
+
+
+def test_refreshing_an_entry_ignores_its_stale_expiry(tmp_path):
+    start = datetime(2026, 1, 1)
+    index = CompanyBlacklistIndex(str(tmp_path / 'blacklist.json'), 7)
+    index.add('Globex', now=start)
+    assert index.add('GLOBEX', now=start + timedelta(days=5))
+    assert index.evict_expired(now=start + timedelta(days=8)) == []
+    assert index.get_display_name('globex') == 'Globex'
+
+
+def test_flush_and_load_round_trip(tmp_path):
+    path = tmp_path / 'blacklist.json'
+    index = CompanyBlacklistIndex(str(path), 30)
+    index.add('Initech')
+    assert index.flush()
+    assert not index.flush()
+    loaded = CompanyBlacklistIndex(str(path), 30)
+    loaded.load()
+    assert loaded.is_blacklisted('initech')
+
+
+def test_old_list_format_is_converted(tmp_path):
+    path = tmp_path / 'blacklist.json'
+    path.write_text(json.dumps(['Umbrella', '']))
+    index = CompanyBlacklistIndex(str(path), 30)
+    index.load()
+    assert index.is_blacklisted('umbrella') and len(index) == 1
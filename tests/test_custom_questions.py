@@ -0,0 +1,60 @@
+import os
+
+from custom_questions import CustomQuestionMatcher, normalize_question
+
+
+def test_normalize_question():
+    assert normalize_question('  How many   YEARS\nof Python? ') == 'how many years of python?'
+
+
+def test_longest_entry_wins():
+    matcher = CustomQuestionMatcher({'python': '5', 'years of python experience': '7', 'experience': '3'})
+    assert matcher.lookup('How many years of Python experience do you have?') == ('years of python experience', '7')
+    assert matcher.lookup('Python version?') == ('python', '5')
+    assert matcher.lookup('Salary?') is None
+
+
+def test_entries_of_equal_length_go_by_config_order():
+    matcher = CustomQuestionMatcher({'remote': 'Yes', 'hybrid': 'No'})
+    assert matcher.lookup('Are you open to hybrid or remote work?') == ('remote', 'Yes')
+    matcher = CustomQuestionMatcher({'hybrid': 'No', 'remote': 'Yes'})
+    assert matcher.lookup('Are you open to hybrid or remote work?') == ('hybrid', 'No')
+
+
+def test_gui_quoted_entries_are_unquoted_and_duplicates_dropped():
+    matcher = CustomQuestionMatcher({
+        '"Notice period: weeks"': '"2 weeks"',
+        'Notice  Period: WEEKS': 'ignored',
+        'Blank': None,
+        'Years': 4,
+    })
+    assert len(matcher) == 2
+    assert matcher.lookup('notice period: weeks?') == ('Notice period: weeks', '2 weeks')
+    assert matcher.lookup('years of java') == ('Years', '4')
+
+
+def test_reloads_when_the_config_file_changes(tmp_path):
+    config = tmp_path / 'config.yaml'
+    config.write_text("customQuestions:\n  python: '5'\n", encoding='utf-8')
+    matcher = CustomQuestionMatcher({'python': '5'}, config_path=str(config), check_seconds=0)
+    assert not matcher.reload_if_changed()
+
+    config.write_text("customQuestions:\n  python: '6'\n  java: '2'\n", encoding='utf-8')
+    mtime = os.path.getmtime(config) + 10
+    os.utime(config, (mtime, mtime))
+    assert matcher.lookup('python?') == ('python', '5')
+    assert matcher.reload_if_changed()
+    assert matcher.reloads == 1
+    assert matcher.lookup('python?') == ('python', '6')
+    assert matcher.lookup('java?') == ('java', '2')
+
+
+def test_broken_config_keeps_the_loaded_entries(tmp_path):
+    config = tmp_path / 'config.yaml'
+    config.write_text("customQuestions:\n  python: '5'\n", encoding='utf-8')
+    matcher = CustomQuestionMatcher({'python': '5'}, config_path=str(config), check_seconds=0)
+    config.write_text("customQuestions: [unclosed\n", encoding='utf-8')
+    mtime = os.path.getmtime(config) + 10
+    os.utime(config, (mtime, mtime))
+    assert not matcher.reload_if_changed()
+    assert matcher.lookup('python?') == ('python', '5')
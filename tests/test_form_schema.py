@@ -0,0 +1,77 @@
+import os
+import ast
+import json
+import shutil
+import subprocess
+
+import pytest
+
+FORM_SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'form_schema.py')
+
+# A minimal stand-in for the DOM the script reads: each question answers querySelector for the
+# selectors FORM_SCHEMA_JS uses (the text-control selector is the one listing textarea)
+FAKE_DOM_JS = """
+const Node = {DOCUMENT_POSITION_FOLLOWING: 4};
+const CSS = {escape: value => value};
+const document = {querySelectorAll: () => []};
+const element = (tagName, props) => Object.assign({
+    tagName: tagName, id: '', value: '', innerText: '', required: false, attributes: {},
+    getAttribute(name) { return name in this.attributes ? this.attributes[name] : null; },
+    setAttribute(name, value) { this.attributes[name] = value; },
+    querySelector() { return null; },
+    querySelectorAll() { return []; },
+}, props);
+const question = controls => element('DIV', {
+    querySelector(selector) {
+        return (selector.includes('textarea') ? controls.text : controls[selector]) || null;
+    },
+    querySelectorAll(selector) { return controls[selector + '*'] || []; },
+});
+const form = {querySelectorAll: () => QUESTIONS};
+"""
+
+
+def form_schema_js():
+    with open(FORM_SCHEMA_PATH, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == 'FORM_SCHEMA_JS':
+            return node.value.value
+    raise AssertionError("FORM_SCHEMA_JS not found")
+
+
+def run_schema(questions_js):
+    if shutil.which('node') is None:
+        pytest.skip("node is not installed")
+    script = (FAKE_DOM_JS.replace('QUESTIONS', questions_js)
+              + "const extract = function() {" + form_schema_js() + "};\n"
+              + "console.log(JSON.stringify(extract(form)));\n")
+    result = subprocess.run(['node', '-e', script], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def test_select_with_an_auxiliary_input_is_a_select():
+    [row] = run_schema("""[question({
+        select: element('SELECT', {id: 'sel-1', required: true, selectedIndex: 0,
+                                   options: [element('OPTION', {innerText: 'Select an option'}),
+                                             element('OPTION', {innerText: 'Native'})]}),
+        text: element('INPUT', {id: 'aux-1'}),
+        'label*': [element('LABEL', {innerText: 'English proficiency'})],
+        label: element('LABEL', {innerText: 'English proficiency'}),
+    })]""")
+    assert row['type'] == 'select'
+    assert row['element_id'] == 'sel-1'
+    assert row['options'] == ['Select an option', 'Native']
+    assert row['required'] is True
+    assert row['text'] == 'english proficiency'
+    assert [(fallback['type'], fallback['element_id']) for fallback in row['fallbacks']] == [('text', 'aux-1')]
+
+
+def test_text_and_numeric_inputs():
+    rows = run_schema("""[
+        question({text: element('INPUT', {id: 'single-line-text-1', value: 'Toronto'})}),
+        question({text: element('INPUT', {id: 'numeric-2'})}),
+    ]""")
+    assert [(row['type'], row['value'], row['fallbacks']) for row in rows] == \
+        [('text', 'Toronto', []), ('numeric', '', [])]
+    assert rows[0]['qid'] != rows[1]['qid']
@@ -0,0 +1,30 @@
+from keyword_matcher import KeywordMatcher
+
+
+def test_finds_every_keyword_in_one_scan():
+    matcher = KeywordMatcher(['native', 'native american', 'american', 'race'])
+    assert matcher.find('Do you identify as Native American?') == {'native', 'native american', 'american'}
+    assert matcher.find('What is your RACE?') == {'race'}
+    assert matcher.find('How many years of experience?') == set()
+
+
+def test_overlapping_keywords_starting_at_different_positions():
+    matcher = KeywordMatcher(['commut', 'commute', 'mute', 'on-site'])
+    assert matcher.find('are you willing to commute on-site?') == {'commut', 'commute', 'mute', 'on-site'}
+
+
+def test_keywords_are_casefolded_and_deduplicated():
+    matcher = KeywordMatcher(['CTC', 'ctc', '', 'Straße'])
+    assert matcher.keywords == ['ctc', 'strasse']
+    assert matcher.find('Expected CTC near the STRASSE office') == {'ctc', 'strasse'}
+
+
+def test_regex_characters_are_literal():
+    matcher = KeywordMatcher(['c++', 'c#', '.net'])
+    assert matcher.find('Experience with C++ and .NET?') == {'c++', '.net'}
+    assert matcher.find('experience with cnet') == set()
+
+
+def test_empty_matcher():
+    assert KeywordMatcher([]).find('anything') == set()
+    assert KeywordMatcher(['word']).find('') == set()
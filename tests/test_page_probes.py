@@ -0,0 +1,26 @@
+from page_probes import PageState, VALIDATION_ERROR_MESSAGES, classify
+
+
+def test_validation_messages_are_separate_and_casefolded():
+    assert 'enter a whole number' in VALIDATION_ERROR_MESSAGES
+    assert 'use the format' in VALIDATION_ERROR_MESSAGES
+    assert all(message == message.casefold() for message in VALIDATION_ERROR_MESSAGES)
+
+
+def test_mixed_case_validation_text_is_detected():
+    for text in ('Enter a whole number between 0 and 99', 'Saisissez un numéro valide', 'Use the format 123-456'):
+        assert classify({'text': text}, 'apply').kind == PageState.VALIDATION_ERROR
+
+
+def test_ordinary_form_labels_are_not_errors():
+    for text in ('Numéro de téléphone mobile', 'Preguntas adicionales', '¿Cuántos años de experiencia tienes?',
+                 'Inserisci il tuo indirizzo email'):
+        assert classify({'text': text}, 'apply').kind == PageState.OK
+
+
+def test_inline_errors_and_search_regions():
+    state = classify({'text': '', 'errors': [{'field_id': 'phone', 'message': 'Required'}]}, 'apply')
+    assert state.kind == PageState.VALIDATION_ERROR
+    assert state.error_summary() == 'phone: Required'
+    assert classify({'text': 'Enter a valid phone'}, 'search').kind == PageState.OK
+    assert classify({'text': 'No matching jobs found.'}, 'search').kind == PageState.NO_RESULTS
@@ -0,0 +1,65 @@
+from pagination import (
+    DAILY_LIMIT, END_OF_RESULTS, ERROR, LIST_NOT_FOUND, ONLY_SUGGESTIONS, PAGE_BUDGET, ZERO_YIELD,
+    PaginationController, stop_reason_for,
+)
+
+
+def test_stops_after_consecutive_zero_yield_pages():
+    pagination = PaginationController(max_zero_pages=2)
+    pagination.start()
+    pagination.record_page({'new_jobs': 0})
+    assert pagination.should_stop() is None
+    pagination.record_page({'new_jobs': 3})
+    pagination.record_page({'new_jobs': 0})
+    assert pagination.should_stop() is None
+    pagination.record_page(None)
+    assert pagination.should_stop() == f"2 {ZERO_YIELD}"
+    pagination.end(pagination.should_stop())
+    assert pagination.last_reason == ZERO_YIELD
+    assert pagination.zero_pages == 3
+    # Only a walk to the end of the results advances the incremental checkpoint
+    assert not pagination.completed()
+
+
+def test_stops_at_the_page_budget():
+    pagination = PaginationController(max_zero_pages=0)
+    pagination.start(page_budget=2)
+    pagination.record_page({'new_jobs': 0})
+    assert pagination.should_stop() is None
+    pagination.record_page({'new_jobs': 0})
+    assert pagination.should_stop() == PAGE_BUDGET
+    pagination.end(PAGE_BUDGET)
+    assert not pagination.completed()
+
+
+def test_each_search_is_counted_from_its_own_start():
+    pagination = PaginationController(max_zero_pages=2)
+    pagination.start(page_budget=3)
+    pagination.record_page({'new_jobs': 0})
+    pagination.record_page({'new_jobs': 1})
+    pagination.end(END_OF_RESULTS)
+    assert pagination.completed()
+
+    pagination.start(page_budget=3)
+    assert pagination.last_reason is None
+    pagination.record_page({'new_jobs': 0})
+    assert pagination.should_stop() is None
+    assert pagination.pages == 3
+
+
+def test_only_the_first_stop_reason_counts():
+    pagination = PaginationController()
+    pagination.start()
+    pagination.end(DAILY_LIMIT)
+    pagination.end(ERROR)
+    assert pagination.last_reason == DAILY_LIMIT
+    assert pagination.reasons == {DAILY_LIMIT: 1}
+    assert 'daily limit reached 1' in pagination.summary()
+
+
+def test_exception_messages_map_to_stop_reasons():
+    assert stop_reason_for(Exception("No more jobs on this page.")) == END_OF_RESULTS
+    assert stop_reason_for(Exception("Nothing to do here, moving forward...")) == ONLY_SUGGESTIONS
+    assert stop_reason_for(Exception("Job list UI elements not found, cannot proceed")) == LIST_NOT_FOUND
+    assert stop_reason_for(Exception("Daily limit reached - stopping application process")) == DAILY_LIMIT
+    assert stop_reason_for(Exception("stale element reference")) == ERROR
@@ -0,0 +1,48 @@
+from benchmarks.bench_question_rules import DEFAULT_CORPUS, EEO, OPTIONS, legacy_classify, load_corpus
+from question_rules import QuestionRule, QuestionRuleEngine
+
+
+def name(rule):
+    return rule.name if rule else None
+
+
+def test_first_applicable_rule_wins():
+    engine = QuestionRuleEngine()
+    # 'remote' comes before 'experience' in the radio table; 'legally' before 'sponsor'
+    assert name(engine.match('years of experience working remote?', 'radio')) == 'remote'
+    assert name(engine.match('are you legally able to work without sponsorship?', 'radio')) == 'authorized'
+    assert name(engine.match('first name', 'text')) == 'first_name'
+    assert name(engine.match('preferred name', 'text')) == 'full_name'
+
+
+def test_exclude_eeo_key_and_options_conditions():
+    engine = QuestionRuleEngine()
+    assert name(engine.match('salary expectation given your experience', 'text')) == 'salary'
+    assert engine.match('are you a protected veteran?', 'radio') is None
+    assert name(engine.match('are you a protected veteran?', 'radio', eeo={'veteran': 'No'})) == 'veteran'
+    assert name(engine.match('receive notifications by email?', 'select')) == 'email'
+    assert name(engine.match('receive notifications by email?', 'select', options=OPTIONS)) == 'notifications'
+
+
+def test_control_aliases_and_unknown_controls():
+    engine = QuestionRuleEngine()
+    assert name(engine.match('years of experience with python', 'numeric')) == 'experience_years'
+    assert name(engine.match('english proficiency', 'dropdown')) == 'language'
+    assert engine.match('english proficiency', 'checkbox') is None
+    assert engine.match('', 'text') is None
+
+
+def test_candidates_are_memoized_per_control():
+    engine = QuestionRuleEngine({'text': [QuestionRule('phone', ['phone'], 'personal', 'Mobile Phone Number')]})
+    for _ in range(3):
+        assert name(engine.match('phone number', 'text')) == 'phone'
+    assert (engine.scans, engine.memo_hits) == (1, 2)
+
+
+def test_agrees_with_the_legacy_chains_on_the_question_corpus():
+    engine = QuestionRuleEngine()
+    for control, question_text in load_corpus(DEFAULT_CORPUS):
+        if 'aboriginal' in question_text or 'ctc' in question_text:
+            continue  # the chains' upper-case keywords never matched the lowercased text
+        rule = engine.match(question_text, control, eeo=EEO, options=OPTIONS)
+        assert name(rule) == legacy_classify(control, question_text), (control, question_text)
@@ -0,0 +1,68 @@
+import random
+
+from search_planner import SearchPlanner
+
+SEARCHES = [('Python Developer', 'Toronto'), ('Data Engineer', 'Toronto'), ('Backend Engineer', 'Remote')]
+
+
+def walk(planner, position, location, new_jobs_per_page):
+    for new_jobs in new_jobs_per_page:
+        planner.record_page(position, location, new_jobs, 0, 60)
+    planner.finish(position, location)
+
+
+def planner_with_history(tmp_path, **kwargs):
+    planner = SearchPlanner(str(tmp_path / 'search_stats.json'), rng=random.Random(0), **kwargs)
+    planner.plan(SEARCHES)
+    for position, location in SEARCHES:
+        walk(planner, position, location, [5, 0])
+    return planner
+
+
+def test_cold_plan_is_a_shuffle_with_the_page_cap(tmp_path):
+    planner = SearchPlanner(str(tmp_path / 'search_stats.json'), max_pages=5, rng=random.Random(0))
+    plan = planner.plan(SEARCHES)
+    assert sorted((position, location) for position, location, _ in plan) == sorted(SEARCHES)
+    assert {budget for _, _, budget in plan} == {5}
+
+
+def test_budget_shrinks_to_the_depth_where_yield_ran_out(tmp_path):
+    planner = planner_with_history(tmp_path, exploration=0)
+    assert planner.stats('Python Developer', 'Toronto').zero_depth == 1
+    assert {budget for _, _, budget in planner.plan(SEARCHES)} == {2}
+
+
+def test_budget_grows_when_the_walk_ends_at_its_budget_still_productive(tmp_path):
+    planner = planner_with_history(tmp_path, exploration=0)
+    planner.plan(SEARCHES)
+    walk(planner, 'Python Developer', 'Toronto', [4, 3])
+    stats = planner.stats('Python Developer', 'Toronto')
+    assert stats.zero_depth >= 3
+    budgets = {(position, location): budget for position, location, budget in planner.plan(SEARCHES)}
+    assert budgets[('Python Developer', 'Toronto')] > 2
+    assert budgets[('Data Engineer', 'Toronto')] == 2
+
+
+def test_budget_growth_respects_max_pages(tmp_path):
+    planner = planner_with_history(tmp_path, exploration=0, max_pages=3)
+    for _ in range(3):
+        budget = {(p, l): b for p, l, b in planner.plan(SEARCHES)}[('Python Developer', 'Toronto')]
+        walk(planner, 'Python Developer', 'Toronto', [4] * budget)
+    assert {budget for _, _, budget in planner.plan(SEARCHES)} <= {2, 3}
+
+
+def test_exploration_slots_are_not_held_to_a_learned_budget(tmp_path):
+    planner = planner_with_history(tmp_path, exploration=0.5, explore_pages=2, max_pages=10)
+    plan = planner.plan(SEARCHES + [('Platform Engineer', 'Remote')])
+    budgets = {(position, location): budget for position, location, budget in plan}
+    assert len(plan) == 4
+    # Two slots are explored: the cold search gets explore_pages, the known one walks up to max_pages
+    assert budgets[('Platform Engineer', 'Remote')] == 2
+    assert sorted(budgets.values()) == [2, 2, 2, 10]
+
+
+def test_statistics_survive_a_restart(tmp_path):
+    planner = planner_with_history(tmp_path)
+    restarted = SearchPlanner(planner.path)
+    stats = restarted.stats('Backend Engineer', 'Remote')
+    assert (stats.runs, stats.pages, stats.new_jobs, stats.zero_depth) == (1, 2, 5, 1)
@@ -0,0 +1,38 @@
+from seen_jobs import SeenJobs
+
+VIEW = 'https://www.linkedin.com/jobs/view/{}/?refId=x'
+
+
+def test_links_are_keyed_by_job_id():
+    seen = SeenJobs()
+    seen.add(VIEW.format(3912345678))
+    assert seen.seen_this_session('https://www.linkedin.com/jobs/search/?currentJobId=3912345678')
+    seen.add('https://example.com/careers/123?utm=1')
+    assert 'https://example.com/careers/123' in seen
+    assert len(seen) == 2
+
+
+def test_id_array_round_trip(tmp_path):
+    path = str(tmp_path / 'seen_jobs.bin')
+    first = SeenJobs(path)
+    for job_id in (4000000003, 4000000001, 4000000002):
+        first.add(VIEW.format(job_id))
+    first.save()
+
+    second = SeenJobs(path)
+    assert second.previous_run_count == 3
+    assert second.seen_in_previous_run(VIEW.format(4000000002))
+    assert not second.seen_in_previous_run(VIEW.format(4000000004))
+    assert not second.seen_this_session(VIEW.format(4000000002))
+
+    second.add(VIEW.format(4000000000))
+    second.add(VIEW.format(4000000002))
+    second.save()
+    third = SeenJobs(path)
+    assert list(third._previous_ids) == [4000000000, 4000000001, 4000000002, 4000000003]
+
+
+def test_foreign_file_is_ignored(tmp_path):
+    path = tmp_path / 'seen_jobs.bin'
+    path.write_bytes(b'not a seen jobs file')
+    assert SeenJobs(str(path)).previous_run_count == 0
@@ -0,0 +1,161 @@
+import time
+import random
+
+# Readiness conditions. Each is evaluated with one execute_script call and
+# returns a truthy value once the page is ready for the next action.
+
+# The details pane shows the clicked job (arguments[0] is its job ID, or '' for any job)
+JOB_DETAILS_READY = """
+const jobId = arguments[0];
+const pane = document.querySelector('#job-details');
+if (!pane || !(pane.innerText || '').trim()) return false;
+if (!jobId) return true;
+const titleLinks = document.querySelectorAll(
+    '.job-details-jobs-unified-top-card__job-title a, .jobs-unified-top-card__job-title a, .jobs-details a[href*="/jobs/view/"]');
+if (!titleLinks.length) return location.href.includes(jobId);
+return Array.from(titleLinks).some(link => (link.getAttribute('href') || '').includes(jobId));
+"""
+
+# The Easy Apply modal (or the daily limit dialog) is open
+MODAL_OPEN = """
+return !!document.querySelector('.jobs-easy-apply-modal, .artdeco-modal');
+"""
+
+# Identifies the current Easy Apply step: progress, heading and question labels
+_MODAL_SIGNATURE_FUNCTION = """
+const modalSignature = () => {
+    const modal = document.querySelector('.jobs-easy-apply-modal');
+    if (!modal) return 'closed';
+    const progress = modal.querySelector('progress, [role="progressbar"]');
+    const heading = modal.querySelector('h3');
+    const labels = Array.from(modal.querySelectorAll('label')).slice(0, 5).map(label => label.innerText).join('|');
+    return [progress ? (progress.value || progress.getAttribute('aria-valuenow')) : '',
+            heading ? heading.innerText : '', labels].join('#');
+};
+"""
+
+MODAL_SIGNATURE = _MODAL_SIGNATURE_FUNCTION + "return modalSignature();"
+
+# The step after a Next/Submit click has rendered, the click produced
+# validation errors, or the modal went away (arguments[0] is the old signature)
+MODAL_STEP_CHANGED = _MODAL_SIGNATURE_FUNCTION + """
+if (document.querySelector('.jobs-easy-apply-modal .artdeco-inline-feedback--error')) return true;
+return modalSignature() !== arguments[0];
+"""
+
+# No upload in the Easy Apply modal is still in progress
+UPLOAD_FINISHED = """
+const modal = document.querySelector('.jobs-easy-apply-modal');
+if (!modal) return true;
+return !modal.querySelector('.artdeco-loader, [class*="upload"] [role="progressbar"], [class*="uploading"]');
+"""
+
+# The post-apply dialog or toast that the bot closes has appeared
+POST_APPLY_READY = """
+return !!document.querySelector('.artdeco-toast-item, .artdeco-modal__dismiss, button[data-control-name="save_application_btn"]');
+"""
+
+# The confirm dialog shown when discarding an application is open
+CONFIRM_DIALOG_OPEN = """
+return !!document.querySelector('.artdeco-modal__confirm-dialog-btn');
+"""
+
+# No modal is open any more
+MODAL_CLOSED = """
+return !document.querySelector('.jobs-easy-apply-modal, .artdeco-modal');
+"""
+
+# A typeahead (location or city field) is showing suggestions
+TYPEAHEAD_READY = """
+return !!document.querySelector('[role="listbox"] [role="option"], .basic-typeahead__selectable, .search-typeahead-v2__hit');
+"""
+
+# The search results URL carries a geoId
+URL_HAS_GEO_ID = """
+return location.href.includes('geoId=');
+"""
+
+
+class WaitStats:
+    """Actual vs. budgeted wait time for one call site"""
+
+    def __init__(self):
+        self.calls = 0
+        self.waited = 0.0
+        self.budget = 0.0
+        self.timeouts = 0
+
+    def add(self, waited, budget, timed_out):
+        self.calls += 1
+        self.waited += waited
+        self.budget += budget
+        if timed_out:
+            self.timeouts += 1
+
+
+class AdaptiveWaiter:
+    """Waits on page readiness instead of fixed random sleeps.
+
+    ``wait`` polls a readiness condition (a script from this module or a
+    callable) and returns as soon as it holds, but never earlier than a random
+    ``jitter`` floor so actions keep a human-like pace. ``budget`` is the
+    (min, max) range of the fixed sleep the call site used to make; it bounds
+    the default timeout and is recorded next to the time actually waited.
+    ``idle``, if set, is called between polls so other work that needs the
+    driver (such as reading a prefetched job) can use the waiting time.
+    """
+
+    def __init__(self, browser, jitter=(0.5, 1.0), poll_interval=0.1):
+        self.browser = browser
+        self.jitter = tuple(jitter)
+        self.poll_interval = poll_interval
+        self.stats = {}  # call site -> WaitStats
+        self.idle = None
+
+    def _check(self, condition, args):
+        try:
+            if callable(condition):
+                return bool(condition())
+            return bool(self.browser.execute_script(condition, *args))
+        except Exception:
+            return False
+
+    def wait(self, site, condition=None, budget=(0, 0), timeout=None, args=()):
+        """Wait for ``condition`` at call site ``site``; returns False if it timed out"""
+        budgeted = random.uniform(*budget)
+        floor = random.uniform(*self.jitter)
+        start = time.monotonic()
+        ready = True
+        if condition is not None:
+            deadline = start + (timeout if timeout is not None else max(budget[1] * 2, 3))
+            ready = self._check(condition, args)
+            while not ready and time.monotonic() < deadline:
+                if self.idle is not None:
+                    try:
+                        self.idle()
+                    except Exception:
+                        pass  # the idle hook is best-effort work; it must not end the wait
+                time.sleep(self.poll_interval)
+                ready = self._check(condition, args)
+        remaining = floor - (time.monotonic() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+        self.stats.setdefault(site, WaitStats()).add(time.monotonic() - start, budgeted, not ready)
+        return ready
+
+    def signature(self):
+        """Current Easy Apply step signature, for MODAL_STEP_CHANGED"""
+        try:
+            return self.browser.execute_script(MODAL_SIGNATURE)
+        except Exception:
+            return ''
+
+    def summary(self):
+        lines = [f"{'wait site':<20} {'calls':>6} {'waited (s)':>11} {'budget (s)':>11} {'timeouts':>9}"]
+        total_waited = total_budget = 0.0
+        for site, stats in sorted(self.stats.items(), key=lambda item: -item[1].budget):
+            lines.append(f"{site:<20} {stats.calls:>6} {stats.waited:>11.1f} {stats.budget:>11.1f} {stats.timeouts:>9}")
+            total_waited += stats.waited
+            total_budget += stats.budget
+        lines.append(f"Waited {total_waited:.0f}s against {total_budget:.0f}s of fixed sleeps")
+        return "\n".join(lines)